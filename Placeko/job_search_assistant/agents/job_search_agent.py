@@ -3,6 +3,7 @@ from langchain.llms import OpenAI
 from langchain_openai import ChatOpenAI
 from utils.job_scraper import JobScraper
 from utils.serp_api_searcher import SerpApiSearcher
+from utils.search_orchestrator import search_platforms
 from config import OPENAI_API_KEY, LLM_MODEL, JOB_PLATFORMS
 
 class JobSearchAgent:
@@ -33,17 +34,12 @@ class JobSearchAgent:
             platforms = JOB_PLATFORMS
             
         # Try the SerpAPI approach first (this will have real links)
-        api_jobs = []
-        
-        for platform in platforms:
-            # Use SerpAPI to search for real jobs
-            platform_jobs = self.serp_api_searcher.search_jobs(
-                keywords, 
-                location, 
-                platform=platform, 
-                count=count
-            )
-            api_jobs.extend(platform_jobs)
+        api_jobs = self.serp_api_searcher.search_all_platforms(
+            keywords,
+            location,
+            platforms,
+            count=count
+        )["jobs"]
         
         # If we got results from SerpAPI, use those
         if api_jobs:
@@ -51,17 +47,15 @@ class JobSearchAgent:
             
         # Fallback to the scraper if SerpAPI fails
         print("SerpAPI search returned no results. Falling back to scraper.")
-        all_jobs = []
-        for platform in platforms:
-            platform_jobs = self.job_scraper.search_jobs(
-                keywords, 
-                location, 
-                platform=platform, 
+        return search_platforms(
+            lambda platform: self.job_scraper.search_jobs(
+                keywords,
+                location,
+                platform=platform,
                 count=count
-            )
-            all_jobs.extend(platform_jobs)
-        
-        return all_jobs
+            ),
+            platforms
+        )["jobs"]
     
     def get_job_match_analysis(self, resume_data, job_data):
         """
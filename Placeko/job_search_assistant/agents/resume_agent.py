@@ -1,6 +1,9 @@
 
 from langchain_openai import ChatOpenAI
-from config import OPENAI_API_KEY, LLM_MODEL
+import json
+from config import OPENAI_API_KEY, LLM_MODEL, ANALYSIS_CACHE_DIR
+from utils.disk_cache import DiskCache, content_hash
+from utils.timing import span
 
 
 class ResumeAgent:
@@ -9,6 +12,8 @@ class ResumeAgent:
     def __init__(self):
         self.api_key = OPENAI_API_KEY
         self.model = LLM_MODEL
+        # LLM analyses keyed by the resume content they were written for
+        self.cache = DiskCache(ANALYSIS_CACHE_DIR, max_bytes=20 * 1024 * 1024)
 
     def analyze_resume(self, resume_data):
         """Analyze a resume and provide improvement suggestions."""
@@ -17,7 +22,15 @@ class ResumeAgent:
         experience = resume_data.get("experience", [])
 
         if not self.api_key:
-            return self._generate_basic_analysis(resume_data)
+            with span("resume_analysis_basic"):
+                return self._generate_basic_analysis(resume_data)
+
+        # Re-uploads that leave skills, education and experience unchanged reuse the analysis
+        content = json.dumps([sorted(skills), education, experience], ensure_ascii=False)
+        cache_key = content_hash(content, self.model)
+        cached_analysis = self.cache.get(cache_key)
+        if cached_analysis is not None:
+            return cached_analysis
 
         try:
             client = ChatOpenAI(
@@ -43,8 +56,11 @@ class ResumeAgent:
             (same structured analysis sections as before)
             """
 
-            response = client.invoke(prompt)
-            return response.content.strip()
+            with span("resume_analysis_llm"):
+                response = client.invoke(prompt)
+            analysis = response.content.strip()
+            self.cache.set(cache_key, analysis)
+            return analysis
 
         except Exception as e:
             print(f"Error in resume analysis: {e}")
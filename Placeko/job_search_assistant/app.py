@@ -3,9 +3,6 @@ import streamlit as st
 import pandas as pd
 import os
 import json
-import tempfile
-import PyPDF2
-import  docx
 from datetime import datetime, timedelta
 
 # Create directories if they don't exist
@@ -21,9 +18,17 @@ from ui_utils import (
     display_extracted_information,
     format_job_description,
     display_matching_skills,
+    display_timing_breakdown,
     apply_styling
 )
 
+# Import document text extraction
+from utils.document_extractor import extract_document
+from utils.resume_parser import resume_owner_key
+
+# Import per-stage timing instrumentation
+from utils.timing import trace, span
+
 # Import job storage functions
 from utils.job_storage import (
     save_job_to_local,
@@ -32,7 +37,7 @@ from utils.job_storage import (
 )
 
 # Import configuration
-from config import COLORS, JOB_PLATFORMS
+from config import COLORS, JOB_PLATFORMS, PDF_MAX_PAGES
 
 # Set page configuration with professional appearance
 st.set_page_config(
@@ -58,6 +63,8 @@ def load_resources():
     from agents.interview_agent import InterviewAgent
     
     resume_parser = ResumeParser()
+    # Load the spaCy model in the background so the UI renders immediately
+    resume_parser.warm_up()
     resume_agent = ResumeAgent()
     job_search_agent = JobSearchAgent()
     interview_agent = InterviewAgent()
@@ -76,6 +83,13 @@ def load_resources():
 # Load resources
 resources = load_resources()
 
+def show_search_problems(search_result):
+    """Report platforms that failed or missed the deadline in a concurrent job search."""
+    for platform, error in search_result["errors"].items():
+        st.error(f"Error searching jobs on {platform}: {error}")
+    if search_result["timed_out"]:
+        st.warning(f"Skipped {', '.join(search_result['timed_out'])}: no response before the search deadline.")
+
 # Website-style header/navbar
 st.markdown(f"""
 <div style='
@@ -193,52 +207,43 @@ with tabs[0]:
                     # Load resume parser
                     resume_parser = resources["resume_parser"]
                     
-                    # Save uploaded file to a temporary location
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{resume_file.name.split('.')[-1]}") as temp_file:
-                        temp_file.write(resume_file.getbuffer())
-                        temp_path = temp_file.name
-                    
-                    # Read the file content
                     try:
-                        # For PDF files
-                        if temp_path.endswith('.pdf'):
-                            with open(temp_path, 'rb') as f:
-                                pdf_reader = PyPDF2.PdfReader(f)
-                                extracted_text = ""
-                                for page_num in range(len(pdf_reader.pages)):
-                                    page = pdf_reader.pages[page_num]
-                                    extracted_text += page.extract_text() + "\n"
-                        
-                        # For DOCX files
-                        elif temp_path.endswith('.docx'):
-                            doc = docx.Document(temp_path)
-                            extracted_text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-                        
-                        # For TXT files
-                        else:
-                            with open(temp_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                extracted_text = f.read()
-                        
-                        # Clean up the temporary file
-                        try:
-                            os.unlink(temp_path)
-                        except:
-                            pass
+                        # Time each stage of the upload (logged and shown in the debug expander)
+                        with trace("resume_upload") as upload_trace:
+                            # Extract the text straight from the uploaded file's in-memory buffer
+                            with span("text_extraction"):
+                                extracted = extract_document(resume_file)
+                                extracted_text = extracted["text"]
+                            
+                            # If we got text, parse it
+                            if extracted_text:
+                                # Parse resume and extract info
+                                with span("resume_parsing"):
+                                    # Keyed on the owner's email so edited re-uploads are parsed incrementally
+                                    # (resumes without one are parsed in full)
+                                    resume_data = resume_parser.parse_resume(
+                                        extracted_text,
+                                        user_id=resume_owner_key(extracted_text),
+                                        degraded_stages=extracted["degraded_stages"]
+                                    )
+                                
+                                # Get AI analysis
+                                resume_agent = resources["resume_agent"]
+                                with span("resume_analysis"):
+                                    resume_analysis = resume_agent.analyze_resume(resume_data)
+                        st.session_state.resume_timings = upload_trace.to_dict()
                         
-                        # If we got text, parse it
                         if extracted_text:
-                            # Parse resume and extract info
-                            resume_data = resume_parser.parse_resume(extracted_text)
-                            
-                            # Get AI analysis
-                            resume_agent = resources["resume_agent"]
-                            resume_analysis = resume_agent.analyze_resume(resume_data)
-                            
                             # Store resume data and analysis in session state
                             st.session_state.resume_data = resume_data
                             st.session_state.resume_data["analysis"] = resume_analysis
                             st.session_state.resume_data["raw_text"] = extracted_text
                             
+                            # Parsed resumes are part of the corpus used to rank search keywords
+                            idf_model = resources["keyword_extractor"].idf_model
+                            if idf_model.add_document(extracted_text):
+                                idf_model.save_later()
+                            
                             # Display highly visible success message
                             st.markdown(f"""
                             <div style="background: {COLORS['success']}; color: white; padding: 20px; 
@@ -252,6 +257,15 @@ with tabs[0]:
                                 </p>
                             </div>
                             """, unsafe_allow_html=True)
+
+                            # Let the user know if the parse budget cut anything short
+                            degraded_stages = resume_data.get("degraded_stages", [])
+                            if "truncated_pages" in degraded_stages:
+                                st.warning(f"Your resume has more than {PDF_MAX_PAGES} pages, so only the first {PDF_MAX_PAGES} were analyzed.")
+                            if "truncated_text" in degraded_stages:
+                                st.warning("Your resume is very long, so only its beginning was analyzed.")
+                            if any(stage not in ("truncated_pages", "truncated_text") for stage in degraded_stages):
+                                st.info("Parts of the analysis were skipped to keep processing time reasonable. Re-upload to retry.")
                         else:
                             st.error("Could not extract text from the uploaded file.")
                     except Exception as file_error:
@@ -336,6 +350,11 @@ with tabs[0]:
             </ul>
             </div>
             """, unsafe_allow_html=True)
+        
+        # Show where the time went during the last upload
+        if st.session_state.get("resume_timings"):
+            with st.expander("Debug: Processing Time Breakdown", expanded=False):
+                display_timing_breakdown(st.session_state.resume_timings)
     else:
         # Display a message when no resume is uploaded
         st.markdown(f"""
@@ -453,20 +472,16 @@ with tabs[1]:
                         # Search for jobs
                         with st.spinner(f"Searching for jobs matching your resume profile..."):
                             serp_api_searcher = resources["serp_api_searcher"]
-                            resume_based_jobs = []
                             
-                            # Search on all platforms
-                            for platform in JOB_PLATFORMS:
-                                try:
-                                    platform_jobs = serp_api_searcher.search_jobs(
-                                        resume_based_query,
-                                        default_location,
-                                        platform=platform,
-                                        count=5  # Limit to 5 jobs per platform
-                                    )
-                                    resume_based_jobs.extend(platform_jobs)
-                                except Exception as e:
-                                    st.error(f"Error searching jobs on {platform}: {str(e)}")
+                            # Search on all platforms concurrently
+                            search_result = serp_api_searcher.search_all_platforms(
+                                resume_based_query,
+                                default_location,
+                                JOB_PLATFORMS,
+                                count=5  # Limit to 5 jobs per platform
+                            )
+                            show_search_problems(search_result)
+                            resume_based_jobs = search_result["jobs"]
                             
                             # Update job results
                             st.session_state.job_results = resume_based_jobs
@@ -574,18 +589,15 @@ with tabs[1]:
                 if use_serp_api:
                     # Use SerpAPI to get real job listings
                     serp_api_searcher = resources["serp_api_searcher"]
-                    for platform in selected_platforms:
-                        try:
-                            platform_jobs = serp_api_searcher.search_jobs(
-                                search_query,
-                                location,
-                                platform=platform,
-                                count=job_count,
-                                days_ago=days_ago
-                            )
-                            jobs.extend(platform_jobs)
-                        except Exception as e:
-                            st.error(f"Error searching jobs on {platform}: {str(e)}")
+                    search_result = serp_api_searcher.search_all_platforms(
+                        search_query,
+                        location,
+                        selected_platforms,
+                        count=job_count,
+                        days_ago=days_ago
+                    )
+                    show_search_problems(search_result)
+                    jobs = search_result["jobs"]
                     
                     if not jobs:
                         st.warning("No jobs found via SerpAPI. Falling back to standard search.")
@@ -884,6 +896,9 @@ with tabs[1]:
                             if st.button("Save Job", key="save_job_btn"):
                                 # Save job to local storage
                                 saved_path = save_job_to_local(selected_job)
+                                idf_model = resources["keyword_extractor"].idf_model
+                                if idf_model.add_job(selected_job):
+                                    idf_model.save_later()
                                 st.session_state.saved_jobs = load_saved_jobs()
                                 st.success(f"Job saved successfully")
                                 st.rerun()
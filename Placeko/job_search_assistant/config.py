@@ -11,9 +11,90 @@ SERPAPI_API_KEY = os.getenv("SERPAPI_API_KEY")
 # Model settings
 LLM_MODEL = "gpt-3.5-turbo" 
 
+# spaCy settings - only named entities are used, so the remaining pipes are excluded
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_lg")
+SPACY_EXCLUDED_PIPES = ["parser", "lemmatizer", "tagger", "attribute_ruler"]
+
+# Optional shared NLP service (python -m utils.nlp_service); unset to load spaCy in-process
+NLP_SERVICE_URL = os.getenv("NLP_SERVICE_URL")
+NLP_SERVICE_TIMEOUT_SECONDS = 30
+
+# Parse budget - longer texts are truncated, NER runs in windows well under
+# spaCy's max_length, and optional stages are skipped once the deadline passes
+PARSE_MAX_CHARS = 100000
+NER_CHUNK_CHARS = 20000
+PARSE_TIME_BUDGET_SECONDS = 30
+
+# Embedding backend for resume retrieval: "openai", "local" (offline) or "auto"
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "auto")
+
+# PDF extraction settings - long documents are split across worker processes
+PDF_MAX_PAGES = 50
+PDF_PAGE_TIMEOUT_SECONDS = 10
+PDF_TIMEOUT_SECONDS = 30
+PDF_PARALLEL_MIN_PAGES = 8
+PDF_PAGES_PER_TASK = 4
+
+# Per-stage timings of resume uploads are appended here as JSON lines
+TIMING_LOG_PATH = os.path.join("logs", "timings.jsonl")
+
+# Cache settings
+PARSE_CACHE_DIR = os.path.join("cache", "parsed_resumes")
+PARSE_CACHE_MAX_MB = 100
+VECTOR_STORE_CACHE_DIR = os.path.join("cache", "vector_stores")
+# spaCy docs kept so extraction rules can be re-run without re-running NER
+DOC_CACHE_DIR = os.path.join("cache", "spacy_docs")
+DOC_CACHE_MAX_MB = 500
+# Text extracted from resume files, keyed by path, size and modification time,
+# so archives can be re-processed without reading the PDFs again
+EXTRACTED_TEXT_CACHE_DIR = os.path.join("cache", "extracted_text")
+EXTRACTED_TEXT_CACHE_MAX_MB = 200
+# Last parsed version of each user's resume, used to re-parse only edited sections
+RESUME_VERSIONS_DIR = os.path.join("cache", "resume_versions")
+RESUME_VERSIONS_MAX_MB = 50
+ANALYSIS_CACHE_DIR = os.path.join("cache", "resume_analyses")
+# Document frequencies learned from saved jobs and parsed resumes, for keyword ranking
+IDF_MODEL_PATH = os.path.join("cache", "idf_model.npz")
+# Only the most frequent terms are kept and only the latest documents are remembered
+# (to skip recounting them); changes are written in the background after a short delay
+IDF_MAX_TERMS = 50000
+IDF_MAX_DOCUMENTS = 100000
+IDF_SAVE_DELAY_SECONDS = 30
+
+# SerpAPI responses - served from cache while fresh, served and refreshed in the
+# background while stale, fetched again once older than TTL + stale window
+SEARCH_CACHE_DIR = os.path.join("cache", "serpapi")
+SEARCH_CACHE_MAX_MB = 50
+SEARCH_CACHE_TTL_SECONDS = 60 * 60
+SEARCH_CACHE_STALE_SECONDS = 24 * 60 * 60
+# Recency windows (days) offered in the search form; a fresh cached search over a wider
+# window answers narrower ones by filtering on posting time
+SEARCH_RECENCY_WINDOWS = [1, 3, 7, 14, 30, 365]
+
+# Skill names, synonyms and categories shared by the parser, keyword extractor and UI
+SKILL_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skill_taxonomy.json")
+
+# Outgoing HTTP - one pooled session per process; GET/HEAD requests are retried with
+# exponential backoff on connection errors and 429/5xx responses
+HTTP_CONNECT_TIMEOUT_SECONDS = 5
+HTTP_READ_TIMEOUT_SECONDS = 20
+HTTP_MAX_RETRIES = 2
+HTTP_RETRY_BACKOFF_SECONDS = 0.5
+HTTP_POOL_HOSTS = 10
+HTTP_POOL_PER_HOST = 10
+
 # Job search settings
 DEFAULT_JOB_COUNT = 5
 JOB_PLATFORMS = ["LinkedIn", "Indeed", "Glassdoor", "ZipRecruiter", "Monster"]
+# Fetch listings for all platforms with one paged SerpAPI query (split locally by source)
+# instead of one query per platform; pages scale with the jobs requested per platform,
+# never exceeding the cap or the number of platforms
+SERPAPI_COALESCE_PLATFORMS = os.getenv("SERPAPI_COALESCE_PLATFORMS", "true").lower() == "true"
+SERPAPI_PAGE_SIZE = 10
+SERPAPI_MAX_PAGES = 5
+# Platforms are searched concurrently; results still missing at the deadline are dropped
+SEARCH_MAX_CONCURRENCY = 5
+SEARCH_DEADLINE_SECONDS = 20
 
 
 COLORS = {
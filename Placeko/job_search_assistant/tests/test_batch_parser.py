@@ -0,0 +1,40 @@
+import os
+from utils import batch_parser
+from utils.batch_parser import read_resume_file
+from utils.disk_cache import DiskCache
+
+
+def test_unchanged_files_are_not_extracted_again(tmp_path, monkeypatch):
+    extracted = []
+    extract_document = batch_parser.extract_document
+
+    def counting_extract_document(data):
+        extracted.append(data)
+        return extract_document(data)
+
+    monkeypatch.setattr(batch_parser, "extract_document", counting_extract_document)
+    cache = DiskCache(str(tmp_path / "cache"))
+    resume = tmp_path / "resume.txt"
+    resume.write_text("Jane Doe\nPython developer")
+
+    assert read_resume_file(str(resume), cache) == "Jane Doe\nPython developer"
+    assert read_resume_file(str(resume), cache) == "Jane Doe\nPython developer"
+    assert len(extracted) == 1
+
+    # An edited file is extracted again
+    resume.write_text("Jane Doe\nSenior Python developer")
+    stat = resume.stat()
+    os.utime(resume, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert read_resume_file(str(resume), cache) == "Jane Doe\nSenior Python developer"
+    assert len(extracted) == 2
+
+
+def test_degraded_extractions_are_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch_parser, "extract_document",
+                        lambda data: {"text": "partial", "degraded_stages": ["pdf_page_timeout"]})
+    cache = DiskCache(str(tmp_path / "cache"))
+    resume = tmp_path / "resume.txt"
+    resume.write_text("Jane Doe")
+
+    assert read_resume_file(str(resume), cache) == "partial"
+    assert cache.stats()["entries"] == 0
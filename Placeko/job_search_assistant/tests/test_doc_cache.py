@@ -0,0 +1,63 @@
+import spacy
+from utils.doc_cache import DocCache
+
+
+def make_nlp():
+    """Blank English pipeline with an entity ruler, so docs carry entities without a model download."""
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "ORG", "pattern": "Acme Corp"},
+        {"label": "ORG", "pattern": "Stanford University"}
+    ])
+    return nlp
+
+
+def test_docs_round_trip_with_their_entities(tmp_path):
+    nlp = make_nlp()
+    texts = [f"Candidate {i}: Software Engineer at Acme Corp, MSc from Stanford University." for i in range(20)]
+    cache = DocCache(str(tmp_path))
+
+    for text, doc in zip(texts, nlp.pipe(texts)):
+        cache.set(DocCache.key(text, "test-model-1"), doc)
+    docs = [cache.get(DocCache.key(text, "test-model-1")) for text in texts]
+
+    assert [doc.text for doc in docs] == texts
+    assert all([(ent.text, ent.label_) for ent in doc.ents] == [("Acme Corp", "ORG"), ("Stanford University", "ORG")]
+               for doc in docs)
+    # Loaded docs share the cache's vocab, so they can be merged
+    assert all(doc.vocab is docs[0].vocab for doc in docs)
+
+
+def test_keys_depend_on_text_and_model_version(tmp_path):
+    cache = DocCache(str(tmp_path))
+    doc = make_nlp()("Engineer at Acme Corp")
+    cache.set(DocCache.key(doc.text, "test-model-1"), doc)
+
+    assert cache.get(DocCache.key(doc.text, "test-model-2")) is None
+    assert cache.get(DocCache.key("Engineer at Acme", "test-model-1")) is None
+
+
+def test_to_cache_vocab_rebinds_fresh_docs(tmp_path):
+    cache = DocCache(str(tmp_path))
+    doc = make_nlp()("Engineer at Acme Corp")
+    cache.set(DocCache.key(doc.text, "test-model-1"), doc)
+    loaded = cache.get(DocCache.key(doc.text, "test-model-1"))
+
+    rebound = cache.to_cache_vocab(doc)
+
+    assert rebound.vocab is loaded.vocab
+    assert [ent.text for ent in rebound.ents] == ["Acme Corp"]
+    assert cache.to_cache_vocab(loaded) is loaded
+
+
+def test_corrupt_entries_are_misses(tmp_path):
+    cache = DocCache(str(tmp_path))
+    key = DocCache.key("Engineer", "test-model-1")
+    cache.set(key, make_nlp()("Engineer"))
+    paths = list(tmp_path.rglob("*.spacy"))
+    assert paths
+    for path in paths:
+        path.write_bytes(b"not a docbin")
+
+    assert cache.get(key) is None
@@ -0,0 +1,78 @@
+import io
+import threading
+import docx
+from utils import document_extractor
+from utils.document_extractor import (
+    extract_document, extract_pdf_pages, extract_text, sniff_mime_type, synthetic_pdf
+)
+
+
+def synthetic_docx(paragraphs):
+    document = docx.Document()
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    output = io.BytesIO()
+    document.save(output)
+    return output.getvalue()
+
+
+def test_formats_are_detected_from_content():
+    assert sniff_mime_type(memoryview(synthetic_pdf(1))) == document_extractor.PDF_MIME_TYPE
+    assert sniff_mime_type(memoryview(synthetic_docx(["Python"]))) == document_extractor.DOCX_MIME_TYPE
+    assert sniff_mime_type(memoryview(b"PK\x03\x04 not a zip")) == document_extractor.TEXT_MIME_TYPE
+    assert sniff_mime_type(memoryview(b"Jane Doe\nPython developer")) == document_extractor.TEXT_MIME_TYPE
+
+
+def test_docx_and_text_are_extracted_from_bytes_or_file_objects():
+    assert extract_text(synthetic_docx(["Jane Doe", "Python developer"])) == "Jane Doe\nPython developer"
+    assert extract_text(io.BytesIO(b"Jane Doe\nPython developer")) == "Jane Doe\nPython developer"
+    assert extract_text(memoryview(b"Jane \xffDoe")) == "Jane Doe"
+    assert extract_document(b"Jane Doe")["degraded_stages"] == []
+
+
+def test_serial_and_pooled_pdf_extraction_return_the_same_text_in_page_order():
+    pdf = memoryview(synthetic_pdf(10))
+
+    serial = extract_pdf_pages(pdf, parallel_min_pages=11)
+    pooled = extract_pdf_pages(pdf, parallel_min_pages=1, pages_per_task=3)
+
+    assert serial["text"] == pooled["text"]
+    assert serial["text"].index("Page 2 line 0") < serial["text"].index("Page 10 line 0")
+    assert [page["page"] for page in pooled["pages"]] == list(range(1, 11))
+    assert not any(page["timed_out"] for page in pooled["pages"])
+
+
+def test_pages_past_the_limit_are_reported_as_truncated():
+    result = extract_pdf_pages(memoryview(synthetic_pdf(6)), max_pages=4)
+
+    assert result["page_count"] == 6
+    assert result["truncated"]
+    assert "Page 4 line 0" in result["text"] and "Page 5" not in result["text"]
+    assert extract_document(synthetic_pdf(document_extractor.PDF_MAX_PAGES + 1))["degraded_stages"] == ["truncated_pages"]
+
+
+def test_pages_past_the_overall_deadline_are_skipped():
+    pdf = memoryview(synthetic_pdf(6))
+
+    serial = extract_pdf_pages(pdf, timeout=1e-9, parallel_min_pages=7)
+    pooled = extract_pdf_pages(pdf, timeout=1e-9, parallel_min_pages=1)
+
+    assert all(page["timed_out"] for page in serial["pages"] + pooled["pages"])
+    assert serial["text"].strip() == pooled["text"].strip() == ""
+
+
+def test_extraction_off_the_main_thread_still_returns_every_page():
+    results = {}
+    thread = threading.Thread(target=lambda: results.update(extract_pdf_pages(memoryview(synthetic_pdf(3)))))
+    thread.start()
+    thread.join()
+
+    assert [page["page"] for page in results["pages"]] == [1, 2, 3]
+    assert not any(page["timed_out"] for page in results["pages"])
+    assert "Page 3 line 4" in results["text"]
+
+
+def test_pdf_workers_are_not_forked_from_this_process():
+    executor = document_extractor._get_pdf_executor()
+
+    assert executor._mp_context.get_start_method() in ("forkserver", "spawn")
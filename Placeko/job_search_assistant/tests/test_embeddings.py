@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+from utils.embeddings import LocalHashingEmbeddings, get_embeddings
+
+
+def test_local_embeddings_are_normalized_vectors_of_the_configured_size():
+    embeddings = LocalHashingEmbeddings(n_features=256)
+
+    vectors = np.array(embeddings.embed_documents(["Python developer", "Java developer", "Chef and baker"]))
+
+    assert vectors.shape == (3, 256)
+    assert np.allclose(np.linalg.norm(vectors, axis=1), 1.0, atol=1e-5)
+    assert embeddings.embed_documents([]) == []
+
+
+def test_query_embedding_ranks_the_closest_chunk_first():
+    embeddings = LocalHashingEmbeddings()
+    chunks = [
+        "Master of Science in Computer Science, Stanford University",
+        "Senior Software Engineer at Acme Corp, built microservices in Python",
+        "Skills: Python, AWS, Docker, Kubernetes"
+    ]
+
+    scores = np.array(embeddings.embed_documents(chunks)) @ np.array(embeddings.embed_query("Stanford University degree"))
+
+    assert scores.argmax() == 0
+    # Queries and documents go through the same vectorizer
+    assert embeddings.embed_query(chunks[1]) == embeddings.embed_documents([chunks[1]])[0]
+
+
+def test_get_embeddings_selects_the_backend():
+    assert isinstance(get_embeddings("local"), LocalHashingEmbeddings)
+    assert get_embeddings("local").model == "local-hashing-char3-5-1024"
+    with pytest.raises(ValueError):
+        get_embeddings("unknown")
@@ -0,0 +1,61 @@
+import pytest
+from utils.entry_index import EntryIndex
+
+
+def entity_contexts(entity_count):
+    """Context windows around each company, as extract_information builds them."""
+    companies = [f"Company{i} Corp" for i in range(entity_count)]
+    text = " ".join(
+        f"Senior Engineer at {name} from 2010 to 2012 building data pipelines and services."
+        for name in companies
+    )
+    contexts = []
+    for name in companies:
+        position = text.index(name)
+        contexts.append((name, text[max(0, position - 150):position + len(name) + 150].strip()))
+    return contexts
+
+
+@pytest.mark.parametrize("entity_count", [300, 1000])
+def test_every_entity_is_covered_with_no_more_entries_than_substring_scan(entity_count):
+    contexts = entity_contexts(entity_count)
+
+    naive = []
+    for name, context in contexts:
+        if not any(name in existing for existing in naive):
+            naive.append(context)
+
+    index = EntryIndex()
+    for name, context in contexts:
+        if not index.mentions(name):
+            index.add(context)
+
+    assert all(index.mentions(name) for name, _ in contexts)
+    assert len(index) <= len(naive)
+    # Case-only variants are duplicates
+    assert not index.add(contexts[0][1].upper())
+
+
+def test_near_duplicates_are_rejected_and_new_text_is_kept():
+    index = EntryIndex()
+
+    assert index.add("Software Engineer at Acme Corp, 2019 - 2021, built the payments platform")
+    assert not index.add("software engineer at acme corp 2019 2021 built the payments platform")
+    assert not index.add("Software Engineer at Acme Corp, 2019 - 2021, built the payments platform.")
+    assert index.add("Data Engineer at Globex, 2016 - 2019, ran the data warehouse")
+    assert not index.add("   ")
+    assert list(index) == [
+        "Software Engineer at Acme Corp, 2019 - 2021, built the payments platform",
+        "Data Engineer at Globex, 2016 - 2019, ran the data warehouse"
+    ]
+
+
+def test_mentions_matches_whole_token_sequences_only():
+    index = EntryIndex()
+    index.add("Master of Science in Computer Science, Stanford University")
+
+    assert index.mentions("stanford university")
+    assert index.mentions("Computer Science")
+    assert not index.mentions("Stan")
+    assert not index.mentions("University of Stanford")
+    assert not index.mentions("")
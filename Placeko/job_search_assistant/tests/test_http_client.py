@@ -0,0 +1,45 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from utils.http_client import HTTPClient
+
+
+@pytest.fixture
+def unavailable_server():
+    """Local server answering every request with 503, counting the requests it gets."""
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        do_HEAD = do_GET
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", hits
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_requests_are_retried_but_probes_are_sent_once(unavailable_server):
+    url, hits = unavailable_server
+    client = HTTPClient(max_retries=2, backoff=0)
+
+    assert client.get(f"{url}/search").status_code == 503
+    assert len(hits) == 3
+
+    del hits[:]
+    assert client.get(f"{url}/health", retry=False).status_code == 503
+    assert client.head(f"{url}/job", retry=False).status_code == 503
+    assert hits == ["/health", "/job"]
+    assert client.stats()[url.split("//")[1]]["requests"] == 3
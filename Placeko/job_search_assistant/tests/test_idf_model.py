@@ -0,0 +1,52 @@
+import time
+import numpy as np
+from utils.idf_model import IDFModel
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "idf.npz")
+    model = IDFModel()
+    model.add_document("Python developer building data pipelines")
+    model.add_document("Java developer with Spring experience")
+    model.save(path)
+
+    loaded = IDFModel.load(path)
+
+    assert loaded.vocab == model.vocab
+    assert loaded.n_docs == 2
+    assert np.array_equal(loaded.weights(["developer", "python", "unseen"]), model.weights(["developer", "python", "unseen"]))
+    # Documents already counted are still recognised after loading
+    assert not loaded.add_document("Python developer building data pipelines")
+
+
+def test_vocabulary_is_pruned_to_most_frequent_terms():
+    model = IDFModel(max_terms=100)
+    for i in range(60):
+        model.add_document(f"common shared words unique{i}a unique{i}b")
+
+    assert len(model) <= 100
+    assert {"common", "shared", "words"} <= set(model.vocab)
+    assert model.weights(["common"])[0] < model.weights(["unique0a"])[0]
+
+
+def test_document_ids_are_bounded():
+    model = IDFModel(max_documents=10)
+    for i in range(25):
+        model.add_document(f"resume number {i}")
+
+    assert len(model.doc_ids) == 10
+    assert model.n_docs == 25
+    assert not model.add_document("resume number 24")
+
+
+def test_save_later_writes_once_in_background(tmp_path):
+    path = str(tmp_path / "idf.npz")
+    model = IDFModel()
+    model.add_document("first resume")
+    model.save_later(path, delay=0.1)
+    model.add_document("second resume")
+    model.save_later(path, delay=0.1)
+
+    time.sleep(0.4)
+
+    assert IDFModel.load(path).n_docs == 2
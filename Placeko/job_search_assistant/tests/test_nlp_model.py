@@ -0,0 +1,34 @@
+import spacy
+from utils.nlp_model import NLPModel, split_text
+
+
+def test_split_text_cuts_at_line_then_word_boundaries():
+    text = "Python developer at Acme Corp\n" * 20 + "word " * 40
+
+    pieces = split_text(text, 100)
+
+    assert "".join(pieces) == text
+    assert all(len(piece) <= 100 for piece in pieces)
+    assert all(piece.endswith(("\n", " ")) for piece in pieces[:-1])
+    assert split_text("short", 100) == ["short"]
+    assert split_text(text, None) == [text]
+
+
+def test_split_text_cuts_mid_word_without_a_break():
+    text = "x" * 250
+
+    assert split_text(text, 100) == ["x" * 100, "x" * 100, "x" * 50]
+
+
+def test_long_texts_are_processed_in_chunks_and_merged_into_one_doc():
+    nlp = spacy.blank("en")
+    nlp.add_pipe("entity_ruler").add_patterns([{"label": "ORG", "pattern": "Acme Corp"}])
+    model = NLPModel(service_url=None, max_chunk_chars=200)
+    model._nlp = nlp
+    long_text = "Engineer at Acme Corp building services.\n" * 30
+
+    docs = list(model.pipe([long_text, "Intern at Acme Corp"]))
+
+    assert [doc.text for doc in docs] == [long_text, "Intern at Acme Corp"]
+    assert len(docs[0].ents) == 30
+    assert all(long_text[ent.start_char:ent.end_char] == "Acme Corp" for ent in docs[0].ents)
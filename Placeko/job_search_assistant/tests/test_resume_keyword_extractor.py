@@ -0,0 +1,76 @@
+from utils.idf_model import IDFModel
+from utils.resume_keyword_extractor import ResumeKeywordExtractor
+
+
+def make_resumes(count):
+    roles = ["data pipelines", "payments platform", "mobile app", "search service"]
+    return [
+        {
+            "skills": ["Python", "SQL"] if i % 2 else ["Java", "Kubernetes"],
+            "experience": [f"Software Engineer at Company{i}, built the {roles[i % 4]} with Docker and AWS, "
+                           f"owned monitoring and on-call for {roles[(i + 1) % 4]}"],
+            "education": ["Master of Science in Computer Science, Stanford University"]
+        }
+        for i in range(count)
+    ]
+
+
+def test_pooled_extraction_matches_serial():
+    # A model unlike the shared default, so workers must receive it to rank the same way
+    idf_model = IDFModel()
+    for i in range(50):
+        idf_model.add_document(f"owned monitoring and on-call built with docker company{i}")
+    extractor = ResumeKeywordExtractor(idf_model=idf_model)
+    resumes = make_resumes(12)
+
+    try:
+        serial = extractor.extract_batch(resumes, max_keywords=8, n_process=1)
+        pooled = extractor.extract_batch(resumes, max_keywords=8, n_process=2, chunk_size=3)
+        pool = extractor._pool
+        pooled_again = extractor.extract_batch(resumes, max_keywords=8, n_process=2, chunk_size=3)
+        reused = extractor._pool is pool
+    finally:
+        extractor.close()
+
+    def without_timing(results):
+        return [(result["keywords"], result["job_title"]) for result in results]
+    assert without_timing(pooled) == without_timing(serial)
+    assert without_timing(pooled_again) == without_timing(serial)
+    assert pool is not None and reused
+    assert extractor._pool is None
+
+
+def test_idf_model_survives_pickling():
+    import pickle
+
+    idf_model = IDFModel()
+    idf_model.add_document("python developer")
+    copy = pickle.loads(pickle.dumps(idf_model))
+
+    assert copy.vocab == idf_model.vocab
+    assert not copy.add_document("python developer")
+    assert copy.add_document("java developer")
+
+
+def test_skills_come_first_without_case_duplicates():
+    extractor = ResumeKeywordExtractor(idf_model=IDFModel())
+    resume_data = {
+        "skills": ["Python", "python", "AWS"],
+        "experience": ["Built the payments platform in Python on AWS with Docker and Kubernetes"] * 100,
+        "education": ["Master of Science in Computer Science, Stanford University"]
+    }
+
+    keywords = extractor.extract_keywords(resume_data, max_keywords=6)
+
+    assert keywords[:2] == ["Python", "AWS"]
+    assert len(keywords) == 6
+    assert len({keyword.lower() for keyword in keywords}) == 6
+    assert extractor.extract_keywords({}) == []
+
+
+def test_job_title_prefers_the_longest_title_then_skills():
+    extractor = ResumeKeywordExtractor(idf_model=IDFModel())
+
+    assert extractor.extract_job_title({"experience": ["Senior Machine Learning Engineer at Acme"]}) == "machine learning engineer"
+    assert extractor.extract_job_title({"experience": ["Volunteer"], "skills": ["Docker", "Kubernetes"]}) == "devops engineer"
+    assert extractor.extract_job_title({"experience": [], "skills": ["Cooking"]}) == "software engineer"
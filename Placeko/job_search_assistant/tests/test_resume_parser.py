@@ -0,0 +1,169 @@
+import time
+import pytest
+import spacy
+from utils.nlp_model import nlp_model
+from utils.resume_parser import ResumeParser, resume_owner_key
+
+NO_EMAIL_RESUME = """{name}
+555-123-4567
+TECHNOLOGIES
+Python, SQL and {tool}
+EMPLOYMENT
+Software Engineer at {company} 2019 - 2023
+"""
+
+EMAIL_RESUME = """Jane Doe
+jane.doe@example.com
+SUMMARY
+{summary}
+SKILLS
+Python, SQL, Docker
+EXPERIENCE
+Acme Corp Jan 2019 - Present Software engineer building data pipelines
+"""
+
+
+@pytest.fixture
+def parser(tmp_path, monkeypatch):
+    """A parser with caches under tmp_path, a blank spaCy pipeline and a stubbed RAG call."""
+    monkeypatch.chdir(tmp_path)
+    nlp = spacy.blank("en")
+    nlp.add_pipe("entity_ruler").add_patterns([{"label": "ORG", "pattern": "Acme Corp"}])
+    monkeypatch.setattr(nlp_model, "_nlp", nlp)
+
+    parser = ResumeParser()
+    parser.use_rag = True
+    parser.rag_calls = []
+
+    def fake_rag(text, cancelled=None):
+        # Answers that could only come from this text
+        name = text.strip().splitlines()[0]
+        parser.rag_calls.append(name)
+        return {"skills": [f"{name}-secret-skill"], "education": [f"{name} University"], "experience": []}
+
+    parser.extract_rag_sections = fake_rag
+    return parser
+
+
+def test_owner_key_is_the_email_only():
+    assert resume_owner_key("Jane Doe\nJane.Doe@Example.com") == "jane.doe@example.com"
+    assert resume_owner_key("Jane Doe\nno contact details") is None
+
+
+def test_resumes_without_email_never_share_results(parser):
+    alice = NO_EMAIL_RESUME.format(name="Alice Smith", tool="Airflow", company="Initech")
+    bob = NO_EMAIL_RESUME.format(name="Bob Jones", tool="Spark", company="Globex")
+
+    parser.parse_resume(alice, user_id=resume_owner_key(alice))
+    result = parser.parse_resume(bob, user_id=resume_owner_key(bob))
+
+    assert parser.rag_calls == ["Alice Smith", "Bob Jones"]
+    assert "Alice Smith-secret-skill" not in result["skills"]
+    assert "Bob Jones-secret-skill" in result["skills"]
+    assert not any("Alice" in entry for entry in result["education"])
+
+
+def test_edits_outside_recognised_sections_rerun_rag(parser):
+    first = NO_EMAIL_RESUME.format(name="Alice Smith", tool="Airflow", company="Initech")
+    second = NO_EMAIL_RESUME.format(name="Alice Smith", tool="Kafka", company="Initech")
+
+    parser.parse_resume(first, user_id="alice")
+    result = parser.parse_resume(second, user_id="alice")
+
+    assert result["changed_sections"] == ["preamble"]
+    assert parser.rag_calls == ["Alice Smith", "Alice Smith"]
+
+
+def test_summary_edits_reuse_rag_and_identical_uploads_reuse_everything(parser):
+    first = EMAIL_RESUME.format(summary="Engineer who likes data.")
+    second = EMAIL_RESUME.format(summary="Engineer who loves data and pipelines.")
+    user_id = resume_owner_key(first)
+
+    parser.parse_resume(first, user_id=user_id)
+    edited = parser.parse_resume(second, user_id=user_id)
+    again = parser.parse_resume(second, user_id=user_id)
+
+    assert edited["changed_sections"] == ["summary"]
+    assert "Jane Doe-secret-skill" in edited["skills"]
+    assert again["changed_sections"] == []
+    assert parser.rag_calls == ["Jane Doe"]
+
+
+def test_skill_edits_rerun_rag(parser):
+    first = EMAIL_RESUME.format(summary="Engineer who likes data.")
+    second = first.replace("Python, SQL, Docker", "Python, SQL, Kubernetes")
+
+    parser.parse_resume(first, user_id="jane")
+    result = parser.parse_resume(second, user_id="jane")
+
+    assert result["changed_sections"] == ["skills"]
+    assert len(parser.rag_calls) == 2
+
+
+def slow_rag(parser, seconds):
+    """Replace the RAG call with one that takes the given time."""
+    def fake_rag(text, cancelled=None):
+        time.sleep(seconds)
+        parser.rag_calls.append(text.strip().splitlines()[0])
+        return {"skills": ["Slow-skill"], "education": [], "experience": []}
+    parser.extract_rag_sections = fake_rag
+
+
+def test_text_beyond_max_chars_is_dropped_and_reported(parser):
+    text = EMAIL_RESUME.format(summary="Engineer who likes data.") + "Volunteer work\n" * 500
+
+    result = parser.parse_resume(text, max_chars=1000)
+
+    assert result["degraded_stages"][0] == "truncated_text"
+    assert len(result["raw_text"]) <= 1000
+    assert result["raw_text"].endswith("\n")
+
+
+def test_optional_stages_are_skipped_after_the_deadline(parser):
+    # No experience or education sections, so the entity context scans would run
+    text = "Jane Doe\nEngineer at Acme Corp building data pipelines\n"
+
+    result = parser.parse_resume(text, time_budget=1e-9)
+
+    assert result["degraded_stages"] == ["entity_context", "rag"]
+    assert parser.rag_calls == []
+    assert result["experience"] == []
+
+
+def test_slow_rag_is_abandoned_at_the_deadline(parser):
+    slow_rag(parser, 1.0)
+    text = EMAIL_RESUME.format(summary="Engineer who likes data.")
+
+    start = time.monotonic()
+    result = parser.parse_resume(text, time_budget=0.2)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.8
+    assert result["degraded_stages"] == ["rag"]
+    assert "Slow-skill" not in result["skills"]
+
+
+def test_degraded_results_are_not_cached(parser):
+    text = EMAIL_RESUME.format(summary="Engineer who likes data.")
+    slow_rag(parser, 0.3)
+
+    degraded = parser.parse_resume(text, time_budget=0.1)
+    complete = parser.parse_resume(text, time_budget=5)
+    cached = parser.parse_resume(text, time_budget=5)
+
+    assert degraded["degraded_stages"] == ["rag"]
+    assert complete["degraded_stages"] == [] and "Slow-skill" in complete["skills"]
+    assert cached["skills"] == complete["skills"]
+    # The abandoned call may still finish in the background; the complete parse adds one more, the cached one none
+    time.sleep(0.3)
+    assert len(parser.rag_calls) == 2
+
+
+def test_extraction_stages_reach_the_result(parser):
+    text = EMAIL_RESUME.format(summary="Engineer who likes data.")
+
+    result = parser.parse_resume(text, degraded_stages=["truncated_pages"])
+    cached = parser.parse_resume(text)
+
+    assert result["degraded_stages"] == ["truncated_pages"]
+    assert cached["degraded_stages"] == []
@@ -0,0 +1,41 @@
+import threading
+import time
+from utils.search_orchestrator import search_platforms
+
+
+def test_results_keep_platform_order_and_errors_are_reported():
+    def search(platform):
+        if platform == "Glassdoor":
+            raise RuntimeError("blocked")
+        time.sleep(0.05 if platform == "LinkedIn" else 0)
+        return [{"title": f"{platform} job"}]
+
+    seen = []
+    result = search_platforms(search, ["LinkedIn", "Indeed", "Glassdoor"], deadline_seconds=5,
+                              on_result=lambda platform, jobs: seen.append(platform))
+
+    assert [job["title"] for job in result["jobs"]] == ["LinkedIn job", "Indeed job"]
+    assert result["errors"] == {"Glassdoor": "blocked"}
+    assert result["timed_out"] == []
+    assert seen == ["Indeed", "LinkedIn"]
+
+
+def test_searches_left_running_do_not_delay_later_calls():
+    release = threading.Event()
+
+    def stuck(platform):
+        release.wait(5)
+        return []
+
+    try:
+        # Enough stuck searches to fill a shared pool of SEARCH_MAX_CONCURRENCY threads
+        first = search_platforms(stuck, [f"Platform{i}" for i in range(10)], deadline_seconds=0.1)
+        start = time.monotonic()
+        second = search_platforms(lambda platform: [{"title": platform}], ["LinkedIn"], deadline_seconds=1)
+        elapsed = time.monotonic() - start
+    finally:
+        release.set()
+
+    assert len(first["timed_out"]) == 10
+    assert second["jobs"] == [{"title": "LinkedIn"}]
+    assert elapsed < 0.5
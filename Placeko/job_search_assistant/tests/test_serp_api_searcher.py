@@ -0,0 +1,192 @@
+import time
+import pytest
+import utils.serp_api_searcher as serp_api_searcher
+from utils.search_cache import SearchCache
+from utils.serp_api_searcher import SerpApiSearcher, _posted_timestamp
+
+NOW = 1_700_000_000.0
+DAY = 86400
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+class FakeSerpApi:
+    """Stands in for http_client.get, serving scripted pages and recording each request."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append(dict(params))
+        page = self.pages[params.get("next_page_token") or "first"]
+        return FakeResponse(page)
+
+
+def make_job(title, via="via LinkedIn", posted_at="2 days ago"):
+    job = {"title": title, "company_name": "Acme", "via": via}
+    if posted_at is not None:
+        job["detected_extensions"] = {"posted_at": posted_at}
+    return job
+
+
+@pytest.fixture
+def searcher(tmp_path, monkeypatch):
+    monkeypatch.setattr(serp_api_searcher, "SERPAPI_API_KEY", "test-key")
+    return SerpApiSearcher(cache=SearchCache(str(tmp_path / "serpapi")))
+
+
+def use_pages(monkeypatch, pages):
+    fake = FakeSerpApi(pages)
+    monkeypatch.setattr(serp_api_searcher.http_client, "get", fake.get)
+    return fake
+
+
+@pytest.mark.parametrize("posted_at, expected", [
+    ("17 hours ago", NOW - 17 * 3600),
+    ("3 days ago", NOW - 3 * DAY),
+    ("1 day ago", NOW - DAY),
+    ("30+ days ago", NOW - 30 * DAY),
+    ("2 weeks ago", NOW - 14 * DAY),
+    ("1 month ago", NOW - 30 * DAY),
+    ("45 minutes ago", NOW - 45 * 60),
+    ("Just posted", NOW),
+    ("Posted today", NOW),
+])
+def test_posted_timestamp_parses_relative_ages(posted_at, expected):
+    assert _posted_timestamp(posted_at, NOW) == expected
+
+
+@pytest.mark.parametrize("posted_at", [None, "", "Recently", "Full-time"])
+def test_posted_timestamp_unknown_ages(posted_at):
+    assert _posted_timestamp(posted_at, NOW) is None
+
+
+def test_narrow_window_answered_from_exhaustive_wider_search(searcher, monkeypatch):
+    fake = use_pages(monkeypatch, {
+        "first": {"jobs_results": [make_job("New", posted_at="5 hours ago"), make_job("Old", posted_at="5 days ago")]}
+    })
+    searcher.search_jobs("python developer", "NYC", days_ago=7)
+    assert len(fake.requests) == 1
+
+    jobs = searcher.search_jobs("Python  Developer", "nyc", days_ago=1)
+
+    assert len(fake.requests) == 1
+    assert [job["title"] for job in jobs] == ["New"]
+    assert searcher.cache.stats()["window_hits"] == 1
+
+
+def test_narrow_window_fetched_when_wider_search_has_more_pages(searcher, monkeypatch):
+    # SERPAPI_MAX_PAGES pages, the last of which still points to another one
+    pages = {}
+    for page in range(serp_api_searcher.SERPAPI_MAX_PAGES):
+        token = "first" if page == 0 else f"page{page}"
+        pages[token] = {
+            "jobs_results": [make_job(f"Job {page}", posted_at="1 day ago")],
+            "serpapi_pagination": {"next_page_token": f"page{page + 1}"}
+        }
+    fake = use_pages(monkeypatch, pages)
+    searcher.search_all_platforms("python developer", "NYC", ["LinkedIn"], count=100, days_ago=7)
+    requests_before = len(fake.requests)
+
+    searcher.search_all_platforms("python developer", "NYC", ["LinkedIn"], count=100, days_ago=3)
+
+    assert len(fake.requests) > requests_before
+    assert fake.requests[requests_before]["chips"] == "date_posted:3d"
+    assert searcher.cache.stats()["window_hits"] == 0
+
+
+def test_narrow_window_fetched_when_wider_results_have_unknown_ages(searcher, monkeypatch):
+    fake = use_pages(monkeypatch, {
+        "first": {"jobs_results": [make_job("Dated", posted_at="5 hours ago"), make_job("Undated", posted_at=None)]}
+    })
+    searcher.search_jobs("python developer", "NYC", days_ago=7)
+
+    searcher.search_jobs("python developer", "NYC", days_ago=1)
+
+    assert len(fake.requests) == 2
+    assert fake.requests[1]["chips"] == "date_posted:1d"
+
+
+def test_wider_window_is_never_answered_from_narrower_search(searcher, monkeypatch):
+    fake = use_pages(monkeypatch, {"first": {"jobs_results": [make_job("New", posted_at="5 hours ago")]}})
+    searcher.search_jobs("python developer", "NYC", days_ago=1)
+
+    searcher.search_jobs("python developer", "NYC", days_ago=7)
+
+    assert len(fake.requests) == 2
+
+
+def paged_jobs(page_count, vias):
+    """page_count linked pages, each with ten jobs spread over the given sources."""
+    pages = {}
+    for page in range(page_count):
+        token = "first" if page == 0 else f"page{page}"
+        pages[token] = {
+            "jobs_results": [make_job(f"Job {page}.{i}", via=f"via {vias[i % len(vias)]}") for i in range(10)],
+            "serpapi_pagination": {"next_page_token": f"page{page + 1}"}
+        }
+    return pages
+
+
+@pytest.mark.parametrize("count, expected_calls", [(5, 1), (10, 1), (20, 2), (100, 5)])
+def test_coalesced_search_never_makes_more_calls_than_per_platform_search(searcher, monkeypatch, count, expected_calls):
+    platforms = ["LinkedIn", "Indeed", "Glassdoor", "ZipRecruiter", "Monster"]
+    # Only LinkedIn shows up, so no page fills every platform
+    fake = use_pages(monkeypatch, paged_jobs(10, ["LinkedIn"]))
+
+    searcher.search_all_platforms("python developer", "NYC", platforms, count=count, coalesce=True)
+    coalesced_calls = len(fake.requests)
+    searcher.cache = SearchCache(searcher.cache.cache_dir + "-per-platform")
+    searcher.search_all_platforms("python developer", "NYC", platforms, count=count, coalesce=False)
+    per_platform_calls = len(fake.requests) - coalesced_calls
+
+    assert coalesced_calls == expected_calls
+    assert per_platform_calls == len(platforms)
+    assert coalesced_calls <= per_platform_calls
+
+
+def test_coalesced_search_pages_scale_with_requested_jobs(searcher, monkeypatch):
+    fake = use_pages(monkeypatch, paged_jobs(serp_api_searcher.SERPAPI_MAX_PAGES + 1, ["Indeed"]))
+
+    result = searcher.search_all_platforms("python developer", "NYC", ["Indeed", "LinkedIn"], count=15)
+
+    assert len(fake.requests) == 2
+    assert len([job for job in result["jobs"] if job["platform"] == "via Indeed"]) == 15
+    assert result["timed_out"] == []
+
+
+def test_coalesced_search_splits_one_query_by_platform(searcher, monkeypatch):
+    fake = use_pages(monkeypatch, paged_jobs(1, ["LinkedIn", "Monster"]))
+
+    result = searcher.search_all_platforms("python developer", "NYC", ["Monster", "LinkedIn"], count=3)
+
+    assert [job["title"] for job in result["jobs"]] == ["Job 0.1", "Job 0.3", "Job 0.5", "Job 0.0", "Job 0.2", "Job 0.4"]
+    assert [params["q"] for params in fake.requests] == ["python developer jobs in NYC"]
+    assert result["errors"] == {}
+
+
+def test_coalesced_search_stops_paging_at_the_deadline(searcher, monkeypatch):
+    monkeypatch.setattr(serp_api_searcher, "SEARCH_DEADLINE_SECONDS", 0.2)
+    fake = use_pages(monkeypatch, {
+        "first": {"jobs_results": [make_job("Indeed 0", via="via Indeed")], "serpapi_pagination": {"next_page_token": "next"}},
+        "next": {"jobs_results": [make_job("Indeed 1", via="via Indeed")]}
+    })
+    original_get = fake.get
+
+    def slow_get(url, params=None, timeout=None):
+        time.sleep(0.3)
+        return original_get(url, params=params, timeout=timeout)
+    monkeypatch.setattr(serp_api_searcher.http_client, "get", slow_get)
+
+    result = searcher.search_all_platforms("python developer", "NYC", ["Indeed", "LinkedIn"], count=5)
+
+    assert len(fake.requests) == 1
+    assert [job["title"] for job in result["jobs"]] == ["Indeed 0"]
+    assert result["timed_out"] == ["Indeed", "LinkedIn"]
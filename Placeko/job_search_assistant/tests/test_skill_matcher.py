@@ -0,0 +1,54 @@
+from utils.skill_matcher import SkillMatcher
+from utils.skill_taxonomy import skill_taxonomy
+
+
+def test_matches_respect_word_boundaries():
+    matcher = SkillMatcher(["Java", "JavaScript", "C++", "Node.js"])
+
+    assert matcher.find("JavaScript and Node.js, some C++") == ["JavaScript", "Node.js", "C++"]
+    assert matcher.find("Javanese cuisine") == []
+
+
+def test_overlapping_terms_are_all_reported():
+    matcher = SkillMatcher(["Google Cloud", "Cloud Computing"])
+
+    assert matcher.find("Google Cloud Computing") == ["Google Cloud", "Cloud Computing"]
+
+
+def test_synonyms_map_to_canonical_names_in_order_of_first_appearance():
+    matcher = SkillMatcher({"k8s": "Kubernetes", "kubernetes": "Kubernetes", "py": "Python"})
+
+    assert matcher.find("Py and K8s, then more kubernetes") == ["Python", "Kubernetes"]
+    assert list(matcher.iter_matches("k8s kubernetes")) == ["Kubernetes", "Kubernetes"]
+
+
+def test_iter_spans_reports_positions_in_the_original_text():
+    matcher = SkillMatcher(["aws", "docker"])
+    text = "Deployed to AWS with Docker"
+
+    spans = list(matcher.iter_spans(text))
+
+    assert spans == [(12, 15, "aws", "aws"), (21, 27, "docker", "docker")]
+    assert [text[start:end] for start, end, _, _ in spans] == ["AWS", "Docker"]
+
+
+def test_empty_matcher_and_text_find_nothing():
+    assert SkillMatcher([]).find("Python") == []
+    assert SkillMatcher(["Python"]).find("") == []
+
+
+def test_taxonomy_matcher_finds_the_same_skills_as_a_substring_scan_on_word_boundaries():
+    import re
+
+    skills = list(skill_taxonomy.categories)
+    matcher = SkillMatcher(skills)
+    text = ("Built microservices in Python and Node.js on AWS with Docker and Kubernetes. "
+            "Introduced CI/CD with Jenkins, designed PostgreSQL and MongoDB schemas, and trained "
+            "deep learning models with PyTorch and TensorFlow.")
+
+    expected = {
+        skill for skill in skills
+        if re.search(rf"(?<!\w){re.escape(skill.lower())}(?!\w)", text.lower())
+    }
+
+    assert set(matcher.find(text)) == expected
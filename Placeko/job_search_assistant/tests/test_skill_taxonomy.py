@@ -0,0 +1,61 @@
+import pytest
+from utils.skill_taxonomy import SkillTaxonomy, skill_taxonomy
+
+
+@pytest.mark.parametrize("text", [
+    "I go hiking every weekend",
+    "Graduated in Spring 2021",
+    "Hobbies: hiking and fixing old Windows machines",
+    "Strong communication skills and a focus on security and testing",
+    "Excel at working with stakeholders",
+    "Shipped by express delivery",
+])
+def test_ambiguous_names_in_prose_are_ignored(text):
+    found = skill_taxonomy.match(text)
+    assert not set(found) & {"go", "spring", "windows", "communication", "security", "testing", "excel", "express"}
+
+
+@pytest.mark.parametrize("text, skills", [
+    ("Languages: Python, Go, Rust", ["python", "go", "rust"]),
+    ("Skills\nGo\nSpring Boot\nWindows", ["go", "spring", "windows"]),
+    ("- Excel\n- Tableau", ["excel", "tableau"]),
+    ("Built AI products in Golang", ["artificial intelligence", "go"]),
+    ("APIs in Node.js and Express.js", ["api", "node.js", "express"]),
+])
+def test_ambiguous_names_match_as_list_items_or_unambiguous_forms(text, skills):
+    assert list(skill_taxonomy.match(text)) == skills
+
+
+def test_accepted_spellings_match_anywhere():
+    taxonomy = SkillTaxonomy({"AI": {"artificial intelligence": ["ai"]}}, ambiguous={"ai": ["AI"]})
+
+    assert taxonomy.match("Built AI products") == {"artificial intelligence": "AI"}
+    assert taxonomy.match("we will ai this") == {}
+
+
+def test_categorize_explicit_skill_names():
+    # Names taken from a parsed skill list are not subject to the prose rules
+    assert skill_taxonomy.categorize("Go") == "Programming Languages"
+    assert skill_taxonomy.categorize("AWS Lambda") == "Cloud & DevOps"
+    assert skill_taxonomy.categorize("Underwater basket weaving") is None
+
+
+def test_match_time_grows_linearly_with_text_length():
+    import time
+
+    # Every sentence has ambiguous hits, which each need a list-context check
+    sentence = "We go to the spring fair with windows open and test security. "
+
+    def best_time(text):
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            skill_taxonomy.match(text)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    short = best_time(sentence * 300)
+    long = best_time(sentence * 2400)
+
+    # 8x the text; a quadratic scan would take ~64x as long
+    assert long < short * 20
@@ -1,6 +1,7 @@
 
 import streamlit as st
 from config import COLORS
+from utils.skill_taxonomy import skill_taxonomy
 
 def display_resume_analysis_summary(resume_data):
     """
@@ -17,28 +18,25 @@ def display_resume_analysis_summary(resume_data):
     skills = resume_data.get("skills", [])
     experience = resume_data.get("experience", [])
     
-    # Define technical categories
-    tech_categories = {
-        "Programming": ["python", "java", "javascript", "c++", "ruby", "go"],
-        "Data Science": ["ml", "ai", "machine learning", "data science", "scikit", "numpy", "pandas"],
-        "Cloud & DevOps": ["aws", "azure", "gcp", "cloud", "ci/cd", "git", "docker"],
-        "Databases": ["sql", "mysql", "postgresql", "mongodb", "nosql"],
-        "Web & Mobile": ["react", "angular", "vue", "node", "android", "ios"],
-        "Other": []
+    # Summary groups built from the skill taxonomy's categories
+    summary_groups = {
+        "Programming Languages": "Programming",
+        "Machine Learning & AI": "Data Science",
+        "Data & Analytics": "Data Science",
+        "Cloud & DevOps": "Cloud & DevOps",
+        "Databases": "Databases",
+        "Web & Mobile": "Web & Mobile"
     }
     
-    # Categorize skills
-    categorized_skills = {cat: [] for cat in tech_categories}
+    # Categorize skills, reusing the categories found when the resume was parsed
+    skill_categories = resume_data.get("skill_categories") or {}
+    categorized_skills = {group: [] for group in ["Programming", "Data Science", "Cloud & DevOps",
+                                                   "Databases", "Web & Mobile", "Other"]}
     for skill in skills:
-        skill_lower = skill.lower()
-        found = False
-        for category, keywords in tech_categories.items():
-            if any(keyword in skill_lower for keyword in keywords):
-                categorized_skills[category].append(skill)
-                found = True
-                break
-        if not found:
-            categorized_skills["Other"].append(skill)
+        category = skill_categories.get(skill) or skill_taxonomy.categorize(skill)
+        categorized_skills[summary_groups.get(category, "Other")].append(skill)
+    found_categories = {skill_categories.get(skill) or skill_taxonomy.categorize(skill) for skill in skills}
+    known_skills = {skill.lower() for skill in skills}
     
     # Create summary
     st.subheader("Resume Analysis Summary")
@@ -54,9 +52,9 @@ def display_resume_analysis_summary(resume_data):
         # Identify strengths based on skills and experience
         if any(len(categorized_skills[cat]) > 0 for cat in ["Programming", "Data Science"]):
             strengths.append("Strong technical skills in programming and/or data science")
-        if any("aws" in skill.lower() or "cloud" in skill.lower() for skill in skills):
+        if categorized_skills["Cloud & DevOps"]:
             strengths.append("Cloud platform experience")
-        if any("ml" in skill.lower() or "ai" in skill.lower() for skill in skills):
+        if "Machine Learning & AI" in found_categories:
             strengths.append("Machine learning knowledge")
         
         # Display strengths with light, readable styling
@@ -81,11 +79,11 @@ def display_resume_analysis_summary(resume_data):
         st.markdown(f"""<h4 style="color: {COLORS['warning']}; margin-bottom: 15px; font-weight: 700;">📈 Areas to Improve</h4>""", unsafe_allow_html=True)
         improvements = []
         # Identify improvement areas
-        if not any("git" in skill.lower() for skill in skills):
+        if not known_skills & {"git", "github", "gitlab", "bitbucket", "version control"}:
             improvements.append("Version control experience (Git)")
-        if not any(db in "".join(skills).lower() for db in ["sql", "database"]):
+        if not categorized_skills["Databases"]:
             improvements.append("Database knowledge")
-        if not any(cloud in "".join(skills).lower() for cloud in ["aws", "azure", "gcp", "cloud"]):
+        if not categorized_skills["Cloud & DevOps"]:
             improvements.append("Cloud platform experience")
         
         # Display improvement areas with readable styling
@@ -117,17 +115,24 @@ def clean_and_organize_experience(experience_items):
         "Companies & Roles": []
     }
     
-    # Simple keyword-based categorization
+    # Experience groups in order of precedence: the keywords of each group, plus
+    # the skill taxonomy categories whose skills also place an item in it
+    experience_groups = [
+        ("Programming Experience", ["program", "develop", "code", "software"],
+         {"Programming Languages", "Web & Mobile", "Software Engineering"}),
+        ("Machine Learning & AI", ["machine", "learning", "ai", "neural", "model"], {"Machine Learning & AI"}),
+        ("Cloud Computing", ["cloud", "aws", "azure", "gcp"], {"Cloud & DevOps"}),
+        ("Data Analysis", ["data", "analytics", "analysis", "statistics"], {"Data & Analytics", "Databases"})
+    ]
+    
+    # Categorize each item by its keywords or the skills it mentions (one taxonomy scan per item)
     for item in experience_items:
         item_lower = item.lower()
-        if any(kw in item_lower for kw in ["program", "develop", "code", "software"]):
-            categories["Programming Experience"].append(item)
-        elif any(kw in item_lower for kw in ["machine", "learning", "ai", "neural", "model"]):
-            categories["Machine Learning & AI"].append(item)
-        elif any(kw in item_lower for kw in ["cloud", "aws", "azure", "gcp"]):
-            categories["Cloud Computing"].append(item)
-        elif any(kw in item_lower for kw in ["data", "analytics", "analysis", "statistics"]):
-            categories["Data Analysis"].append(item)
+        found_categories = set(skill_taxonomy.match(item).values())
+        for group, keywords, group_categories in experience_groups:
+            if any(kw in item_lower for kw in keywords) or found_categories & group_categories:
+                categories[group].append(item)
+                break
         else:
             categories["Companies & Roles"].append(item)
     
@@ -377,10 +382,12 @@ def display_matching_skills(skills, job_description):
         return
     
     job_desc = job_description.lower()
+    # Skills the job asks for, found with one scan of the description
+    job_skills = skill_taxonomy.match(job_description)
     
     matching_skills = []
     for skill in skills:
-        if skill.lower() in job_desc:
+        if skill.lower() in job_skills or skill.lower() in job_desc:
             matching_skills.append(skill)
     
     if matching_skills:
@@ -403,18 +410,14 @@ def display_matching_skills(skills, job_description):
             unsafe_allow_html=True
         )
     
-    # Identify missing skills
-    missing_skills = []
-    common_tech_skills = [
-        "python", "java", "javascript", "sql", "aws", "azure", 
-        "react", "node", "docker", "kubernetes", "machine learning",
-        "data science", "agile", "scrum", "git", "ci/cd"
+    # Identify technical skills the job asks for that the resume does not mention
+    resume_skills = {skill.lower() for skill in skills}
+    resume_skills.update(skill_taxonomy.match(" , ".join(skills)))
+    missing_skills = [
+        skill for skill, category in job_skills.items()
+        if category != "Soft Skills" and skill not in resume_skills
     ]
     
-    for tech in common_tech_skills:
-        if tech in job_desc and not any(tech.lower() in s.lower() for s in skills):
-            missing_skills.append(tech)
-    
     if missing_skills:
         st.markdown(f"""<h4 style="color: {COLORS['text_dark']}; margin-bottom: 12px; font-weight: 700;">⚠️ Skills to Emphasize or Develop</h4>""", unsafe_allow_html=True)
         missing_html = """<div style="display: flex; flex-wrap: wrap; gap: 10px; margin-bottom: 18px;">"""
@@ -428,6 +431,32 @@ def display_matching_skills(skills, job_description):
         missing_html += "</div>"
         st.markdown(missing_html, unsafe_allow_html=True)
 
+def display_timing_breakdown(timings):
+    """
+    Display how long each stage of a resume upload took.
+    
+    Args:
+        timings (dict): Trace dictionary recorded by utils.timing
+    """
+    spans = timings.get("spans", []) if timings else []
+    if not spans:
+        st.info("No timing information available.")
+        return
+    
+    total = timings.get("total_seconds") or 0
+    st.markdown(f"**Total time:** {total:.2f}s (logged at {timings.get('timestamp', 'unknown time')})")
+    
+    # Stages are listed in the order they started; nested stages overlap their parent
+    rows = []
+    for stage in sorted(spans, key=lambda s: s.get("offset_seconds") or 0):
+        rows.append({
+            "Stage": stage["stage"],
+            "Started at (s)": stage.get("offset_seconds"),
+            "Duration (s)": stage["seconds"],
+            "Share of total": f"{stage['seconds'] / total:.0%}" if total else "-"
+        })
+    st.dataframe(rows, hide_index=True, use_container_width=True)
+
 def apply_styling():
     """Apply custom CSS styling to make it look like a modern website."""
     st.markdown(f"""
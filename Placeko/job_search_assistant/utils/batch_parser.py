@@ -0,0 +1,225 @@
+"""
+Bulk resume ingestion.
+
+Parses folders of resumes in worker processes and streams the structured
+results to a JSONL file, one line per resume, so memory use stays flat no
+matter how many files are processed. Extracted text and spaCy docs are cached
+on disk, so after changing the extraction rules an archive can be reprocessed
+with --reextract without extracting the files or running NER again.
+
+Usage:
+    python -m utils.batch_parser resumes/ --output parsed_resumes.jsonl --n-process 4
+    python -m utils.batch_parser resumes/ --output parsed_resumes.jsonl --reextract
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from config import EXTRACTED_TEXT_CACHE_DIR, EXTRACTED_TEXT_CACHE_MAX_MB
+from utils.disk_cache import DiskCache, content_hash
+from utils.document_extractor import extract_document
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".txt")
+
+# Parser owned by each worker process, its mode and the extracted text cache (set by _init_worker)
+_worker_parser = None
+_worker_reextract = False
+_worker_text_cache = None
+
+
+def iter_resume_files(paths):
+    """
+    Expand files and directories into the resume files they contain.
+
+    Args:
+        paths (list): File or directory paths
+
+    Yields:
+        str: Path of each supported resume file
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, file_names in os.walk(path):
+                for file_name in sorted(file_names):
+                    if file_name.lower().endswith(SUPPORTED_EXTENSIONS):
+                        yield os.path.join(root, file_name)
+        elif path.lower().endswith(SUPPORTED_EXTENSIONS):
+            yield path
+        else:
+            print(f"Skipping unsupported file: {path}")
+
+def read_resume_file(path, text_cache=None):
+    """
+    Read the text content of a resume file.
+
+    Args:
+        path (str): Path to a PDF, DOCX or TXT file
+        text_cache (DiskCache, optional): Extracted texts keyed by file path, size and
+            modification time; a file that has not changed is not read again
+
+    Returns:
+        str: The extracted text
+    """
+    key = None
+    if text_cache is not None:
+        stat = os.stat(path)
+        key = content_hash(os.path.abspath(path), "extracted_text", stat.st_size, stat.st_mtime_ns)
+        text = text_cache.get(key)
+        if text is not None:
+            return text
+
+    with open(path, "rb") as f:
+        extracted = extract_document(f.read())
+    # Pages that ran out of time may extract fine next run, so only complete text is kept
+    if key is not None and "pdf_page_timeout" not in extracted["degraded_stages"]:
+        text_cache.set(key, extracted["text"])
+    return extracted["text"]
+
+def parse_resumes(texts, batch_size=50, n_process=1, use_rag=False, reextract=False):
+    """
+    Parse many resume texts, optionally across worker processes.
+
+    Args:
+        texts (iterable): Raw resume texts
+        batch_size (int): Number of texts sent to spaCy (and to each worker) at once
+        n_process (int): Number of worker processes (1 parses in this process)
+        use_rag (bool): Whether to run the OpenAI RAG enrichment for every resume
+        reextract (bool): Only re-run the rule-based stages over cached spaCy docs
+
+    Yields:
+        dict: Structured information for each resume, in input order (None for empty texts)
+    """
+    batches = _batched(texts, batch_size)
+    for results in _map_batches(_parse_text_batch, batches, n_process, use_rag, reextract):
+        yield from results
+
+def parse_resume_files(paths, output_path, batch_size=50, n_process=1, use_rag=False, reextract=False):
+    """
+    Parse resume files and append one JSON line per resume to the output file.
+
+    Args:
+        paths (list): Resume files or directories containing them
+        output_path (str): JSONL file to write results to
+        batch_size (int): Number of files handled by a worker at once
+        n_process (int): Number of worker processes (1 parses in this process)
+        use_rag (bool): Whether to run the OpenAI RAG enrichment for every resume
+        reextract (bool): Only re-run the rule-based stages over cached spaCy docs
+
+    Returns:
+        dict: Counts of parsed and failed files
+    """
+    counts = {"parsed": 0, "failed": 0}
+    file_batches = _batched(iter_resume_files(paths), batch_size)
+
+    with open(output_path, "w", encoding="utf-8") as output:
+        for records in _map_batches(_parse_file_batch, file_batches, n_process, use_rag, reextract):
+            for record in records:
+                counts["failed" if "error" in record else "parsed"] += 1
+                output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            # Flush per batch so progress is visible and nothing is held in memory
+            output.flush()
+
+    return counts
+
+def _batched(items, batch_size):
+    """Group an iterable into lists of at most batch_size items."""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _map_batches(func, batches, n_process, use_rag, reextract=False):
+    """
+    Apply func to each batch, in order, keeping only a few batches in flight.
+
+    Unlike Pool.imap, which drains the input iterable up front, this submits
+    new batches only as results are consumed, so memory stays bounded.
+    """
+    if n_process <= 1:
+        _init_worker(use_rag, reextract)
+        for batch in batches:
+            yield func(batch)
+        return
+
+    with multiprocessing.Pool(n_process, initializer=_init_worker, initargs=(use_rag, reextract)) as pool:
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.apply_async(func, (batch,)))
+            if len(pending) >= n_process * 2:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+
+def _init_worker(use_rag, reextract=False):
+    """Create the parser and extracted text cache used by the current process."""
+    global _worker_parser, _worker_reextract, _worker_text_cache
+    from utils.resume_parser import ResumeParser
+
+    _worker_parser = ResumeParser()
+    _worker_parser.use_rag = _worker_parser.use_rag and use_rag
+    _worker_reextract = reextract
+    _worker_text_cache = DiskCache(EXTRACTED_TEXT_CACHE_DIR, max_bytes=EXTRACTED_TEXT_CACHE_MAX_MB * 1024 * 1024)
+
+def _parse_text_batch(texts):
+    """Parse a batch of texts in the current process."""
+    if _worker_reextract:
+        return list(_worker_parser.reextract_resumes(texts, batch_size=len(texts)))
+    return list(_worker_parser.parse_resumes(texts, batch_size=len(texts)))
+
+def _parse_file_batch(paths):
+    """Read and parse a batch of files in the current process."""
+    records = []
+    texts = []
+    for path in paths:
+        start = time.perf_counter()
+        try:
+            texts.append(read_resume_file(path, _worker_text_cache))
+            records.append({"source": path})
+        except Exception as e:
+            records.append({"source": path, "error": f"Could not read file: {e}"})
+        records[-1]["read_seconds"] = round(time.perf_counter() - start, 4)
+
+    readable = [record for record in records if "error" not in record]
+    try:
+        for record, structured_data in zip(readable, _parse_text_batch(texts)):
+            if structured_data is None:
+                record["error"] = "No text could be extracted"
+            else:
+                record.update(structured_data)
+    except Exception as e:
+        for record in readable:
+            record["error"] = f"Could not parse resume: {e}"
+
+    return records
+
+def main(argv=None):
+    """Command line entry point."""
+    arg_parser = argparse.ArgumentParser(description="Parse a folder of resumes into a JSONL file.")
+    arg_parser.add_argument("paths", nargs="+", help="Resume files or directories")
+    arg_parser.add_argument("-o", "--output", default="parsed_resumes.jsonl", help="JSONL file to write")
+    arg_parser.add_argument("--batch-size", type=int, default=50, help="Resumes per spaCy batch")
+    arg_parser.add_argument("--n-process", type=int, default=max(1, (os.cpu_count() or 2) - 1),
+                            help="Number of worker processes")
+    arg_parser.add_argument("--rag", action="store_true", help="Also run the OpenAI RAG enrichment (slow, uses API credits)")
+    arg_parser.add_argument("--reextract", action="store_true",
+                            help="Only re-run the extraction rules over cached text and spaCy docs (implies no RAG)")
+    args = arg_parser.parse_args(argv)
+
+    start = time.perf_counter()
+    counts = parse_resume_files(args.paths, args.output, batch_size=args.batch_size, n_process=args.n_process,
+                                use_rag=args.rag and not args.reextract, reextract=args.reextract)
+    elapsed = time.perf_counter() - start
+
+    print(f"Parsed {counts['parsed']} resumes ({counts['failed']} failed) in {elapsed:.1f}s -> {args.output}")
+    return 0 if counts["parsed"] or not counts["failed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+def content_hash(text, *parts):
+    """
+    Build a stable cache key from a text and any values that affect its result.
+
+    Args:
+        text (str): The content being cached (e.g. resume text)
+        *parts: Extra values such as parser version or model name
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\0")
+    digest.update((text or "").encode("utf-8"))
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """
+    Persistent JSON cache with size-bounded least-recently-used eviction.
+
+    Each entry is stored as a JSON file named after its key. The access order
+    is kept in memory (seeded from file modification times, which are refreshed
+    on every hit) so the oldest entries are evicted once the directory grows
+    past max_bytes. Subclasses can store other formats by overriding
+    extension, _encode and _decode.
+    """
+
+    extension = ".json"
+
+    def __init__(self, cache_dir, max_bytes=100 * 1024 * 1024):
+        """
+        Open (or create) a cache directory.
+
+        Args:
+            cache_dir (str): Directory holding the cache entries
+            max_bytes (int): Maximum total size of the entries on disk
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._sizes = OrderedDict()
+        self._total_bytes = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        entries = []
+        for file_name in os.listdir(cache_dir):
+            if file_name.endswith(self.extension):
+                try:
+                    stat = os.stat(os.path.join(cache_dir, file_name))
+                    entries.append((stat.st_mtime, file_name[:-len(self.extension)], stat.st_size))
+                except OSError:
+                    continue
+        for _, key, size in sorted(entries):
+            self._sizes[key] = size
+            self._total_bytes += size
+
+    def get(self, key):
+        """
+        Return the cached value for a key, or None if it is not cached.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            The stored value or None
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = self._decode(f.read())
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+                self._forget(key)
+            return None
+
+        with self._lock:
+            self.hits += 1
+            if key in self._sizes:
+                self._sizes.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        """
+        Store a value and evict old entries if needed.
+
+        Args:
+            key (str): Cache key
+            value: JSON-serializable value
+        """
+        path = self._path(key)
+        data = self._encode(value)
+        if len(data) > self.max_bytes:
+            return
+
+        try:
+            # Write to a temporary file first so readers never see a partial entry
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing cache entry {key}: {e}")
+            return
+
+        with self._lock:
+            self._forget(key)
+            self._sizes[key] = len(data)
+            self._total_bytes += len(data)
+            self._evict()
+
+    def delete(self, key):
+        """Remove an entry from the cache."""
+        with self._lock:
+            self._forget(key)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def stats(self):
+        """
+        Return cache counters.
+
+        Returns:
+            dict: Hits, misses, hit rate, evictions, entry count and size on disk
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._sizes),
+                "bytes": self._total_bytes
+            }
+
+    def _path(self, key):
+        """Return the file path for a key."""
+        return os.path.join(self.cache_dir, f"{key}{self.extension}")
+
+    def _encode(self, value):
+        """Serialize a value to the bytes written to disk."""
+        return json.dumps(value, ensure_ascii=False).encode("utf-8")
+
+    def _decode(self, data):
+        """Deserialize the bytes read from disk."""
+        return json.loads(data)
+
+    def _forget(self, key):
+        """Drop a key from the size index. Caller must hold the lock."""
+        size = self._sizes.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _evict(self):
+        """Delete least recently used entries until under max_bytes. Caller must hold the lock."""
+        while self._total_bytes > self.max_bytes and self._sizes:
+            key, size = self._sizes.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
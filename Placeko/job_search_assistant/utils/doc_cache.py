@@ -0,0 +1,101 @@
+import time
+import spacy
+from spacy.tokens import DocBin
+from utils.disk_cache import DiskCache, content_hash
+from utils.nlp_service import DOC_ATTRS
+
+
+class DocCache(DiskCache):
+    """
+    Disk cache of processed spaCy docs, stored as serialized DocBin files.
+
+    Docs are keyed by text hash and model version, so the rule-based extraction
+    stages can be re-run over an archive of resumes after the rules change
+    without running the NER model again.
+    """
+
+    extension = ".spacy"
+
+    def __init__(self, cache_dir, max_bytes=500 * 1024 * 1024):
+        """
+        Open (or create) a doc cache directory.
+
+        Args:
+            cache_dir (str): Directory holding the serialized docs
+            max_bytes (int): Maximum total size of the docs on disk
+        """
+        super().__init__(cache_dir, max_bytes=max_bytes)
+        self._vocab = None
+
+    @staticmethod
+    def key(text, model_version):
+        """
+        Build the cache key for a text processed by a model.
+
+        Args:
+            text (str): The processed text
+            model_version (str): Model name and version, e.g. NLPModel.model_version
+
+        Returns:
+            str: Cache key
+        """
+        return content_hash(text, "doc", model_version)
+
+    def to_cache_vocab(self, doc):
+        """
+        Return the doc backed by the same vocab as the docs loaded from this cache.
+
+        spaCy can only merge docs that share a vocab, and docs fresh from the
+        model use the model's vocab.
+        """
+        vocab = self._get_vocab()
+        if doc.vocab is vocab:
+            return doc
+        return next(DocBin(attrs=DOC_ATTRS, docs=[doc]).get_docs(vocab))
+
+    def _get_vocab(self):
+        """Blank vocab that cached docs are loaded into (so no model has to be loaded)."""
+        if self._vocab is None:
+            self._vocab = spacy.blank("en").vocab
+        return self._vocab
+
+    def _encode(self, doc):
+        """Serialize a doc with the annotations the extraction rules use."""
+        return DocBin(attrs=DOC_ATTRS, docs=[doc]).to_bytes()
+
+    def _decode(self, data):
+        """Deserialize a doc against the cache's blank vocab."""
+        try:
+            return next(DocBin().from_bytes(data).get_docs(self._get_vocab()))
+        except Exception as e:
+            # Treat corrupt entries as misses, like invalid JSON in DiskCache
+            raise ValueError(f"Invalid DocBin data: {e}") from e
+
+
+if __name__ == "__main__":
+    # Benchmark: running NER vs. loading the cached docs for a small archive
+    import tempfile
+    from utils.nlp_model import nlp_model
+
+    paragraph = ("Senior Software Engineer at Acme Corp from Jan 2019 - Present building Python "
+                 "microservices on AWS with Docker and Kubernetes. Master of Science in Computer "
+                 "Science, Stanford University. ")
+    texts = [f"Candidate {i}\n" + paragraph * 20 for i in range(200)]
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = DocCache(cache_dir)
+        model_version = nlp_model.model_version
+        nlp_model.get()
+
+        start = time.perf_counter()
+        for text, doc in zip(texts, nlp_model.pipe(texts)):
+            cache.set(DocCache.key(text, model_version), doc)
+        ner_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        docs = [cache.get(DocCache.key(text, model_version)) for text in texts]
+        load_seconds = time.perf_counter() - start
+
+        assert all(doc is not None and doc.text == text for doc, text in zip(docs, texts))
+        print(f"{len(texts)} resumes: NER + store {ner_seconds:.2f}s, load cached docs {load_seconds:.2f}s "
+              f"({ner_seconds / load_seconds:.0f}x), {cache.stats()['bytes'] / 1024:.0f} KiB on disk")
@@ -0,0 +1,331 @@
+import io
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+import PyPDF2
+import docx
+from config import PDF_MAX_PAGES, PDF_PAGE_TIMEOUT_SECONDS, PDF_TIMEOUT_SECONDS, PDF_PARALLEL_MIN_PAGES, PDF_PAGES_PER_TASK
+
+PDF_MIME_TYPE = "application/pdf"
+DOCX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+TEXT_MIME_TYPE = "text/plain"
+
+# MIME type -> function taking a binary stream and returning its "text" and any
+# "degraded_stages" (parts of the document that were skipped)
+EXTRACTORS = {}
+
+# Process pool shared by all PDF extractions (created on first use)
+_pdf_executor = None
+_pdf_executor_lock = threading.Lock()
+
+def register_extractor(mime_type):
+    """
+    Register a text extractor for a MIME type.
+
+    Args:
+        mime_type (str): The MIME type handled by the decorated function
+
+    Returns:
+        callable: Decorator that adds the function to EXTRACTORS
+    """
+    def decorator(func):
+        EXTRACTORS[mime_type] = func
+        return func
+    return decorator
+
+def sniff_mime_type(buffer):
+    """
+    Detect a document's MIME type from its leading bytes rather than its file name.
+
+    Args:
+        buffer (memoryview): The document content
+
+    Returns:
+        str: The detected MIME type (plain text if nothing else matches)
+    """
+    header = bytes(buffer[:8])
+    if header.startswith(b"%PDF-"):
+        return PDF_MIME_TYPE
+    if header.startswith(b"PK\x03\x04"):
+        # DOCX files are ZIP archives containing word/document.xml
+        try:
+            with zipfile.ZipFile(io.BytesIO(buffer)) as archive:
+                if "word/document.xml" in archive.namelist():
+                    return DOCX_MIME_TYPE
+        except zipfile.BadZipFile:
+            pass
+    return TEXT_MIME_TYPE
+
+def extract_text(source):
+    """
+    Extract text from an uploaded document without writing it to disk.
+
+    Args:
+        source: Raw bytes, a memoryview, or a binary file-like object such as a
+            Streamlit UploadedFile or BytesIO
+
+    Returns:
+        str: The extracted text
+    """
+    return extract_document(source)["text"]
+
+def extract_document(source):
+    """
+    Extract text from an uploaded document, reporting anything that was skipped.
+
+    Args:
+        source: Raw bytes, a memoryview, or a binary file-like object such as a
+            Streamlit UploadedFile or BytesIO
+
+    Returns:
+        dict: The extracted "text" and its "degraded_stages": "truncated_pages" when
+            pages past PDF_MAX_PAGES were skipped, "pdf_page_timeout" when pages ran
+            out of time
+    """
+    buffer = _as_memoryview(source)
+    extractor = EXTRACTORS[sniff_mime_type(buffer)]
+    return extractor(buffer)
+
+@register_extractor(PDF_MIME_TYPE)
+def extract_pdf_text(buffer):
+    """Extract the text of every PDF page, joined once at the end."""
+    result = extract_pdf_pages(buffer)
+    degraded_stages = []
+    if result["truncated"]:
+        degraded_stages.append("truncated_pages")
+    if any(page["timed_out"] for page in result["pages"]):
+        degraded_stages.append("pdf_page_timeout")
+    return {"text": result["text"], "degraded_stages": degraded_stages}
+
+def extract_pdf_pages(buffer, max_pages=PDF_MAX_PAGES, page_timeout=PDF_PAGE_TIMEOUT_SECONDS,
+                      timeout=PDF_TIMEOUT_SECONDS, parallel_min_pages=PDF_PARALLEL_MIN_PAGES,
+                      pages_per_task=PDF_PAGES_PER_TASK):
+    """
+    Extract PDF text page by page, fanning long documents out to worker processes.
+
+    Pages are split into chunks of pages_per_task and extracted in a process pool
+    once the document has at least parallel_min_pages pages; shorter documents are
+    extracted in this process. Page order is always preserved.
+
+    A single page is only interrupted after page_timeout in a process's main
+    thread (SIGALRM), so callers on other threads (e.g. Streamlit sessions)
+    always use the pool. Whatever has not finished when the overall timeout
+    runs out is skipped.
+
+    Args:
+        buffer (memoryview): The PDF content
+        max_pages (int): Maximum number of pages to extract (later pages are skipped)
+        page_timeout (float): Seconds allowed per page before it is skipped
+        timeout (float): Seconds allowed for the whole document
+        parallel_min_pages (int): Page count from which the process pool is used
+        pages_per_task (int): Number of pages sent to a worker at once
+
+    Returns:
+        dict: "text", per-page "pages" timings, "page_count" and whether the
+            document was "truncated" by max_pages
+    """
+    deadline = time.monotonic() + timeout if timeout else None
+    pdf_bytes = bytes(buffer)
+    page_count = len(PyPDF2.PdfReader(io.BytesIO(pdf_bytes)).pages)
+    pages_to_read = min(page_count, max_pages) if max_pages else page_count
+
+    ranges = [(start, min(start + pages_per_task, pages_to_read)) for start in range(0, pages_to_read, pages_per_task)]
+    pages = []
+    # Pool workers (e.g. the batch CLI) are daemonic and cannot start their own pool.
+    # On a single core the pool only adds overhead, unless this thread cannot
+    # interrupt a stuck page itself.
+    can_interrupt = hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+    use_pool = (
+        pages_to_read > 0
+        and (not can_interrupt or (pages_to_read >= parallel_min_pages and (os.cpu_count() or 1) > 1))
+        and not multiprocessing.current_process().daemon
+    )
+    if use_pool:
+        executor = _get_pdf_executor()
+        futures = [executor.submit(_extract_page_range, pdf_bytes, start, end, page_timeout) for start, end in ranges]
+        for (start, end), future in zip(ranges, futures):
+            try:
+                remaining = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+                pages.extend(future.result(timeout=remaining))
+            except FutureTimeoutError:
+                # Chunks still queued are dropped; a running one finishes in the background
+                future.cancel()
+                pages.extend(_timed_out_pages(start, end, 0.0))
+            except Exception as e:
+                print(f"Error extracting PDF pages {start + 1}-{end}: {e}")
+                pages.extend(_timed_out_pages(start, end, 0.0))
+    else:
+        pages = _extract_page_range(pdf_bytes, 0, pages_to_read, page_timeout, deadline)
+
+    return {
+        "text": "\n".join(page["text"] for page in pages),
+        "pages": [{key: value for key, value in page.items() if key != "text"} for page in pages],
+        "page_count": page_count,
+        "truncated": pages_to_read < page_count
+    }
+
+def _get_pdf_executor():
+    """Return the shared PDF extraction process pool."""
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is None:
+            # Forking is unsafe from a multithreaded process (Streamlit serves each
+            # session on its own thread), so workers come from a clean server process
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            _pdf_executor = ProcessPoolExecutor(max_workers=os.cpu_count() or 2,
+                                                mp_context=multiprocessing.get_context(start_method))
+        return _pdf_executor
+
+def _extract_page_range(pdf_bytes, start, end, page_timeout, deadline=None):
+    """Extract pages [start, end) of a PDF, timing each page and skipping those past the deadline."""
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    pages = []
+    for page_number in range(start, end):
+        if deadline is not None and time.monotonic() >= deadline:
+            pages.extend(_timed_out_pages(page_number, end, 0.0))
+            break
+        page_start = time.perf_counter()
+        timed_out = False
+        try:
+            text = _extract_page_text(pdf_reader.pages[page_number], page_timeout)
+        except _PageTimeout:
+            text = ""
+            timed_out = True
+        pages.append({
+            "page": page_number + 1,
+            "text": text,
+            "seconds": round(time.perf_counter() - page_start, 4),
+            "timed_out": timed_out
+        })
+    return pages
+
+def _timed_out_pages(start, end, seconds):
+    """Placeholder results for pages whose worker did not answer in time."""
+    return [{"page": page_number + 1, "text": "", "seconds": seconds, "timed_out": True}
+            for page_number in range(start, end)]
+
+
+class _PageTimeout(Exception):
+    """Raised when a single page takes longer than its time budget."""
+
+
+def _raise_page_timeout(signum, frame):
+    """SIGALRM handler that aborts the page being extracted."""
+    raise _PageTimeout()
+
+def _extract_page_text(page, page_timeout):
+    """
+    Extract one page's text, interrupting it after page_timeout seconds.
+
+    The timeout relies on SIGALRM, so it only applies in the main thread of a
+    process on Unix (always the case in pool workers); elsewhere the page is
+    extracted without a limit.
+    """
+    can_interrupt = (
+        page_timeout
+        and hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+    if not can_interrupt:
+        return page.extract_text() or ""
+
+    previous_handler = signal.signal(signal.SIGALRM, _raise_page_timeout)
+    signal.setitimer(signal.ITIMER_REAL, page_timeout)
+    try:
+        return page.extract_text() or ""
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+@register_extractor(DOCX_MIME_TYPE)
+def extract_docx_text(buffer):
+    """Extract the paragraph text of a Word document."""
+    document = docx.Document(io.BytesIO(buffer))
+    return {"text": "\n".join(paragraph.text for paragraph in document.paragraphs), "degraded_stages": []}
+
+@register_extractor(TEXT_MIME_TYPE)
+def extract_plain_text(buffer):
+    """Decode a plain text document, ignoring undecodable bytes."""
+    return {"text": str(buffer, "utf-8", errors="ignore"), "degraded_stages": []}
+
+def _as_memoryview(source):
+    """Return a memoryview over the document content, avoiding copies where possible."""
+    if isinstance(source, memoryview):
+        return source
+    if isinstance(source, (bytes, bytearray)):
+        return memoryview(source)
+    if hasattr(source, "getbuffer"):
+        # BytesIO (and Streamlit's UploadedFile) expose their buffer directly
+        return source.getbuffer()
+    if hasattr(source, "seek"):
+        source.seek(0)
+    return memoryview(source.read())
+
+
+def synthetic_pdf(page_count, lines_per_page=45):
+    """
+    Build a minimal PDF whose pages each contain lines_per_page lines of text.
+
+    Used by the benchmark below and the tests.
+
+    Args:
+        page_count (int): Number of pages
+        lines_per_page (int): Lines of text on each page
+
+    Returns:
+        bytes: The PDF content
+    """
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page_number in range(page_count):
+        lines = " ".join(
+            f"(Page {page_number + 1} line {line}: Python, AWS, Docker and Kubernetes experience.) Tj T*"
+            for line in range(lines_per_page)
+        )
+        stream = f"BT /F1 10 Tf 12 TL 40 760 Td {lines} ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        page_ids.append(len(objects))
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {page_count} >>"
+
+    output = io.BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1"))
+    xref_offset = output.tell()
+    output.write(f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1"))
+    for offset in offsets:
+        output.write(f"{offset:010d} 00000 n \n".encode("latin-1"))
+    output.write(f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode("latin-1"))
+    return output.getvalue()
+
+
+if __name__ == "__main__":
+    # Benchmark: serial vs. parallel extraction of synthetic 1/10/50-page PDFs
+    for page_count in (1, 10, 50):
+        pdf = memoryview(synthetic_pdf(page_count))
+        start = time.perf_counter()
+        serial = extract_pdf_pages(pdf, parallel_min_pages=page_count + 1)
+        if (os.cpu_count() or 1) == 1:
+            print(f"{page_count:>2} pages: serial {(time.perf_counter() - start) * 1000:.0f} ms "
+                  f"(single CPU, parallel extraction disabled)")
+            continue
+        serial_ms = (time.perf_counter() - start) * 1000
+
+        _get_pdf_executor()  # start the pool outside the timed section
+        start = time.perf_counter()
+        parallel = extract_pdf_pages(pdf, parallel_min_pages=1)
+        parallel_ms = (time.perf_counter() - start) * 1000
+
+        slowest = max(page["seconds"] for page in parallel["pages"]) * 1000
+        same = "identical" if serial["text"] == parallel["text"] else "DIFFERENT"
+        print(f"{page_count:>2} pages: serial {serial_ms:.0f} ms, parallel {parallel_ms:.0f} ms, "
+              f"slowest page {slowest:.1f} ms, text {same}")
@@ -0,0 +1,86 @@
+import time
+import numpy as np
+from langchain.embeddings.base import Embeddings
+from langchain.embeddings import OpenAIEmbeddings
+from sklearn.feature_extraction.text import HashingVectorizer
+from config import OPENAI_API_KEY, EMBEDDING_BACKEND
+
+class LocalHashingEmbeddings(Embeddings):
+    """
+    Fully local embeddings built from hashed character n-grams.
+
+    No model download or network access is needed, so retrieval over resume
+    chunks works offline. All texts passed to embed_documents are vectorized
+    in one call and the vectors are L2-normalized, so FAISS distances rank
+    chunks by cosine similarity of their n-gram profiles.
+    """
+
+    def __init__(self, n_features=1024, ngram_range=(3, 5)):
+        """
+        Configure the vectorizer.
+
+        Args:
+            n_features (int): Embedding dimension (number of hash buckets)
+            ngram_range (tuple): Smallest and largest character n-gram sizes
+        """
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+        self.model = f"local-hashing-char{ngram_range[0]}-{ngram_range[1]}-{n_features}"
+        self._vectorizer = HashingVectorizer(
+            analyzer="char_wb",
+            ngram_range=ngram_range,
+            n_features=n_features,
+            alternate_sign=False,
+            lowercase=True,
+            norm="l2"
+        )
+
+    def embed_documents(self, texts):
+        """Embed a list of texts in one vectorized call."""
+        if not texts:
+            return []
+        vectors = self._vectorizer.transform(texts).toarray().astype(np.float32)
+        return vectors.tolist()
+
+    def embed_query(self, text):
+        """Embed a single query."""
+        return self.embed_documents([text])[0]
+
+
+def get_embeddings(backend=None):
+    """
+    Create the embeddings backend used for resume retrieval.
+
+    Args:
+        backend (str, optional): "openai", "local" or "auto" (OpenAI when an API key
+            is configured, local otherwise). Defaults to EMBEDDING_BACKEND.
+
+    Returns:
+        Embeddings: A langchain embeddings object
+    """
+    backend = (backend or EMBEDDING_BACKEND).lower()
+    if backend == "auto":
+        backend = "openai" if OPENAI_API_KEY else "local"
+
+    if backend == "openai":
+        return OpenAIEmbeddings(openai_api_key=OPENAI_API_KEY)
+    if backend == "local":
+        return LocalHashingEmbeddings()
+    raise ValueError(f"Unknown embedding backend: {backend}")
+
+
+if __name__ == "__main__":
+    # Benchmark: embed the chunks of a synthetic resume with each available backend
+    chunk = (
+        "Senior Software Engineer at Acme Corp, Jan 2019 - Present. Built microservices in "
+        "Python and Node.js on AWS, introduced CI/CD with Jenkins, and led an agile team. "
+    ) * 6
+    chunks = [f"{i}. {chunk}" for i in range(20)]
+
+    backends = ["local"] + (["openai"] if OPENAI_API_KEY else [])
+    for name in backends:
+        embeddings = get_embeddings(name)
+        start = time.perf_counter()
+        vectors = embeddings.embed_documents(chunks)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"{name:>6}: {len(vectors)} chunks x {len(vectors[0])} dims in {elapsed:.1f} ms")
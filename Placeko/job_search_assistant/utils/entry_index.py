@@ -0,0 +1,171 @@
+import math
+import re
+import time
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+class EntryIndex:
+    """
+    Ordered collection of resume entries (education or experience) with
+    near-constant-time duplicate checks.
+
+    Entries are normalized to lowercase alphanumeric tokens and indexed by
+    token and by word shingles (3-word windows). A new entry is rejected when
+    most of its shingles already appear in one existing entry, which catches
+    repeated lines and the near-identical context windows produced around
+    neighbouring entities, while windows that add new text are kept, and
+    mentions() answers "does any entry contain this text?" by checking only
+    the entries that contain every token of the text.
+    """
+
+    def __init__(self, shingle_size=3, overlap_threshold=0.8):
+        """
+        Create an empty index.
+
+        Args:
+            shingle_size (int): Number of words per shingle
+            overlap_threshold (float): Fraction of a new entry's shingles that must
+                appear in one existing entry for it to count as a duplicate
+        """
+        self.shingle_size = shingle_size
+        self.overlap_threshold = overlap_threshold
+        self.entries = []
+        self._normalized = []
+        self._shingle_sets = []
+        self._keys = set()
+        self._token_postings = {}
+        self._shingle_postings = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def mentions(self, text):
+        """
+        Check whether any entry contains the text (ignoring case and punctuation).
+
+        Args:
+            text (str): Text to look for, e.g. an entity name
+
+        Returns:
+            bool: True if an existing entry contains it
+        """
+        tokens = _tokenize(text)
+        if not tokens:
+            return False
+        postings = [self._token_postings.get(token) for token in set(tokens)]
+        if not all(postings):
+            return False
+
+        # Intersect starting from the rarest token so the candidate set stays small
+        postings.sort(key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            candidates = candidates & posting
+            if not candidates:
+                return False
+
+        needle = f" {' '.join(tokens)} "
+        return any(needle in self._normalized[entry_id] for entry_id in candidates)
+
+    def is_duplicate(self, text):
+        """
+        Check whether the text is the same as, or mostly contained in, an existing entry.
+
+        Args:
+            text (str): Candidate entry
+
+        Returns:
+            bool: True if the text duplicates an existing entry
+        """
+        tokens = _tokenize(text)
+        if not tokens:
+            return True
+        if " ".join(tokens) in self._keys:
+            return True
+
+        shingles = self._shingles(tokens)
+        required = math.ceil(self.overlap_threshold * len(shingles))
+        # An entry sharing `required` shingles must contain at least one of the
+        # rarest len - required + 1 of them, so only those are looked up
+        postings = sorted((self._shingle_postings.get(shingle, ()) for shingle in shingles), key=len)
+        candidates = set()
+        for posting in postings[:len(shingles) - required + 1]:
+            candidates.update(posting)
+        return any(len(shingles & self._shingle_sets[entry_id]) >= required for entry_id in candidates)
+
+    def add(self, text):
+        """
+        Add an entry unless it duplicates an existing one.
+
+        Args:
+            text (str): Entry to add (stored as given, stripped)
+
+        Returns:
+            bool: True if the entry was added
+        """
+        text = text.strip()
+        if not text or self.is_duplicate(text):
+            return False
+
+        tokens = _tokenize(text)
+        entry_id = len(self.entries)
+        self.entries.append(text)
+        self._normalized.append(f" {' '.join(tokens)} ")
+        self._keys.add(" ".join(tokens))
+        shingles = self._shingles(tokens)
+        self._shingle_sets.append(shingles)
+        for token in set(tokens):
+            self._token_postings.setdefault(token, set()).add(entry_id)
+        for shingle in shingles:
+            self._shingle_postings.setdefault(shingle, set()).add(entry_id)
+        return True
+
+    def _shingles(self, tokens):
+        """Return the set of word shingles for a token list."""
+        if len(tokens) <= self.shingle_size:
+            return {tuple(tokens)}
+        return {tuple(tokens[i:i + self.shingle_size]) for i in range(len(tokens) - self.shingle_size + 1)}
+
+
+def _tokenize(text):
+    """Lowercase alphanumeric tokens of a text."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+if __name__ == "__main__":
+    # Self-check and timing on synthetic resumes producing hundreds to thousands of entities
+    for entity_count in (300, 1000, 3000):
+        companies = [f"Company{i} Corp" for i in range(entity_count)]
+        text = " ".join(
+            f"Senior Engineer at {name} from 2010 to 2012 building data pipelines and services."
+            for name in companies
+        )
+        # Context windows around each entity, as extract_information builds them
+        contexts = []
+        for name in companies:
+            position = text.index(name)
+            contexts.append((name, text[max(0, position - 150):position + len(name) + 150].strip()))
+
+        start = time.perf_counter()
+        naive = []
+        for name, context in contexts:
+            if not any(name in existing for existing in naive):
+                naive.append(context)
+        naive_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        index = EntryIndex()
+        for name, context in contexts:
+            if not index.mentions(name):
+                index.add(context)
+        indexed_ms = (time.perf_counter() - start) * 1000
+
+        assert all(index.mentions(name) for name in companies), "every entity should be covered"
+        assert len(index) <= len(naive), "index should not keep more entries than the substring scan"
+        assert not index.add(contexts[0][1].upper()), "case-only variants are duplicates"
+        print(f"{entity_count:>4} entities: substring scan kept {len(naive)} entries in {naive_ms:.1f} ms, "
+              f"index kept {len(index)} in {indexed_ms:.1f} ms")
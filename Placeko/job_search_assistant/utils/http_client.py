@@ -0,0 +1,129 @@
+import threading
+import time
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import (
+    HTTP_CONNECT_TIMEOUT_SECONDS, HTTP_READ_TIMEOUT_SECONDS, HTTP_MAX_RETRIES,
+    HTTP_RETRY_BACKOFF_SECONDS, HTTP_POOL_HOSTS, HTTP_POOL_PER_HOST
+)
+
+
+class HTTPClient:
+    """
+    Shared HTTP session for outgoing requests.
+
+    Connections are kept alive and reused per host, every request gets a
+    connect and read timeout, idempotent requests are retried with backoff
+    (except probes, which must answer quickly or not at all), and the latency of
+    each host is recorded so slow upstreams show up in stats().
+    """
+
+    def __init__(self, connect_timeout=HTTP_CONNECT_TIMEOUT_SECONDS, read_timeout=HTTP_READ_TIMEOUT_SECONDS,
+                 max_retries=HTTP_MAX_RETRIES, backoff=HTTP_RETRY_BACKOFF_SECONDS,
+                 pool_hosts=HTTP_POOL_HOSTS, pool_per_host=HTTP_POOL_PER_HOST):
+        """
+        Create the session.
+
+        Args:
+            connect_timeout (float): Seconds to wait for a connection
+            read_timeout (float): Seconds to wait between bytes of the response
+            max_retries (int): Retries for GET/HEAD requests on connection errors, 429 and 5xx
+            backoff (float): Base delay between retries, doubled after each attempt
+            pool_hosts (int): Number of hosts to keep connection pools for
+            pool_per_host (int): Connections kept open per host; requests beyond it use a
+                temporary connection instead of waiting for one
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self.session = _session(HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_per_host,
+                                            pool_block=False, max_retries=retry))
+        self._probe_session = _session(HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_per_host,
+                                                   pool_block=False, max_retries=0))
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def request(self, method, url, timeout=None, retry=True, **kwargs):
+        """
+        Send a request through the shared session.
+
+        Args:
+            method (str): HTTP method
+            url (str): Request URL
+            timeout (float or tuple, optional): Overrides the default (connect, read) timeout
+            retry (bool): False for probes (health checks, link checks), which are sent
+                once so they never take longer than their timeout
+            **kwargs: Passed on to requests (params, json, headers, ...)
+
+        Returns:
+            requests.Response: The response (after any retries)
+        """
+        session = self.session if retry else self._probe_session
+        start = time.perf_counter()
+        failed = False
+        try:
+            return session.request(method, url, timeout=timeout or self.timeout, **kwargs)
+        except requests.RequestException:
+            failed = True
+            raise
+        finally:
+            self._record(urlsplit(url).netloc, time.perf_counter() - start, failed)
+
+    def get(self, url, **kwargs):
+        """Send a GET request."""
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        """Send a HEAD request."""
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        """Send a POST request (never retried)."""
+        return self.request("POST", url, **kwargs)
+
+    def stats(self):
+        """
+        Latency counters per host since the process started.
+
+        Returns:
+            dict: host -> requests, errors, average and maximum latency in milliseconds
+        """
+        with self._lock:
+            return {
+                host: {
+                    "requests": counters["requests"],
+                    "errors": counters["errors"],
+                    "avg_ms": round(counters["total_seconds"] / counters["requests"] * 1000, 1),
+                    "max_ms": round(counters["max_seconds"] * 1000, 1)
+                }
+                for host, counters in self._stats.items()
+            }
+
+    def _record(self, host, seconds, failed):
+        """Add one request to the host's counters."""
+        with self._lock:
+            counters = self._stats.setdefault(host, {"requests": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0})
+            counters["requests"] += 1
+            counters["errors"] += failed
+            counters["total_seconds"] += seconds
+            counters["max_seconds"] = max(counters["max_seconds"], seconds)
+
+
+def _session(adapter):
+    """Create a session sending http and https requests through the adapter."""
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Process-wide client shared by the job searchers and the NLP service client
+http_client = HTTPClient()
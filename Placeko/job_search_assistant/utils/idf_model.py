@@ -0,0 +1,272 @@
+import os
+import re
+import threading
+import numpy as np
+from config import IDF_MODEL_PATH, IDF_MAX_TERMS, IDF_MAX_DOCUMENTS, IDF_SAVE_DELAY_SECONDS
+from utils.disk_cache import content_hash
+from utils.skill_taxonomy import skill_taxonomy
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+
+class IDFModel:
+    """
+    Inverse document frequencies learned from job postings and resumes.
+
+    Terms are the words of each document plus the taxonomy skills it mentions
+    (so phrases such as "machine learning" get their own weight). Document
+    frequencies live in a numpy array indexed through a vocabulary dict, so
+    new documents can be added incrementally and many terms are weighted in
+    one vectorized operation. Each document is counted once, by a 64-bit hash
+    of its id.
+
+    The model stays bounded: once the vocabulary passes max_terms it is pruned
+    to the most frequent terms (pruned terms are weighted as unseen, which is
+    close to their true weight), and only the ids of the latest max_documents
+    documents are remembered.
+    """
+
+    def __init__(self, max_terms=IDF_MAX_TERMS, max_documents=IDF_MAX_DOCUMENTS):
+        """
+        Create an empty model.
+
+        Args:
+            max_terms (int): Vocabulary size that triggers pruning
+            max_documents (int): Number of document ids remembered
+        """
+        self.max_terms = max_terms
+        self.max_documents = max_documents
+        self.vocab = {}
+        self.doc_freq = np.zeros(1024, dtype=np.int32)
+        self.n_docs = 0
+        # Document id hashes in insertion order (a dict used as an ordered set)
+        self.doc_ids = {}
+        self._lock = threading.Lock()
+        self._save_timer = None
+
+    def __len__(self):
+        return len(self.vocab)
+
+    def __getstate__(self):
+        # Locks and timers cannot be pickled (models are sent to worker processes)
+        state = self.__dict__.copy()
+        del state["_lock"], state["_save_timer"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._save_timer = None
+
+    def add_document(self, text, doc_id=None):
+        """
+        Count the terms of a document.
+
+        Args:
+            text (str): Document text
+            doc_id (str, optional): Stable id used to skip documents already counted
+                (defaults to a hash of the text)
+
+        Returns:
+            bool: True if the document was new
+        """
+        doc_hash = _doc_hash(doc_id or content_hash(text))
+        if not text or doc_hash in self.doc_ids:
+            return False
+
+        terms = document_terms(text)
+        with self._lock:
+            if doc_hash in self.doc_ids:
+                return False
+            indices = [self._index(term) for term in terms]
+            if indices:
+                self.doc_freq[np.array(indices, dtype=np.int64)] += 1
+            self.doc_ids[doc_hash] = None
+            if len(self.doc_ids) > self.max_documents:
+                del self.doc_ids[next(iter(self.doc_ids))]
+            self.n_docs += 1
+            if len(self.vocab) > self.max_terms:
+                self._prune()
+        return True
+
+    def add_job(self, job):
+        """
+        Count a job posting (title and description).
+
+        Args:
+            job (dict): Job with "title", "company" and "description"
+
+        Returns:
+            bool: True if the job was new
+        """
+        text = f"{job.get('title', '')}\n{job.get('description', '')}"
+        doc_id = "job:" + content_hash(job.get("url") or "", job.get("title"), job.get("company"))
+        return self.add_document(text, doc_id)
+
+    def weights(self, terms):
+        """
+        Return the smoothed IDF weight of each term.
+
+        Unknown terms get the highest weight, as if they occurred in no document.
+
+        Args:
+            terms (list): Terms (lowercased internally)
+
+        Returns:
+            numpy.ndarray: One weight per term
+        """
+        indices = np.fromiter((self.vocab.get(term.lower(), -1) for term in terms), dtype=np.int64, count=len(terms))
+        doc_freq = np.where(indices >= 0, self.doc_freq[np.maximum(indices, 0)], 0)
+        return np.log((1 + self.n_docs) / (1 + doc_freq)) + 1.0
+
+    def rank(self, term_counts, limit):
+        """
+        Rank terms by TF-IDF, most discriminative first.
+
+        With an empty model every weight is equal, so this falls back to plain
+        frequency order (ties keep their input order).
+
+        Args:
+            term_counts (dict): Term -> frequency in the resume (e.g. a Counter)
+            limit (int): Maximum number of terms returned
+
+        Returns:
+            list: The top terms
+        """
+        terms = list(term_counts)
+        if not terms or limit <= 0:
+            return []
+        scores = np.fromiter(term_counts.values(), dtype=np.float64, count=len(terms)) * self.weights(terms)
+        order = np.argsort(-scores, kind="stable")[:limit]
+        return [terms[i] for i in order]
+
+    def save(self, path=IDF_MODEL_PATH):
+        """
+        Write the model to a compressed .npz file.
+
+        The vocabulary is stored as one newline-joined UTF-8 buffer (terms in
+        index order, never containing newlines), next to their frequencies and
+        the document id hashes.
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._lock:
+                terms = np.frombuffer("\n".join(self.vocab).encode("utf-8"), dtype=np.uint8)
+                doc_freq = self.doc_freq[:len(self.vocab)].copy()
+                n_docs = self.n_docs
+                doc_ids = np.fromiter(self.doc_ids, dtype=np.uint64, count=len(self.doc_ids))
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp.npz"
+            np.savez_compressed(tmp_path, terms=terms, doc_freq=doc_freq, n_docs=np.array(n_docs), doc_ids=doc_ids)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error saving IDF model: {e}")
+
+    def save_later(self, path=IDF_MODEL_PATH, delay=IDF_SAVE_DELAY_SECONDS):
+        """
+        Save the model in a background thread after a delay.
+
+        Calls made while a save is pending are folded into it, so a burst of
+        uploads or saved jobs writes the file once, off the request thread.
+
+        Args:
+            path (str): The .npz file
+            delay (float): Seconds to wait before writing
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                return
+            self._save_timer = threading.Timer(delay, self._save_pending, args=(path,))
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def _save_pending(self, path):
+        """Run a save scheduled by save_later."""
+        with self._lock:
+            self._save_timer = None
+        self.save(path)
+
+    @classmethod
+    def load(cls, path=IDF_MODEL_PATH):
+        """
+        Read a model saved with save(), or return an empty one.
+
+        Args:
+            path (str): The .npz file
+
+        Returns:
+            IDFModel: The loaded model
+        """
+        model = cls()
+        if not os.path.exists(path):
+            return model
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                terms = data["terms"].tobytes().decode("utf-8").split("\n") if data["terms"].size else []
+                model.vocab = {term: i for i, term in enumerate(terms)}
+                model.doc_freq = np.zeros(max(1024, len(terms) * 2), dtype=np.int32)
+                model.doc_freq[:len(terms)] = data["doc_freq"]
+                model.n_docs = int(data["n_docs"])
+                model.doc_ids = dict.fromkeys(int(doc_hash) for doc_hash in data["doc_ids"])
+        except (OSError, ValueError, KeyError, UnicodeDecodeError) as e:
+            print(f"Error loading IDF model: {e}")
+            return cls()
+        return model
+
+    def _index(self, term):
+        """Return the array index of a term, growing the vocabulary if needed."""
+        index = self.vocab.get(term)
+        if index is None:
+            index = len(self.vocab)
+            self.vocab[term] = index
+            if index >= len(self.doc_freq):
+                self.doc_freq = np.concatenate([self.doc_freq, np.zeros(len(self.doc_freq), dtype=np.int32)])
+        return index
+
+    def _prune(self):
+        """
+        Keep the most frequent terms, down to 80% of max_terms so pruning is not
+        repeated for every new document. Caller must hold the lock.
+        """
+        terms = list(self.vocab)
+        keep = np.sort(np.argsort(-self.doc_freq[:len(terms)], kind="stable")[:int(self.max_terms * 0.8)])
+        doc_freq = self.doc_freq[keep]
+        self.vocab = {terms[i]: new_index for new_index, i in enumerate(keep)}
+        self.doc_freq = np.zeros(max(1024, self.max_terms + 1), dtype=np.int32)
+        self.doc_freq[:len(doc_freq)] = doc_freq
+
+
+def _doc_hash(doc_id):
+    """Return a 64-bit hash of a document id."""
+    return int(content_hash(doc_id)[:16], 16)
+
+
+def document_terms(text):
+    """Return the distinct terms of a document: lowercase words and taxonomy skills."""
+    terms = set(WORD_PATTERN.findall(text.lower()))
+    terms.update(skill_taxonomy.match(text))
+    return terms
+
+
+# Model shared by the keyword extractor (loaded on first use)
+_idf_model = None
+_idf_model_lock = threading.Lock()
+
+def get_idf_model(path=IDF_MODEL_PATH):
+    """
+    Return the shared IDF model, loading it and counting any saved jobs it has not seen.
+
+    Returns:
+        IDFModel: The shared model
+    """
+    global _idf_model
+    with _idf_model_lock:
+        if _idf_model is None:
+            from utils.job_storage import load_saved_jobs
+
+            _idf_model = IDFModel.load(path)
+            added = sum(_idf_model.add_job(job) for job in load_saved_jobs())
+            if added:
+                _idf_model.save(path)
+        return _idf_model
@@ -1,10 +1,10 @@
 
-import requests
 from bs4 import BeautifulSoup
 import time
 import random
 import re
 from datetime import datetime, timedelta
+from utils.http_client import http_client
 
 class JobScraper:
     """Job scraper for multiple platforms."""
@@ -41,7 +41,7 @@ class JobScraper:
     def verify_url(self, url):
         """Verify that a URL is valid and reachable."""
         try:
-            response = requests.head(url, timeout=5)
+            response = http_client.head(url, timeout=5, retry=False)
             return response.status_code < 400
         except:
             return False
@@ -0,0 +1,207 @@
+import subprocess
+import sys
+import threading
+from importlib import metadata
+import spacy
+from spacy.tokens import Doc
+from config import SPACY_MODEL, SPACY_EXCLUDED_PIPES, NLP_SERVICE_URL, NER_CHUNK_CHARS
+from utils.nlp_service import NLPServiceClient
+
+class NLPModel:
+    """
+    Lazily loaded spaCy pipeline shared by the resume parsing tools.
+    
+    When a shared NLP service is configured and reachable, texts are sent there
+    instead and the model is only loaded in this process as a fallback. Texts
+    longer than max_chunk_chars are processed in windows split at line or word
+    boundaries and merged back into one doc, so no input exceeds nlp.max_length.
+    """
+    
+    def __init__(self, model_name=SPACY_MODEL, exclude=None, service_url=NLP_SERVICE_URL,
+                 max_chunk_chars=NER_CHUNK_CHARS):
+        """
+        Configure the model without loading it.
+        
+        Args:
+            model_name (str): Name of the installed spaCy package to load
+            exclude (list, optional): Pipeline components to skip when loading
+            service_url (str, optional): Base URL of a shared NLP service (see utils.nlp_service)
+            max_chunk_chars (int): Longest text processed in one piece
+        """
+        self.model_name = model_name
+        self.exclude = list(SPACY_EXCLUDED_PIPES if exclude is None else exclude)
+        self.service = NLPServiceClient(service_url) if service_url else None
+        self.max_chunk_chars = max_chunk_chars
+        self._nlp = None
+        self._lock = threading.Lock()
+        self._warm_up_thread = None
+    
+    @property
+    def model_version(self):
+        """
+        Installed version of the model package, read without loading the model.
+        
+        Returns:
+            str: e.g. "en_core_web_lg-3.7.1" (the spaCy version if the package metadata is missing)
+        """
+        try:
+            version = metadata.version(self.model_name)
+        except metadata.PackageNotFoundError:
+            version = f"spacy{spacy.__version__}"
+        return f"{self.model_name}-{version}"
+    
+    @property
+    def is_loaded(self):
+        """Whether the pipeline has already been loaded."""
+        return self._nlp is not None
+    
+    def get(self):
+        """
+        Return the loaded pipeline, loading it on first use.
+        
+        Returns:
+            spacy.language.Language: The spaCy pipeline
+        """
+        if self._nlp is None:
+            with self._lock:
+                # Another thread may have finished loading while we waited
+                if self._nlp is None:
+                    self._nlp = self._load()
+        return self._nlp
+    
+    def __call__(self, text):
+        """Run the pipeline over a single text."""
+        return next(iter(self.pipe([text])))
+    
+    def pipe(self, texts, batch_size=50):
+        """
+        Run the pipeline over many texts.
+        
+        Args:
+            texts (iterable): Texts to process
+            batch_size (int): Number of texts processed (or sent to the service) together
+            
+        Yields:
+            spacy.tokens.Doc: One doc per text, in input order
+        """
+        chunk_counts = []
+        
+        def chunks():
+            for text in texts:
+                parts = split_text(text, self.max_chunk_chars)
+                chunk_counts.append(len(parts))
+                yield from parts
+        
+        # A text's chunk count is recorded before its first chunk is processed
+        pending = []
+        text_index = 0
+        for doc in self._pipe_chunks(chunks(), batch_size):
+            pending.append(doc)
+            while text_index < len(chunk_counts) and len(pending) >= chunk_counts[text_index]:
+                count = chunk_counts[text_index]
+                yield pending[0] if count == 1 else Doc.from_docs(pending[:count], ensure_whitespace=False)
+                del pending[:count]
+                text_index += 1
+    
+    def _pipe_chunks(self, texts, batch_size):
+        """Run texts no longer than max_chunk_chars through the service or the local model."""
+        if not self._use_service():
+            yield from self.get().pipe(texts, batch_size=batch_size)
+            return
+        
+        batch = []
+        for text in texts:
+            batch.append(text)
+            if len(batch) >= batch_size:
+                yield from self._parse_remote(batch)
+                batch = []
+        if batch:
+            yield from self._parse_remote(batch)
+    
+    def _use_service(self):
+        """Whether texts should be sent to the shared NLP service."""
+        return self.service is not None and self.service.available()
+    
+    def _parse_remote(self, texts):
+        """Process texts on the service, falling back to the local model if it fails."""
+        if self._use_service():
+            try:
+                return self.service.parse(texts)
+            except Exception as e:
+                print(f"NLP service error, falling back to in-process model: {e}")
+                self.service.mark_unavailable()
+        return list(self.get().pipe(texts))
+    
+    def warm_up(self):
+        """
+        Start loading the pipeline in a background thread.
+        
+        Returns:
+            threading.Thread: The loader thread (or None if already loaded)
+        """
+        if self._nlp is not None or self._use_service():
+            return None
+        if self._warm_up_thread is None or not self._warm_up_thread.is_alive():
+            self._warm_up_thread = threading.Thread(target=self._warm_up, name="spacy-warm-up", daemon=True)
+            self._warm_up_thread.start()
+        return self._warm_up_thread
+    
+    def _warm_up(self):
+        """Load the pipeline, reporting failures instead of raising in the thread."""
+        try:
+            self.get()
+        except Exception as e:
+            print(f"Error warming up spaCy model {self.model_name}: {e}")
+    
+    def _load(self):
+        """Load the spaCy package, downloading it if it is not installed yet."""
+        try:
+            return spacy.load(self.model_name, exclude=self.exclude)
+        except OSError:
+            print(f"spaCy model {self.model_name} not found. Downloading...")
+            subprocess.run([sys.executable, "-m", "spacy", "download", self.model_name], check=True)
+            return spacy.load(self.model_name, exclude=self.exclude)
+
+
+def split_text(text, max_chars):
+    """
+    Split a text into consecutive pieces of at most max_chars characters.
+    
+    Pieces end after a newline where possible (otherwise after a space), so
+    joining them gives back the original text and entities are rarely cut.
+    
+    Args:
+        text (str): Text to split
+        max_chars (int): Maximum piece length (None or 0 to never split)
+        
+    Returns:
+        list: The pieces, in order (a single piece for short texts)
+    """
+    if not max_chars or len(text) <= max_chars:
+        return [text]
+    
+    pieces = []
+    start = 0
+    while len(text) - start > max_chars:
+        end = start + max_chars
+        cut = text.rfind("\n", start + max_chars // 2, end)
+        if cut == -1:
+            cut = text.rfind(" ", start + max_chars // 2, end)
+        # No break in the second half of the window: cut mid-word
+        end = cut + 1 if cut != -1 else end
+        pieces.append(text[start:end])
+        start = end
+    pieces.append(text[start:])
+    return pieces
+
+
+# Process-wide model instance used by the parser
+nlp_model = NLPModel()
+
+def get_nlp():
+    """Return the shared spaCy pipeline, loading it on first use."""
+    return nlp_model.get()
+
+def warm_up_nlp():
+    """Start loading the shared spaCy pipeline in the background."""
+    return nlp_model.warm_up()
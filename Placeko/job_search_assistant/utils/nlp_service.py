@@ -0,0 +1,216 @@
+"""
+Shared spaCy NER service.
+
+One process owns the spaCy model and serves named-entity requests from any
+number of app processes over localhost HTTP, so N Streamlit workers share a
+single model instead of loading N copies. Requests arriving within a short
+batching window are processed together with nlp.pipe.
+
+Usage:
+    python -m utils.nlp_service --port 8765
+    NLP_SERVICE_URL=http://127.0.0.1:8765 streamlit run app.py
+"""
+import argparse
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import requests
+import spacy
+from spacy.tokens import DocBin
+from config import NLP_SERVICE_TIMEOUT_SECONDS
+from utils.http_client import http_client
+
+# Entity annotations are all the clients need
+DOC_ATTRS = ["ORTH", "SPACY", "ENT_IOB", "ENT_TYPE", "ENT_KB_ID"]
+
+
+class NLPService:
+    """Batch NER requests from many clients onto one spaCy model."""
+
+    def __init__(self, model, batch_window_ms=20, max_batch_size=64):
+        """
+        Configure the batcher.
+
+        Args:
+            model (NLPModel): The model holder to run requests through
+            batch_window_ms (int): How long to wait for more requests before running a batch
+            max_batch_size (int): Maximum number of texts processed in one batch
+        """
+        self.model = model
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.requests_served = 0
+        self.batches_run = 0
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="nlp-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, texts):
+        """
+        Queue texts for NER.
+
+        Args:
+            texts (list): Texts to process
+
+        Returns:
+            Future: Resolves to the serialized DocBin bytes for the texts
+        """
+        future = Future()
+        self._queue.put((texts, future))
+        return future
+
+    def _run(self):
+        """Collect requests for one batching window, then process them together."""
+        nlp = self.model.get()
+        while True:
+            pending = [self._queue.get()]
+            text_count = len(pending[0][0])
+            deadline = time.monotonic() + self.batch_window
+            while text_count < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                pending.append(item)
+                text_count += len(item[0])
+
+            try:
+                docs = list(nlp.pipe([text for texts, _ in pending for text in texts], batch_size=self.max_batch_size))
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+                continue
+
+            position = 0
+            for texts, future in pending:
+                doc_bin = DocBin(attrs=DOC_ATTRS, docs=docs[position:position + len(texts)])
+                position += len(texts)
+                future.set_result(doc_bin.to_bytes())
+            self.requests_served += len(pending)
+            self.batches_run += 1
+
+
+def _make_handler(service):
+    """Build the HTTP request handler class bound to a service."""
+
+    class NLPRequestHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != "/health":
+                self.send_error(404)
+                return
+            body = json.dumps({
+                "model": service.model.model_name,
+                "requests_served": service.requests_served,
+                "batches_run": service.batches_run
+            }).encode("utf-8")
+            self._respond(200, "application/json", body)
+
+        def do_POST(self):
+            if self.path != "/ner":
+                self.send_error(404)
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                texts = json.loads(self.rfile.read(length))["texts"]
+                body = service.submit([str(text) for text in texts]).result()
+            except Exception as e:
+                self.send_error(500, str(e))
+                return
+            self._respond(200, "application/octet-stream", body)
+
+        def _respond(self, status, content_type, body):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Keep the console quiet; request counts are exposed on /health
+            pass
+
+    return NLPRequestHandler
+
+
+class NLPServiceClient:
+    """Client for the shared NER service."""
+
+    def __init__(self, url, timeout=NLP_SERVICE_TIMEOUT_SECONDS, retry_after=30):
+        """
+        Configure the client.
+
+        Args:
+            url (str): Base URL of the service, e.g. http://127.0.0.1:8765
+            timeout (float): Seconds to wait for an NER response
+            retry_after (float): Seconds to wait before re-checking an unreachable service
+        """
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._available = None
+        self._checked_at = 0.0
+        self._vocab = spacy.blank("en").vocab
+
+    def available(self):
+        """Whether the service answered its health check (re-checked periodically when down)."""
+        if self._available is None or (not self._available and time.monotonic() - self._checked_at > self.retry_after):
+            try:
+                response = http_client.get(f"{self.url}/health", timeout=2, retry=False)
+                self._available = response.status_code == 200
+            except requests.RequestException:
+                self._available = False
+            self._checked_at = time.monotonic()
+        return self._available
+
+    def mark_unavailable(self):
+        """Fall back to local processing until the next health check."""
+        self._available = False
+        self._checked_at = time.monotonic()
+
+    def parse(self, texts):
+        """
+        Run NER for texts on the service.
+
+        Args:
+            texts (list): Texts to process
+
+        Returns:
+            list: spaCy Doc objects with entity annotations, in input order
+        """
+        response = http_client.post(f"{self.url}/ner", json={"texts": list(texts)}, timeout=self.timeout)
+        response.raise_for_status()
+        return list(DocBin().from_bytes(response.content).get_docs(self._vocab))
+
+
+def main(argv=None):
+    """Command line entry point."""
+    from utils.nlp_model import nlp_model
+
+    arg_parser = argparse.ArgumentParser(description="Serve spaCy NER to several app processes.")
+    arg_parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (keep this local)")
+    arg_parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    arg_parser.add_argument("--batch-window-ms", type=int, default=20, help="Batching window in milliseconds")
+    arg_parser.add_argument("--max-batch-size", type=int, default=64, help="Maximum texts per batch")
+    args = arg_parser.parse_args(argv)
+
+    print(f"Loading spaCy model {nlp_model.model_name}...")
+    nlp_model.get()
+    service = NLPService(nlp_model, batch_window_ms=args.batch_window_ms, max_batch_size=args.max_batch_size)
+    server = ThreadingHTTPServer((args.host, args.port), _make_handler(service))
+    print(f"NLP service listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
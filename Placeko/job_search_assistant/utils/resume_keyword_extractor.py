@@ -1,7 +1,46 @@
 
 
+import multiprocessing
 import re
+import time
 from collections import Counter
+from utils.idf_model import get_idf_model
+from utils.skill_matcher import SkillMatcher
+from utils.skill_taxonomy import skill_taxonomy
+
+WORD_PATTERN = re.compile(r'\b\w+\b')
+
+# Common job titles
+JOB_TITLES = [
+    "software engineer", "software developer", "web developer", "frontend developer",
+    "backend developer", "full stack developer", "data scientist", "data analyst",
+    "machine learning engineer", "devops engineer", "site reliability engineer",
+    "cloud engineer", "systems administrator", "database administrator",
+    "quality assurance engineer", "qa engineer", "product manager", "project manager",
+    "ux designer", "ui designer", "graphic designer", "network engineer",
+    "security engineer", "business analyst", "data engineer", "solutions architect",
+    "technical lead", "engineering manager", "cto", "cio", "ceo"
+]
+JOB_TITLE_ORDER = {title: i for i, title in enumerate(JOB_TITLES)}
+
+# Roles inferred from skills when no title is found, in order of precedence
+ROLE_TERMS = [
+    ("data scientist", ["data science", "machine learning", "ai", "artificial intelligence",
+                        "deep learning", "statistics", "python", "r", "tensorflow", "pytorch"]),
+    ("frontend developer", ["frontend", "front-end", "react", "angular", "vue", "javascript",
+                            "html", "css", "ui", "ux", "design"]),
+    ("backend developer", ["backend", "back-end", "server", "api", "database", "sql",
+                           "nosql", "django", "flask", "node", "express", "spring"]),
+    ("devops engineer", ["devops", "aws", "azure", "gcp", "cloud", "docker", "kubernetes",
+                         "ci/cd", "jenkins", "deployment", "infrastructure"])
+]
+
+# Compiled once per process and shared by every extractor (and batch worker)
+job_title_matcher = SkillMatcher(JOB_TITLES)
+role_term_matcher = SkillMatcher({term: role for role, terms in ROLE_TERMS for term in terms})
+
+# Extractor owned by each batch worker process (created by _init_worker)
+_worker_extractor = None
 
 class ResumeKeywordExtractor:
     """
@@ -9,48 +48,27 @@ class ResumeKeywordExtractor:
     This extracts technical skills, experience-related keywords, and potential job titles.
     """
     
-    def __init__(self):
-        """Initialize the keyword extractor with common technical terms."""
-        # Common technical skills to look for
-        self.tech_keywords = {
-            "languages": [
-                "python", "java", "javascript", "typescript", "c++", "c#", "ruby", 
-                "go", "rust", "swift", "kotlin", "php", "scala", "perl", "r", 
-                "html", "css", "sql"
-            ],
-            "frameworks": [
-                "react", "angular", "vue", "django", "flask", "spring", "express", 
-                "rails", "laravel", "asp.net", "bootstrap", "jquery", "tensorflow",
-                "pytorch", "keras", "scikit-learn", "pandas", "numpy"
-            ],
-            "platforms": [
-                "aws", "azure", "gcp", "google cloud", "heroku", "docker", "kubernetes",
-                "jenkins", "gitlab", "github", "bitbucket", "linux", "windows", "mac",
-                "ios", "android"
-            ],
-            "concepts": [
-                "api", "rest", "graphql", "microservices", "ci/cd", "agile", "scrum",
-                "devops", "testing", "unit testing", "integration testing", "git",
-                "version control", "database", "sql", "nosql", "machine learning",
-                "deep learning", "data science", "big data", "blockchain", "cloud",
-                "security", "authentication", "authorization"
-            ]
-        }
+    def __init__(self, idf_model=None):
+        """
+        Initialize the keyword extractor with the skill taxonomy and common job titles.
+        
+        Args:
+            idf_model (IDFModel, optional): Term weights used to rank generic keywords
+                (defaults to the model learned from saved jobs and resumes)
+        """
+        self.idf_model = idf_model if idf_model is not None else get_idf_model()
+        # Worker pool reused across extract_batch calls, with the (n_process, n_docs) it was built for
+        self._pool = None
+        self._pool_key = None
+        # Shared skill taxonomy; every category except soft skills counts as technical
+        self.taxonomy = skill_taxonomy
+        self.non_technical_categories = {"Soft Skills"}
         
         # Common job titles
-        self.job_titles = [
-            "software engineer", "software developer", "web developer", "frontend developer",
-            "backend developer", "full stack developer", "data scientist", "data analyst",
-            "machine learning engineer", "devops engineer", "site reliability engineer",
-            "cloud engineer", "systems administrator", "database administrator",
-            "quality assurance engineer", "qa engineer", "product manager", "project manager",
-            "ux designer", "ui designer", "graphic designer", "network engineer",
-            "security engineer", "business analyst", "data engineer", "solutions architect",
-            "technical lead", "engineering manager", "cto", "cio", "ceo"
-        ]
+        self.job_titles = JOB_TITLES
         
-        # Additional stopwords specific to resumes
-        self.resume_stopwords = [
+        # Additional stopwords specific to resumes (a set, as it is checked for every word)
+        self.resume_stopwords = {
             "resume", "curriculum", "vitae", "cv", "objective", "summary", "experience",
             "education", "skills", "references", "projects", "achievements", "responsibilities",
             "phone", "email", "address", "linkedin", "github", "portfolio", "website",
@@ -60,7 +78,7 @@ class ResumeKeywordExtractor:
             "both", "each", "few", "more", "most", "other", "some", "such", "no",
             "nor", "not", "only", "own", "same", "so", "than", "too", "very", "s",
             "t", "can", "will", "just", "don", "should", "now"
-        ]
+        }
     
     def extract_keywords(self, resume_data, max_keywords=10):
         """
@@ -84,32 +102,19 @@ class ResumeKeywordExtractor:
         all_text.extend(skills)
         
         # Process experience to extract important terms
-        experience = resume_data.get("experience", [])
-        experience_text = " ".join(experience)
-        
-        # Tokenize experience text
         try:
-            # Simple word extraction using regex
-            experience_words = re.findall(r'\b\w+\b', experience_text.lower())
-            experience_words = [word for word in experience_words if word not in self.resume_stopwords and len(word) > 2]
-            all_text.extend(experience_words)
+            all_text.extend(self._content_words(resume_data.get("experience", [])))
         except Exception as e:
             print(f"Error processing experience: {e}")
         
         # Add education keywords
-        education = resume_data.get("education", [])
-        education_text = " ".join(education)
-        education_words = re.findall(r'\b\w+\b', education_text.lower())
-        education_words = [word for word in education_words if word not in self.resume_stopwords and len(word) > 2]
-        all_text.extend(education_words)
-        
-        # Check for technical keywords that appear in the resume
-        technical_terms = []
-        for category, terms in self.tech_keywords.items():
-            for term in terms:
-                # Check if term appears in the skills or experience
-                if term in " ".join(all_text).lower():
-                    technical_terms.append(term)
+        all_text.extend(self._content_words(resume_data.get("education", [])))
+        
+        # Find the technical skills that appear in the skills or experience in one scan
+        technical_terms = [
+            skill for skill, category in self.taxonomy.match(" ".join(all_text)).items()
+            if category not in self.non_technical_categories
+        ]
         
         # Add any detected technical terms
         all_text.extend(technical_terms)
@@ -117,31 +122,39 @@ class ResumeKeywordExtractor:
         # Count the frequency of each term
         keyword_counter = Counter(all_text)
         
-        # Get the most common keywords, prioritizing skills and technical terms
-        # First add all skills
+        # Get the most common keywords, prioritizing skills and technical terms.
+        # Lowercased picks are kept in a set so duplicate checks are constant time.
         final_keywords = []
-        for skill in skills:
-            if skill.lower() not in [k.lower() for k in final_keywords]:
-                final_keywords.append(skill)
-                if len(final_keywords) >= max_keywords:
-                    return final_keywords
+        seen = set()
         
-        # Then add technical terms not already included
-        for term in technical_terms:
-            if term.lower() not in [k.lower() for k in final_keywords]:
-                final_keywords.append(term)
-                if len(final_keywords) >= max_keywords:
-                    return final_keywords
+        def add(keyword):
+            """Add a keyword unless already picked; return True once the list is full."""
+            if keyword.lower() not in seen:
+                seen.add(keyword.lower())
+                final_keywords.append(keyword)
+                return len(final_keywords) >= max_keywords
+            return False
+        
+        # First add all skills, then technical terms not already included
+        for keyword in list(skills) + technical_terms:
+            if add(keyword):
+                return final_keywords
         
-        # Then add the most common remaining terms
-        for keyword, _ in keyword_counter.most_common(max_keywords * 2):  # Get more than needed to filter
+        # Then add the remaining terms that best set this resume apart from the corpus
+        # (TF-IDF; plain frequency while the corpus is empty)
+        for keyword in self.idf_model.rank(keyword_counter, max_keywords * 2):  # Get more than needed to filter
             if len(final_keywords) >= max_keywords:
                 break
-            if keyword.lower() not in [k.lower() for k in final_keywords]:
-                final_keywords.append(keyword)
+            add(keyword)
         
         return final_keywords
     
+    def _content_words(self, texts):
+        """Lowercase words longer than two characters that are not resume stopwords."""
+        # Join and lowercase once, then filter with set lookups
+        words = WORD_PATTERN.findall(" ".join(texts).lower())
+        return [word for word in words if len(word) > 2 and word not in self.resume_stopwords]
+    
     def extract_job_title(self, resume_data):
         """
         Extract the most likely job title from the resume data.
@@ -157,45 +170,147 @@ class ResumeKeywordExtractor:
         
         # Look for title in experience
         experience = resume_data.get("experience", [])
-        experience_text = " ".join(experience).lower()
         
-        # Check if any job titles appear in the experience
-        matching_titles = []
-        for title in self.job_titles:
-            if title in experience_text:
-                matching_titles.append(title)
+        # Find every known job title in the experience with one scan
+        matching_titles = job_title_matcher.find(" ".join(experience))
         
         if matching_titles:
-            # Return the longest matching title (usually more specific)
-            return max(matching_titles, key=len)
+            # Return the longest matching title (usually more specific), earliest in JOB_TITLES on ties
+            return max(matching_titles, key=lambda title: (len(title), -JOB_TITLE_ORDER[title]))
         
-        # If no title found, infer from skills
+        # If no title found, infer the role from the skills (one scan for all role terms)
         skills = resume_data.get("skills", [])
-        skills_text = " ".join(skills).lower()
-        
-        # Check for data science/ML keywords
-        data_science_terms = ["data science", "machine learning", "ai", "artificial intelligence", 
-                              "deep learning", "statistics", "python", "r", "tensorflow", "pytorch"]
-        if any(term in skills_text for term in data_science_terms):
-            return "data scientist"
-        
-        # Check for frontend keywords
-        frontend_terms = ["frontend", "front-end", "react", "angular", "vue", "javascript", 
-                          "html", "css", "ui", "ux", "design"]
-        if any(term in skills_text for term in frontend_terms):
-            return "frontend developer"
-        
-        # Check for backend keywords
-        backend_terms = ["backend", "back-end", "server", "api", "database", "sql", 
-                         "nosql", "django", "flask", "node", "express", "spring"]
-        if any(term in skills_text for term in backend_terms):
-            return "backend developer"
-        
-        # Check for devops keywords
-        devops_terms = ["devops", "aws", "azure", "gcp", "cloud", "docker", "kubernetes", 
-                        "ci/cd", "jenkins", "deployment", "infrastructure"]
-        if any(term in skills_text for term in devops_terms):
-            return "devops engineer"
+        found_roles = set(role_term_matcher.find(" ".join(skills)))
+        for role, _ in ROLE_TERMS:
+            if role in found_roles:
+                return role
         
         # Default to software engineer as a safe fallback
-        return "software engineer"
\ No newline at end of file
+        return "software engineer"
+    
+    def extract_batch(self, resumes, max_keywords=10, n_process=1, chunk_size=20):
+        """
+        Extract search keywords and job titles for many resumes.
+        
+        Workers get a copy of this extractor's IDF model, so pooled and serial
+        extraction rank keywords the same way. The pool is kept for later calls
+        and rebuilt when the model has counted new documents (see close()).
+        
+        Args:
+            resumes (iterable): Parsed resume data dicts
+            max_keywords (int): The maximum number of keywords per resume
+            n_process (int): Number of worker processes (1 extracts in this process)
+            chunk_size (int): Number of resumes sent to a worker at once
+            
+        Returns:
+            list: One dict per resume, in input order, with "keywords", "job_title"
+                and the "seconds" spent on it
+        """
+        resumes = list(resumes)
+        if n_process <= 1 or len(resumes) <= chunk_size:
+            return [self.extract_search_terms(resume_data, max_keywords) for resume_data in resumes]
+        
+        pool_key = (n_process, self.idf_model.n_docs)
+        if self._pool_key != pool_key:
+            self.close()
+            self._pool = multiprocessing.Pool(n_process, initializer=_init_worker, initargs=(self.idf_model,))
+            self._pool_key = pool_key
+        # starmap keeps the input order
+        return self._pool.starmap(_extract_in_worker, ((resume_data, max_keywords) for resume_data in resumes),
+                                  chunksize=chunk_size)
+    
+    def close(self):
+        """Shut down the worker pool used by extract_batch, if any."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+            self._pool_key = None
+    
+    def extract_search_terms(self, resume_data, max_keywords=10):
+        """
+        Extract the search keywords and job title for one resume, timing the work.
+        
+        Args:
+            resume_data (dict): The parsed resume data
+            max_keywords (int): The maximum number of keywords to return
+            
+        Returns:
+            dict: "keywords", "job_title" and "seconds"
+        """
+        start = time.perf_counter()
+        keywords = self.extract_keywords(resume_data, max_keywords)
+        job_title = self.extract_job_title(resume_data)
+        return {
+            "keywords": keywords,
+            "job_title": job_title,
+            "seconds": round(time.perf_counter() - start, 6)
+        }
+
+
+def _init_worker(idf_model):
+    """Create the extractor used by the current worker process, with the parent's IDF model."""
+    global _worker_extractor
+    _worker_extractor = ResumeKeywordExtractor(idf_model=idf_model)
+
+def _extract_in_worker(resume_data, max_keywords):
+    """Extract search terms for one resume in a worker process."""
+    return _worker_extractor.extract_search_terms(resume_data, max_keywords)
+
+
+if __name__ == "__main__":
+    # Benchmark: indexed extraction vs. the list-based scans it replaces, on long experience sections
+    import time
+
+    def list_based_keywords(extractor, resume_data, max_keywords=10):
+        """The previous implementation: list stopwords and list-rebuilding duplicate checks."""
+        stopwords = list(extractor.resume_stopwords)
+        skills = resume_data.get("skills", [])
+        all_text = list(skills)
+        for field in ("experience", "education"):
+            words = re.findall(r'\b\w+\b', " ".join(resume_data.get(field, [])).lower())
+            all_text.extend(word for word in words if word not in stopwords and len(word) > 2)
+        technical_terms = [skill for skill, category in extractor.taxonomy.match(" ".join(all_text)).items()
+                           if category not in extractor.non_technical_categories]
+        all_text.extend(technical_terms)
+        final_keywords = []
+        for keyword in skills + technical_terms:
+            if keyword.lower() not in [k.lower() for k in final_keywords]:
+                final_keywords.append(keyword)
+                if len(final_keywords) >= max_keywords:
+                    return final_keywords
+        for keyword, _ in Counter(all_text).most_common(max_keywords * 2):
+            if len(final_keywords) >= max_keywords:
+                break
+            if keyword.lower() not in [k.lower() for k in final_keywords]:
+                final_keywords.append(keyword)
+        return final_keywords
+
+    from utils.idf_model import IDFModel
+
+    # An empty IDF model ranks by frequency, like the previous implementation
+    extractor = ResumeKeywordExtractor(idf_model=IDFModel())
+    entry = ("Senior Software Engineer at Acme Corp, Jan 2019 - Present. Designed and built the "
+             "payments platform in Python and Go on AWS with Docker and Kubernetes, mentored the "
+             "team, and owned the CI/CD pipeline and the on-call rotation for all of the services.")
+    for entries in (10, 100, 1000):
+        resume_data = {
+            "skills": ["Python", "Go", "AWS", "Docker"],
+            "experience": [entry] * entries,
+            "education": ["Master of Science in Computer Science, Stanford University"]
+        }
+        runs = 20
+
+        start = time.perf_counter()
+        for _ in range(runs):
+            expected = list_based_keywords(extractor, resume_data)
+        list_ms = (time.perf_counter() - start) * 1000 / runs
+
+        start = time.perf_counter()
+        for _ in range(runs):
+            keywords = extractor.extract_keywords(resume_data)
+        indexed_ms = (time.perf_counter() - start) * 1000 / runs
+
+        assert keywords == expected, "indexed extraction must return the same keywords"
+        print(f"{entries:>4} experience entries: list-based {list_ms:.2f} ms, indexed {indexed_ms:.2f} ms "
+              f"({list_ms / indexed_ms:.1f}x)")
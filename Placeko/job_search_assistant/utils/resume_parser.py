@@ -1,70 +1,540 @@
 
-import spacy
-import os
-import tempfile
 import re
-from langchain.document_loaders import PyPDFLoader
+import json
+import time
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from langchain.vectorstores import FAISS
-from langchain.embeddings import OpenAIEmbeddings
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain.chains import RetrievalQA
 from langchain.llms import OpenAI
-from config import OPENAI_API_KEY
+from spacy.tokens import Doc
+from config import OPENAI_API_KEY, PARSE_CACHE_DIR, PARSE_CACHE_MAX_MB, VECTOR_STORE_CACHE_DIR, DOC_CACHE_DIR, DOC_CACHE_MAX_MB
+from config import PARSE_MAX_CHARS, PARSE_TIME_BUDGET_SECONDS, RESUME_VERSIONS_DIR, RESUME_VERSIONS_MAX_MB
+from utils.disk_cache import DiskCache, content_hash
+from utils.doc_cache import DocCache
+from utils.embeddings import get_embeddings
+from utils.entry_index import EntryIndex
+from utils.nlp_model import nlp_model, split_text
+from utils.section_segmenter import section_segmenter
+from utils.skill_taxonomy import skill_taxonomy
+from utils.timing import span, record_since
+from utils.vector_store_cache import VectorStoreCache
+
+# Bump whenever extraction logic changes so cached results are not reused
+PARSER_VERSION = 7
+
+# Chunking used for the RAG vector store
+RAG_CHUNK_SIZE = 1000
+RAG_CHUNK_OVERLAP = 200
+
+# Sections whose edits can change the RAG answers (other edits reuse the previous ones)
+# Sections the RAG questions never draw on; an edit confined to these keeps the previous answers
+RAG_INDEPENDENT_LABELS = ("summary", "certifications", "references")
+
+# Per-section RAG questions (used when the structured extraction cannot be parsed)
+RAG_QUESTIONS = {
+    "skills": "What are all the technical skills, programming languages, and tools mentioned in this resume? List only the names of the skills without explanations.",
+    "education": "Extract all education details including institutions, degrees, majors, and graduation dates from this resume.",
+    "experience": "Extract all work experience details including company names, job titles, dates, and key responsibilities from this resume."
+}
+
+# Single retrieval query and prompt covering all sections at once
+RAG_STRUCTURED_QUERY = "technical skills, programming languages, tools, education, degrees, work experience, job titles, companies"
+RAG_STRUCTURED_K = 6
+RAG_STRUCTURED_PROMPT = """Use the following excerpts from a resume to extract the candidate's details.
+
+{context}
+
+Return only a JSON object with the following structure:
+{{
+    "skills": ["names of technical skills, programming languages and tools, without explanations"],
+    "education": ["one entry per degree with institution, degree, major and graduation date"],
+    "experience": ["one entry per role with company name, job title, dates and key responsibilities"]
+}}
+"""
+
+# Degrees ("Master of Science") or institution names. The run of words before an
+# institution is bounded so long whitespace-rich text cannot cause heavy backtracking.
+EDUCATION_PATTERN = re.compile(
+    r'(?:(?:Bachelor|Master|PhD|B\.S\.|M\.S\.|M\.B\.A\.|B\.A\.|B\.Sc\.|M\.Sc\.|B\.Tech|M\.Tech)\s+(?:of|in)\s+[A-Za-z\s]{1,100})'
+    r'|(?:\b[A-Za-z][A-Za-z\s]{0,100}University|College|Institute)'
+)
+
+# Employment date ranges such as "Jan 2019 - Present" that start each job entry
+DATE_RANGE_PATTERN = re.compile(
+    r'\b(Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August|Sep|September|Oct|October|Nov|November|Dec|December|\d{1,2}/\d{1,2}|\d{4})'
+    r'[-\s]{1,10}(to|-)[-\s]{1,10}'
+    r'(Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August|Sep|September|Oct|October|Nov|November|Dec|December|\d{1,2}/\d{1,2}|\d{4}|Present|present|Current|current)\b'
+)
+
+# Email addresses, used as a stable identity of a resume's owner
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+
+
+def resume_owner_key(text):
+    """
+    Identify whose resume a text is, so edited versions can be matched across sessions.
+    
+    Only the owner's email address is used: anything shared between people, such
+    as the uploaded file name, would let one user's resume become another's baseline.
+    
+    Args:
+        text (str): The raw text content of the resume
+        
+    Returns:
+        str: The first email address in the text (lowercased), or None if there is none
+    """
+    match = EMAIL_PATTERN.search(text or "")
+    return match.group(0).lower() if match else None
+
+def _section_hashes(text, sections):
+    """Hash the text of each section label (and of the text before the first section)."""
+    grouped = {"preamble": [text[:sections[0]["start"]] if sections else text]}
+    for section in sections:
+        grouped.setdefault(section["label"], []).append(section["text"])
+    return {label: content_hash("\n".join(texts)) for label, texts in grouped.items()}
+
+def _split_rag_answer(section, answer):
+    """Turn a RAG answer (a list or free text) into a list of non-empty strings."""
+    if not answer:
+        return []
+    if isinstance(answer, list):
+        return [str(item).strip() for item in answer if str(item).strip()]
+    if section == "skills":
+        # Skills come back as a list or comma-separated names
+        return [s.strip() for s in re.split(r'[,\n•-]', answer) if s.strip()]
+    return [line.strip() for line in str(answer).split('\n') if line.strip()]
 
-# Load spaCy model
-try:
-    nlp = spacy.load("en_core_web_lg")
-except:
-    os.system("python -m spacy download en_core_web_lg")
-    nlp = spacy.load("en_core_web_lg")
 
 class ResumeParser:
     """Enhanced tool for parsing resume files and extracting structured information."""
     
     def __init__(self):
         """Initialize the parser with OpenAI components for RAG if API key is provided."""
+        self.cache = DiskCache(PARSE_CACHE_DIR, max_bytes=PARSE_CACHE_MAX_MB * 1024 * 1024)
+        self.vector_store_cache = VectorStoreCache(VECTOR_STORE_CACHE_DIR)
+        self.doc_cache = DocCache(DOC_CACHE_DIR, max_bytes=DOC_CACHE_MAX_MB * 1024 * 1024)
+        self.versions = DiskCache(RESUME_VERSIONS_DIR, max_bytes=RESUME_VERSIONS_MAX_MB * 1024 * 1024)
+        self.embeddings = None
         self.use_rag = False
-        if OPENAI_API_KEY:
+        
+        # Retrieval only needs embeddings, which can be computed locally
+        try:
+            self.embeddings = get_embeddings()
+        except Exception as e:
+            print(f"Error initializing embeddings: {e}")
+        
+        # RAG extraction additionally needs the OpenAI LLM
+        if OPENAI_API_KEY and self.embeddings is not None:
             try:
-                self.embeddings = OpenAIEmbeddings(openai_api_key=OPENAI_API_KEY)
-                self.llm = OpenAI(api_key=OPENAI_API_KEY)
+                # A parse never waits longer than its budget for RAG, so neither does an abandoned call
+                self.llm = OpenAI(api_key=OPENAI_API_KEY, request_timeout=PARSE_TIME_BUDGET_SECONDS, max_retries=0)
                 self.use_rag = True
             except Exception as e:
                 print(f"Error initializing OpenAI components: {e}")
                 self.use_rag = False
     
-    def save_uploaded_file(self, uploaded_file):
-        """Save an uploaded file to a temporary location."""
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp:
-            tmp.write(uploaded_file.getbuffer())
-            return tmp.name
+    def warm_up(self):
+        """Start loading the spaCy model in the background so the first parse is fast."""
+        return nlp_model.warm_up()
+    
+    def get_docs(self, texts, batch_size=50):
+        """
+        Return the spaCy docs for texts, running NER only for texts not seen before.
+        
+        Args:
+            texts (iterable): Raw resume texts
+            batch_size (int): Number of texts looked up (and processed by spaCy) together
+            
+        Yields:
+            spacy.tokens.Doc: One doc per text, in input order
+        """
+        model_version = nlp_model.model_version
+        batch = []
+        for text in texts:
+            batch.append(text or "")
+            if len(batch) >= batch_size:
+                yield from self._get_doc_batch(batch, model_version)
+                batch = []
+        if batch:
+            yield from self._get_doc_batch(batch, model_version)
+    
+    def _get_doc_batch(self, texts, model_version):
+        """Load cached docs for a batch and run NER over the rest."""
+        keys = [DocCache.key(text, model_version) for text in texts]
+        with span("doc_cache_lookup"):
+            docs = [self.doc_cache.get(key) for key in keys]
+        
+        missing = [i for i, doc in enumerate(docs) if doc is None]
+        if missing:
+            with span("spacy_ner"):
+                processed = list(nlp_model.pipe([texts[i] for i in missing], batch_size=len(missing)))
+            with span("doc_cache_store"):
+                for i, doc in zip(missing, processed):
+                    docs[i] = doc
+                    self.doc_cache.set(keys[i], doc)
+        return docs
     
-    def parse_resume(self, text):
+    def get_section_docs(self, text, sections=None):
         """
-        Parse a resume text and extract structured information.
+        Process a resume section by section and merge the results into one doc.
+        
+        Each section is looked up in the doc cache on its own, so when an edited
+        version of a resume is uploaded only the sections that changed go
+        through NER.
         
         Args:
             text (str): The raw text content of the resume
+            sections (list, optional): The resume's sections from section_segmenter.segment
+            
+        Returns:
+            spacy.tokens.Doc: Doc covering the whole text
+        """
+        if sections is None:
+            sections = section_segmenter.segment(text)
+        
+        # Split where each header's line starts, so bullets stay with their header
+        bounds = [0]
+        for section in sections:
+            line_start = text.rfind("\n", 0, section["start"]) + 1
+            if line_start > bounds[-1]:
+                bounds.append(line_start)
+        bounds.append(len(text))
+        pieces = [text[start:end] for start, end in zip(bounds, bounds[1:])]
+        
+        docs = list(self.get_docs(pieces, batch_size=len(pieces)))
+        if len(docs) == 1:
+            return docs[0]
+        # Merging needs one vocab, and cached docs are loaded into the cache's own
+        return Doc.from_docs([self.doc_cache.to_cache_vocab(doc) for doc in docs], ensure_whitespace=False)
+    
+    def get_vector_store(self, text):
+        """
+        Return the FAISS vector store for a resume, reusing the copy saved on disk.
+        
+        Args:
+            text (str): The raw text content of the resume
+            
+        Returns:
+            FAISS: Vector store over the resume chunks
+        """
+        embedding_model = getattr(self.embeddings, "model", type(self.embeddings).__name__)
+        cache_key = content_hash(text, embedding_model, RAG_CHUNK_SIZE, RAG_CHUNK_OVERLAP)
+        
+        def build():
+            # Create embeddings from the resume text
+            text_splitter = RecursiveCharacterTextSplitter(
+                chunk_size=RAG_CHUNK_SIZE,
+                chunk_overlap=RAG_CHUNK_OVERLAP
+            )
+            return FAISS.from_texts(text_splitter.split_text(text), self.embeddings)
+        
+        with span("rag_vector_store"):
+            return self.vector_store_cache.get_or_build(cache_key, self.embeddings, build)
+    
+    def extract_rag_sections(self, text, cancelled=None):
+        """
+        Extract skills, education and experience from a resume with RAG.
+        
+        A single retrieval and LLM call returns all three sections as JSON. If the
+        response cannot be parsed, the three questions are asked separately, in
+        parallel, through a retrieval QA chain.
+        
+        Args:
+            text (str): The raw text content of the resume
+            cancelled (threading.Event, optional): Once set, no further LLM calls are made
+            
+        Returns:
+            dict: Lists of strings under "skills", "education" and "experience", or
+                None if cancelled
+        """
+        # Load the resume's vectorstore (embedding it only the first time)
+        vectorstore = self.get_vector_store(text)
+        if cancelled is not None and cancelled.is_set():
+            return None
+        
+        try:
+            return self._extract_rag_sections_structured(vectorstore)
+        except Exception as e:
+            if cancelled is not None and cancelled.is_set():
+                return None
+            print(f"Structured RAG extraction failed, asking each section separately: {e}")
+            return self._extract_rag_sections_concurrent(vectorstore)
+    
+    def _extract_rag_sections_structured(self, vectorstore):
+        """Retrieve once and ask for all sections as one JSON response."""
+        docs = vectorstore.similarity_search(RAG_STRUCTURED_QUERY, k=RAG_STRUCTURED_K)
+        context = "\n\n".join(doc.page_content for doc in docs)
+        with span("rag_llm"):
+            response = self.llm.invoke(RAG_STRUCTURED_PROMPT.format(context=context))
+        
+        # The model sometimes wraps the JSON in text, so fall back to the outermost object
+        try:
+            data = json.loads(response)
+        except json.JSONDecodeError:
+            json_match = re.search(r'\{.*\}', response, re.DOTALL)
+            if not json_match:
+                raise ValueError("No JSON object in RAG response")
+            data = json.loads(json_match.group(0))
+        
+        if not isinstance(data, dict) or not any(section in data for section in RAG_QUESTIONS):
+            raise ValueError("RAG response is missing the expected sections")
+        
+        return {section: _split_rag_answer(section, data.get(section)) for section in RAG_QUESTIONS}
+    
+    def _extract_rag_sections_concurrent(self, vectorstore):
+        """Ask the per-section questions concurrently through a retrieval QA chain."""
+        qa_chain = RetrievalQA.from_chain_type(
+            llm=self.llm,
+            chain_type="stuff",
+            retriever=vectorstore.as_retriever()
+        )
+        
+        with span("rag_llm_fallback"), ThreadPoolExecutor(max_workers=len(RAG_QUESTIONS)) as executor:
+            futures = {section: executor.submit(qa_chain.run, question) for section, question in RAG_QUESTIONS.items()}
+            return {section: _split_rag_answer(section, future.result()) for section, future in futures.items()}
+    
+    def extract_rag_within_budget(self, text, deadline=None, degraded_stages=None):
+        """
+        Run the RAG extraction, waiting no longer than the time left before the deadline.
+        
+        Each call gets its own thread, so one session's slow RAG never queues
+        another's. When the deadline passes the parse gives up: the thread makes no
+        further LLM calls, and the one in flight ends within the LLM request timeout.
+        
+        Args:
+            text (str): The raw text content of the resume
+            deadline (float, optional): time.monotonic() value after which RAG is skipped
+            degraded_stages (list, optional): Receives "rag" if the deadline cut RAG short
+            
+        Returns:
+            dict: The RAG sections, or None if RAG failed or ran out of time
+        """
+        if deadline is not None and time.monotonic() >= deadline:
+            if degraded_stages is not None:
+                degraded_stages.append("rag")
+            return None
+        
+        cancelled = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rag")
+        try:
+            # Ask for skills, education and experience in one retrieval and LLM round trip
+            rag_context = contextvars.copy_context()
+            rag_future = executor.submit(rag_context.run, self.extract_rag_sections, text, cancelled)
+            timeout = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            return rag_future.result(timeout=timeout)
+        except FutureTimeoutError:
+            print("RAG extraction did not finish within the parse time budget")
+            cancelled.set()
+            if degraded_stages is not None:
+                degraded_stages.append("rag")
+        except Exception as e:
+            print(f"RAG extraction error: {e}")
+        finally:
+            # Never wait here for an abandoned extraction; its thread exits on its own
+            executor.shutdown(wait=False)
+        return None
+    
+    def parse_resume(self, text, max_chars=PARSE_MAX_CHARS, time_budget=PARSE_TIME_BUDGET_SECONDS, user_id=None,
+                     degraded_stages=None):
+        """
+        Parse a resume text and extract structured information within a budget.
+        
+        Text beyond max_chars is dropped. Once time_budget seconds have passed,
+        the optional stages (entity context scans and RAG) are skipped. Every
+        stage that was cut short is listed under "degraded_stages" in the result.
+        
+        Results are cached by content. On a cache miss with a user_id, the text is
+        compared with the previous version parsed for that user and only the
+        sections that changed are processed again (see parse_resume_version).
+        
+        Args:
+            text (str): The raw text content of the resume
+            max_chars (int, optional): Maximum number of characters parsed (None for no limit)
+            time_budget (float, optional): Seconds after which optional stages are skipped (None for no limit)
+            user_id (str, optional): Stable identifier of whose resume this is (see
+                resume_owner_key), to parse edits incrementally
+            degraded_stages (list, optional): Stages already cut short before parsing
+                (e.g. "truncated_pages" from extract_document), listed first in the result
             
         Returns:
             dict: Structured information from the resume
         """
         if not text:
             return None
+        
+        deadline = time.monotonic() + time_budget if time_budget else None
+        truncated = bool(max_chars) and len(text) > max_chars
+        if truncated:
+            text = split_text(text, max_chars)[0]
+        
+        # Identical text parsed with the same parser, models and RAG setting gives the same result
+        embedding_model = getattr(self.embeddings, "model", type(self.embeddings).__name__)
+        cache_key = content_hash(text, PARSER_VERSION, nlp_model.model_name, self.use_rag, embedding_model)
+        with span("parse_cache_lookup"):
+            structured_data = self.cache.get(cache_key)
+        
+        if structured_data is not None:
+            if user_id is not None:
+                structured_data["changed_sections"] = []
+        else:
+            if user_id is not None:
+                structured_data = self.parse_resume_version(user_id, text, cache_key, deadline)
+            else:
+                # Extract structured information (reusing the spaCy doc if this text was seen before)
+                doc = next(self.get_docs([text]))
+                structured_data = self.extract_information(text, doc=doc, deadline=deadline)
+            # Results cut short by the deadline are not cached, so the next upload gets a full parse
+            if not structured_data["degraded_stages"]:
+                cached_data = {key: value for key, value in structured_data.items() if key != "changed_sections"}
+                with span("parse_cache_store"):
+                    self.cache.set(cache_key, cached_data)
+        
+        if truncated:
+            structured_data["degraded_stages"] = ["truncated_text"] + structured_data["degraded_stages"]
+        if degraded_stages:
+            structured_data["degraded_stages"] = list(degraded_stages) + structured_data["degraded_stages"]
+        return structured_data
+    
+    def parse_resume_version(self, user_id, text, version_key, deadline=None):
+        """
+        Parse a new version of a user's resume, redoing only what its edits affect.
+        
+        The sections are compared with the previous version stored for the user.
+        NER runs only over changed sections (unchanged ones come from the doc
+        cache), and the previous RAG answers are reused only when every edit is
+        confined to sections RAG never draws on (RAG_INDEPENDENT_LABELS); edits to
+        the text before the first recognised header, which may sit under headers
+        the segmenter does not know, always re-run RAG. The cheap rule-based
+        stages always run over the whole resume.
+        
+        Args:
+            user_id (str): Stable identifier of whose resume this is
+            text (str): The raw text content of the new version
+            version_key (str): Hash of the text and parser settings, to spot identical uploads
+            deadline (float, optional): time.monotonic() value after which optional stages are skipped
             
-        # Extract structured information
-        structured_data = self.extract_information(text)
+        Returns:
+            dict: Structured information from the resume, with the labels of the
+                "changed_sections"
+        """
+        store_key = content_hash(str(user_id), "resume_version")
+        with span("resume_version_lookup"):
+            previous = self.versions.get(store_key)
+        if previous and previous["version_key"] == version_key:
+            structured_data = previous["result"]
+            structured_data["changed_sections"] = []
+            return structured_data
+        
+        sections = section_segmenter.segment(text)
+        section_hashes = _section_hashes(text, sections)
+        previous_hashes = previous["section_hashes"] if previous else {}
+        changed_sections = sorted(
+            label for label in set(section_hashes) | set(previous_hashes)
+            if section_hashes.get(label) != previous_hashes.get(label)
+        )
         
+        doc = self.get_section_docs(text, sections)
+        
+        degraded_stages = []
+        rag_results = None
+        if self.use_rag:
+            rag_changed = (
+                not previous
+                or not sections
+                or any(label not in RAG_INDEPENDENT_LABELS for label in changed_sections)
+            )
+            if not rag_changed and previous.get("rag_results") is not None:
+                rag_results = previous["rag_results"]
+            else:
+                rag_results = self.extract_rag_within_budget(text, deadline, degraded_stages)
+        
+        structured_data = self.extract_information(text, doc=doc, use_rag=False, deadline=deadline,
+                                                   rag_results=rag_results)
+        structured_data["degraded_stages"] = degraded_stages + structured_data["degraded_stages"]
+        structured_data["changed_sections"] = changed_sections
+        
+        # Results cut short by the deadline do not become the baseline for the next version
+        if not structured_data["degraded_stages"]:
+            with span("resume_version_store"):
+                self.versions.set(store_key, {
+                    "version_key": version_key,
+                    "section_hashes": section_hashes,
+                    "rag_results": rag_results,
+                    "result": structured_data
+                })
         return structured_data
     
-    def extract_information(self, text):
-        """Extract structured information from resume text."""
-        doc = nlp(text)
+    def parse_resumes(self, texts, batch_size=50, use_rag=None):
+        """
+        Parse many resume texts, streaming them through spaCy in batches.
+        
+        Args:
+            texts (iterable): Raw resume texts
+            batch_size (int): Number of texts spaCy processes together
+            use_rag (bool, optional): Override the parser's RAG setting
+            
+        Yields:
+            dict: Structured information for each resume, in input order (None for empty texts)
+        """
+        # Empty texts still go through get_docs so outputs stay aligned with inputs
+        for doc in self.get_docs(texts, batch_size=batch_size):
+            yield self.extract_information(doc.text, doc=doc, use_rag=use_rag) if doc.text else None
+    
+    def reextract_resumes(self, texts, batch_size=50):
+        """
+        Re-run only the rule-based extraction stages over previously parsed resumes.
+        
+        Docs come from the doc cache, so after changing the keyword lists or
+        heuristics an archive can be reprocessed without running NER again (texts
+        that were never parsed are still processed by spaCy). RAG is skipped.
+        
+        Args:
+            texts (iterable): Raw resume texts
+            batch_size (int): Number of texts loaded from the cache together
+            
+        Yields:
+            dict: Structured information for each resume, in input order (None for empty texts)
+        """
+        return self.parse_resumes(texts, batch_size=batch_size, use_rag=False)
+    
+    def extract_information(self, text, doc=None, use_rag=None, deadline=None, rag_results=None):
+        """
+        Extract structured information from resume text.
+        
+        Args:
+            text (str): The raw text content of the resume
+            doc (spacy.tokens.Doc, optional): Already processed spaCy doc for the text
+            use_rag (bool, optional): Override the parser's RAG setting
+            deadline (float, optional): time.monotonic() value after which optional stages are skipped
+            rag_results (dict, optional): RAG sections computed earlier, merged instead of calling RAG
+            
+        Returns:
+            dict: Structured information from the resume, including the list of
+                "degraded_stages" skipped or cut short by the deadline
+        """
+        if use_rag is None:
+            use_rag = self.use_rag
+        if doc is None:
+            doc = next(self.get_docs([text]))
+        rules_start = time.perf_counter()
+        degraded_stages = []
+        
+        def out_of_time(stage):
+            """Whether the deadline has passed, recording the stage as degraded if so."""
+            if deadline is None or time.monotonic() < deadline:
+                return False
+            if stage not in degraded_stages:
+                degraded_stages.append(stage)
+            return True
         
         # Initialize categories
         skills = []
-        education = []
-        experience = []
+        # Indexed so duplicate and near-duplicate entries are rejected without rescanning the lists
+        education = EntryIndex()
+        experience = EntryIndex()
         contact_info = {"email": "", "phone": ""}
         
         # Extract email and phone using regex
@@ -78,47 +548,15 @@ class ResumeParser:
         if phones:
             contact_info["phone"] = phones[0]
         
-        # Extract skills using NER and keyword matching
-        skill_keywords = [
-            # Technical skills
-            "python", "java", "javascript", "react", "angular", "vue", "node.js",
-            "sql", "nosql", "mongodb", "mysql", "postgresql", "aws", "azure", "gcp",
-            "docker", "kubernetes", "terraform", "ci/cd", "jenkins", "git",
-            "machine learning", "deep learning", "nlp", "computer vision", "data science",
-            "data analysis", "data visualization", "tableau", "power bi", "excel",
-            "tensorflow", "pytorch", "keras", "scikit-learn", "pandas", "numpy", 
-            "hadoop", "spark", "airflow", "kubernetes", "docker", "rest api",
-            
-            # Cloud and DevOps
-            "aws", "azure", "gcp", "google cloud", "cloud computing", "serverless",
-            "lambda", "ec2", "s3", "dynamodb", "devops", "ci/cd", "jenkins", "github actions",
-            "terraform", "ansible", "puppet", "chef", "kubernetes", "docker", "microservices",
-            
-            # Web Development
-            "html", "css", "javascript", "typescript", "react", "angular", "vue", 
-            "node.js", "express", "django", "flask", "spring", "asp.net", "php",
-            "laravel", "ruby on rails", "rest api", "graphql", "responsive design",
-            
-            # Database
-            "sql", "mysql", "postgresql", "mongodb", "nosql", "oracle", "database design",
-            "data modeling", "etl", "data warehousing", "redis", "elasticsearch",
-            
-            # Soft skills
-            "project management", "agile", "scrum", "jira", "confluence",
-            "leadership", "team management", "communication", "problem-solving",
-            "critical thinking", "teamwork", "time management", "stakeholder management"
-        ]
         
         # Use RAG to extract skills more comprehensively if available
         extracted_skills = set()
         
-        # First, extract skills by keyword matching
-        for skill in skill_keywords:
-            if skill.lower() in text.lower():
-                extracted_skills.add(skill)
+        # First, extract skills (and their categories) with a single scan of the text
+        extracted_skills.update(skill_taxonomy.match(text))
         
         # Use spaCy to find additional skills (entities tagged as ORG or PRODUCT often correspond to technologies)
-        for ent in doc.ents:
+        for ent in ([] if out_of_time("entity_context") else doc.ents):
             if ent.label_ in ("ORG", "PRODUCT"):
                 # Check if it might be a skill/technology rather than just a company
                 tech_indicators = ["framework", "language", "library", "tool", "platform", "software", "system", "technology"]
@@ -134,12 +572,13 @@ class ResumeParser:
         education_keywords = ["university", "college", "institute", "school", "academy", "bachelor", 
                              "master", "phd", "degree", "diploma", "certificate", "certification"]
         
-        education_pattern = r'(?:(?:Bachelor|Master|PhD|B\.S\.|M\.S\.|M\.B\.A\.|B\.A\.|B\.Sc\.|M\.Sc\.|B\.Tech|M\.Tech)\s+(?:of|in)\s+[A-Za-z\s]+)|(?:[A-Za-z\s]+University|College|Institute)'
-        education_matches = re.findall(education_pattern, text)
-        for match in education_matches:
-            education.append(match.strip())
+        # Look for degrees and institutions in the education section (or the whole resume if it has none)
+        sections = section_segmenter.sections_by_label(text)
+        education_text = "\n".join(sections.get("education", [])) or text
+        for match in EDUCATION_PATTERN.findall(education_text):
+            education.add(match)
         
-        for ent in doc.ents:
+        for ent in ([] if out_of_time("entity_context") else doc.ents):
             if ent.label_ == "ORG":
                 # Check if it's likely an educational institution
                 if any(edu_term in ent.text.lower() for edu_term in education_keywords):
@@ -149,8 +588,8 @@ class ResumeParser:
                     context = text[context_start:context_end]
                     
                     # Add the education entity with surrounding context if not already in the list
-                    if not any(ent.text in edu for edu in education):
-                        education.append(context.strip())
+                    if not education.mentions(ent.text):
+                        education.add(context)
         
         # Extract experience - look for companies and job titles
         job_title_keywords = [
@@ -161,55 +600,22 @@ class ResumeParser:
         
         # Extract work experience blocks
         experience_blocks = []
-        exp_headers = ["experience", "work experience", "professional experience", "employment history"]
-        
-        # Find experience section in the resume
-        text_lower = text.lower()
-        for header in exp_headers:
-            if header in text_lower:
-                # Find the section start
-                section_start = text_lower.find(header)
-                if section_start != -1:
-                    # Look for the next section header or end of text
-                    next_section_keywords = ["education", "skills", "projects", "certifications", "references"]
-                    next_section_start = float('inf')
-                    
-                    for next_header in next_section_keywords:
-                        pos = text_lower.find(next_header, section_start + len(header))
-                        if pos != -1 and pos < next_section_start:
-                            next_section_start = pos
-                    
-                    if next_section_start == float('inf'):
-                        next_section_start = len(text)
-                    
-                    # Extract experience section
-                    exp_section = text[section_start:next_section_start].strip()
-                    
-                    # Split into potential job blocks (using heuristics like dates or company names)
-                    date_pattern = r'\b(Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August|Sep|September|Oct|October|Nov|November|Dec|December|\d{1,2}/\d{1,2}|\d{4})[-\s]+(to|-)[-\s]+(Jan|January|Feb|February|Mar|March|Apr|April|May|Jun|June|Jul|July|Aug|August|Sep|September|Oct|October|Nov|November|Dec|December|\d{1,2}/\d{1,2}|\d{4}|Present|present|Current|current)\b'
-                    
-                    date_matches = list(re.finditer(date_pattern, exp_section))
-                    if date_matches:
-                        for i, match in enumerate(date_matches):
-                            start_pos = match.start()
-                            
-                            # Find the end of this job entry (start of next one or end of section)
-                            if i < len(date_matches) - 1:
-                                end_pos = date_matches[i+1].start()
-                            else:
-                                end_pos = len(exp_section)
-                            
-                            # Extract the job block
-                            job_block = exp_section[start_pos:end_pos].strip()
-                            experience_blocks.append(job_block)
+        
+        # Split each experience section into job blocks, each starting at a date range
+        for exp_section in sections.get("experience", []):
+            date_matches = list(DATE_RANGE_PATTERN.finditer(exp_section))
+            for i, match in enumerate(date_matches):
+                # The block ends where the next job entry starts (or at the end of the section)
+                end_pos = date_matches[i + 1].start() if i < len(date_matches) - 1 else len(exp_section)
+                experience_blocks.append(exp_section[match.start():end_pos].strip())
         
         # If we found specific experience blocks, use them
         if experience_blocks:
             for block in experience_blocks:
-                experience.append(block)
+                experience.add(block)
         else:
             # Fallback to entity-based experience extraction
-            for ent in doc.ents:
+            for ent in ([] if out_of_time("entity_context") else doc.ents):
                 if ent.label_ == "ORG" and not any(edu_term in ent.text.lower() for edu_term in education_keywords):
                     # Check if it might be a company by looking for job titles nearby
                     context_start = max(0, ent.start_char - 150)
@@ -218,64 +624,38 @@ class ResumeParser:
                     
                     if any(title in context.lower() for title in job_title_keywords):
                         # Add the experience context if not already in the list
-                        if not any(ent.text in exp for exp in experience):
-                            experience.append(context.strip())
+                        if not experience.mentions(ent.text):
+                            experience.add(context)
+        
+        record_since("rule_extraction", rules_start)
         
         # If using RAG, enhance the extraction with contextual understanding
-        if self.use_rag:
-            try:
-                # Create embeddings from the resume text
-                text_splitter = RecursiveCharacterTextSplitter(
-                    chunk_size=1000,
-                    chunk_overlap=200
-                )
-                texts = text_splitter.split_text(text)
-                
-                # Create the vectorstore
-                vectorstore = FAISS.from_texts(texts, self.embeddings)
-                
-                # Create the retrieval chain
-                retriever = vectorstore.as_retriever()
-                qa_chain = RetrievalQA.from_chain_type(
-                    llm=self.llm,
-                    chain_type="stuff",
-                    retriever=retriever
-                )
-                
-                # Extract skills using RAG
-                rag_skills_response = qa_chain.run("What are all the technical skills, programming languages, and tools mentioned in this resume? List only the names of the skills without explanations.")
-                if rag_skills_response:
-                    # Process the response, assuming it's a list or comma-separated skills
-                    rag_skills = [s.strip() for s in re.split(r'[,\n•-]', rag_skills_response) if s.strip()]
-                    for skill in rag_skills:
-                        if skill and len(skill) < 50:  # Avoid adding long text chunks as skills
-                            extracted_skills.add(skill)
-                
-                # Extract education using RAG
-                rag_education_response = qa_chain.run("Extract all education details including institutions, degrees, majors, and graduation dates from this resume.")
-                if rag_education_response:
-                    # Process the education information
-                    rag_education = [e.strip() for e in rag_education_response.split('\n') if e.strip()]
-                    for edu in rag_education:
-                        if edu and not any(edu in existing_edu for existing_edu in education):
-                            education.append(edu)
-                
-                # Extract work experience using RAG
-                rag_experience_response = qa_chain.run("Extract all work experience details including company names, job titles, dates, and key responsibilities from this resume.")
-                if rag_experience_response:
-                    # Process the experience information
-                    rag_experience = [e.strip() for e in rag_experience_response.split('\n') if e.strip()]
-                    for exp in rag_experience:
-                        if exp and len(exp) > 20 and not any(exp in existing_exp for existing_exp in experience):
-                            experience.append(exp)
-                
-            except Exception as e:
-                print(f"RAG extraction error: {e}")
+        if rag_results is None and use_rag and self.use_rag:
+            rag_results = self.extract_rag_within_budget(text, deadline, degraded_stages)
+        
+        if rag_results:
+            # Add skills found by RAG
+            for skill in rag_results.get("skills", []):
+                if skill and len(skill) < 50:  # Avoid adding long text chunks as skills
+                    extracted_skills.add(skill)
+            skills = list(extracted_skills)
+            
+            # Add education details found by RAG
+            for edu in rag_results.get("education", []):
+                if edu and not education.mentions(edu):
+                    education.add(edu)
+            
+            # Add work experience found by RAG
+            for exp in rag_results.get("experience", []):
+                if exp and len(exp) > 20 and not experience.mentions(exp):
+                    experience.add(exp)
         
         return {
             "raw_text": text,
             "skills": list(set(skills)),
-            "education": list(set(education)),
-            "experience": list(set(experience)),
-            "contact_info": contact_info
+            "skill_categories": {skill: skill_taxonomy.categorize(skill) for skill in set(skills)},
+            "education": list(education),
+            "experience": list(experience),
+            "contact_info": contact_info,
+            "degraded_stages": degraded_stages
         }
\ No newline at end of file
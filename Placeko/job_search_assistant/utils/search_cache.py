@@ -0,0 +1,176 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from utils.disk_cache import DiskCache, content_hash
+from config import SEARCH_CACHE_DIR, SEARCH_CACHE_MAX_MB, SEARCH_CACHE_TTL_SECONDS, SEARCH_CACHE_STALE_SECONDS
+
+# Background refreshes of stale entries run here (created on first use)
+_refresh_executor = None
+_refresh_executor_lock = threading.Lock()
+
+
+class SearchCache(DiskCache):
+    """
+    Persistent cache of job search API responses with a time-to-live.
+
+    Entries younger than ttl are returned as they are. Entries within the
+    stale window after that are still returned, but a background refresh
+    replaces them so the next search sees new listings. Older entries are
+    fetched again before returning.
+    """
+
+    def __init__(self, cache_dir=SEARCH_CACHE_DIR, max_bytes=SEARCH_CACHE_MAX_MB * 1024 * 1024,
+                 ttl=SEARCH_CACHE_TTL_SECONDS, stale_ttl=SEARCH_CACHE_STALE_SECONDS):
+        """
+        Open (or create) the cache.
+
+        Args:
+            cache_dir (str): Directory holding the cache entries
+            max_bytes (int): Maximum total size of the entries on disk
+            ttl (float): Seconds a response is served without refreshing
+            stale_ttl (float): Further seconds a response is served while being refreshed
+        """
+        super().__init__(cache_dir, max_bytes)
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.fresh_hits = 0
+        self.window_hits = 0
+        self.stale_hits = 0
+        self.expired = 0
+        self.refreshes = 0
+        self._refreshing = set()
+
+    @staticmethod
+    def key(params):
+        """
+        Build the cache key for a search, ignoring case and extra whitespace.
+
+        Args:
+            params (dict): Search parameters, e.g. keywords, location, platform, days_ago
+
+        Returns:
+            str: Cache key
+        """
+        normalized = {}
+        for name, value in params.items():
+            if isinstance(value, str):
+                value = " ".join(value.lower().split())
+            normalized[name] = value
+        return content_hash(json.dumps(normalized, sort_keys=True))
+
+    def fetch(self, params, fetch):
+        """
+        Return the cached response for a search, calling fetch when there is none.
+
+        Args:
+            params (dict): Search parameters used as the cache key
+            fetch (callable): Function returning a fresh response; it should raise
+                on failure so errors are never cached
+
+        Returns:
+            The cached or freshly fetched response
+        """
+        key = self.key(params)
+        entry = self.get(key)
+        if entry is not None:
+            age = time.time() - entry["fetched_at"]
+            if age < self.ttl:
+                with self._lock:
+                    self.fresh_hits += 1
+                return entry["response"]
+            if age < self.ttl + self.stale_ttl:
+                with self._lock:
+                    self.stale_hits += 1
+                self._refresh_in_background(key, fetch)
+                return entry["response"]
+            with self._lock:
+                self.expired += 1
+
+        response = fetch()
+        self._store(key, response)
+        return response
+
+    def peek(self, params):
+        """
+        Return a cached response only if it is fresh, never fetching.
+
+        Used to check whether a narrower search can be answered from a wider one;
+        lookups are not counted (see record_window_hit).
+
+        Args:
+            params (dict): Search parameters used as the cache key
+
+        Returns:
+            The fresh cached response or None
+        """
+        key = self.key(params)
+        if not os.path.exists(self._path(key)):
+            return None
+        entry = self.get(key)
+        if entry is None or time.time() - entry["fetched_at"] >= self.ttl:
+            return None
+        return entry["response"]
+
+    def record_window_hit(self):
+        """Count a search answered from the cached results of a wider search."""
+        with self._lock:
+            self.fresh_hits += 1
+            self.window_hits += 1
+
+    def stats(self):
+        """
+        Return cache counters.
+
+        Returns:
+            dict: Fresh hits (of which window_hits came from a wider search), stale hits, misses (including expired entries), hit rate,
+                background refreshes, evictions, entry count and size on disk
+        """
+        stats = super().stats()
+        with self._lock:
+            misses = self.misses + self.expired
+            lookups = self.fresh_hits + self.stale_hits + misses
+            stats.update({
+                "hits": self.fresh_hits + self.stale_hits,
+                "fresh_hits": self.fresh_hits,
+                "window_hits": self.window_hits,
+                "stale_hits": self.stale_hits,
+                "misses": misses,
+                "hit_rate": (self.fresh_hits + self.stale_hits) / lookups if lookups else 0.0,
+                "refreshes": self.refreshes
+            })
+        return stats
+
+    def _store(self, key, response):
+        """Save a response with the time it was fetched."""
+        self.set(key, {"fetched_at": time.time(), "response": response})
+
+    def _refresh_in_background(self, key, fetch):
+        """Re-fetch a stale entry unless a refresh for it is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        _get_refresh_executor().submit(self._refresh, key, fetch)
+
+    def _refresh(self, key, fetch):
+        """Fetch and store a new response for a stale entry."""
+        try:
+            self._store(key, fetch())
+            with self._lock:
+                self.refreshes += 1
+        except Exception as e:
+            print(f"Error refreshing cached search: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+def _get_refresh_executor():
+    """Return the thread pool used for background refreshes."""
+    global _refresh_executor
+    with _refresh_executor_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search-refresh")
+        return _refresh_executor
@@ -0,0 +1,63 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from config import SEARCH_MAX_CONCURRENCY, SEARCH_DEADLINE_SECONDS
+
+
+def search_platforms(search, platforms, deadline_seconds=SEARCH_DEADLINE_SECONDS, on_result=None):
+    """
+    Run one search per platform concurrently and merge the results.
+
+    Each call gets its own threads (at most SEARCH_MAX_CONCURRENCY), so searches
+    left running past one call's deadline never delay another call's.
+
+    Args:
+        search (callable): Function taking a platform name and returning a list of jobs
+        platforms (list): Platforms to search
+        deadline_seconds (float): Overall time limit; platforms still running after it are skipped
+        on_result (callable, optional): Called with (platform, jobs) as each platform completes
+
+    Returns:
+        dict: "jobs" merged in platform order, "errors" (platform -> message) for searches
+            that raised, and the platforms that "timed_out"
+    """
+    platforms = list(platforms)
+    results = {}
+    errors = {}
+    if not platforms:
+        return {"jobs": [], "errors": errors, "timed_out": []}
+
+    deadline = time.monotonic() + deadline_seconds
+    executor = ThreadPoolExecutor(max_workers=min(len(platforms), SEARCH_MAX_CONCURRENCY),
+                                  thread_name_prefix="job-search")
+    futures = {executor.submit(search, platform): platform for platform in platforms}
+    pending = set(futures)
+
+    # Collect results as they complete until everything is done or the deadline passes
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            platform = futures[future]
+            try:
+                results[platform] = future.result() or []
+            except Exception as e:
+                print(f"Error searching jobs on {platform}: {e}")
+                errors[platform] = str(e)
+                continue
+            if on_result:
+                on_result(platform, results[platform])
+
+    timed_out = []
+    for future in pending:
+        # Searches that have not started yet are dropped; running ones finish in the background
+        future.cancel()
+        timed_out.append(futures[future])
+    # Don't wait for searches still running; their threads exit once the request returns
+    executor.shutdown(wait=False)
+    if timed_out:
+        print(f"Job search deadline reached before {', '.join(timed_out)} answered")
+
+    jobs = [job for platform in platforms for job in results.get(platform, [])]
+    return {"jobs": jobs, "errors": errors, "timed_out": [p for p in platforms if p in timed_out]}
@@ -0,0 +1,111 @@
+import re
+
+# Section label -> header phrases that open it
+SECTION_HEADERS = {
+    "summary": ["summary", "professional summary", "objective", "career objective", "profile"],
+    "experience": ["experience", "work experience", "professional experience", "employment history",
+                   "work history"],
+    "education": ["education", "academic background", "academic qualifications"],
+    "skills": ["skills", "technical skills", "core competencies"],
+    "projects": ["projects", "personal projects", "academic projects"],
+    "certifications": ["certifications", "certificates", "licenses and certifications"],
+    "references": ["references"]
+}
+
+
+class SectionSegmenter:
+    """
+    Split resume text into labeled sections in a single linear pass.
+
+    All header phrases are compiled into one regular expression. Headers that
+    start a line are treated as section boundaries; if a resume has none (e.g.
+    text extracted from a PDF without line breaks), any occurrence of a header
+    phrase is used instead. Each section runs from its header to the next one.
+    """
+
+    def __init__(self, section_headers=None):
+        """
+        Compile the header pattern.
+
+        Args:
+            section_headers (dict, optional): Section label -> list of header phrases
+        """
+        self.section_headers = section_headers or SECTION_HEADERS
+        self._labels = {}
+        for label, headers in self.section_headers.items():
+            for header in headers:
+                self._labels[header.lower()] = label
+
+        # Longest phrases first so "work experience" wins over "experience"
+        alternation = "|".join(re.escape(header) for header in sorted(self._labels, key=len, reverse=True))
+        self._pattern = re.compile(rf"\b({alternation})\b", re.IGNORECASE)
+        # A real header has only bullets before it and a colon or line break after it
+        self._header_prefix = re.compile(r"[ \t]*(?:[#*•\-–|>]+[ \t]*)?$")
+        self._header_suffix = re.compile(r"[ \t]*(?::|\r?\n|$)")
+
+    def segment(self, text):
+        """
+        Split the text into sections.
+
+        Args:
+            text (str): The raw text content of the resume
+
+        Returns:
+            list: Section dicts with "label", "header", "start", "end" and "text",
+                in document order
+        """
+        if not text:
+            return []
+
+        line_headers = []
+        inline_headers = []
+        line_start = 0
+        scanned = 0
+        for match in self._pattern.finditer(text):
+            # Only search for line breaks since the previous match to keep the pass linear
+            newline = text.rfind("\n", scanned, match.start())
+            if newline != -1:
+                line_start = newline + 1
+            scanned = match.start()
+
+            if (self._header_prefix.match(text, line_start, match.start())
+                    and self._header_suffix.match(text, match.end())):
+                line_headers.append(match)
+            else:
+                inline_headers.append(match)
+
+        headers = line_headers or inline_headers
+        sections = []
+        for i, match in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+            sections.append({
+                "label": self._labels[match.group(1).lower()],
+                "header": match.group(1),
+                "start": match.start(),
+                "end": end,
+                "text": text[match.end():end].strip(" \t\r\n:")
+            })
+        return sections
+
+    def sections_by_label(self, text):
+        """
+        Group section bodies by label.
+
+        Args:
+            text (str): The raw text content of the resume
+
+        Returns:
+            dict: Section label -> list of section texts
+        """
+        grouped = {}
+        for section in self.segment(text):
+            grouped.setdefault(section["label"], []).append(section["text"])
+        return grouped
+
+
+# Shared segmenter compiled once at import
+section_segmenter = SectionSegmenter()
+
+def segment_resume(text):
+    """Return the sections of a resume grouped by label."""
+    return section_segmenter.sections_by_label(text)
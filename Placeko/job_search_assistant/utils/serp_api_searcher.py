@@ -1,11 +1,33 @@
 
 import json
-import requests
-from config import SERPAPI_API_KEY
+import math
+import re
+import time
+from config import SERPAPI_API_KEY, SERPAPI_COALESCE_PLATFORMS, SERPAPI_MAX_PAGES, SERPAPI_PAGE_SIZE
+from config import SEARCH_RECENCY_WINDOWS, SEARCH_DEADLINE_SECONDS
+from utils.http_client import http_client
+from utils.search_cache import SearchCache
+from utils.search_orchestrator import search_platforms
+
+# Relative posting ages as Google Jobs reports them, e.g. "17 hours ago" or "30+ days ago"
+POSTED_AGE_PATTERN = re.compile(r"(\d+)\+?\s*(minute|hour|day|week|month|year)")
+POSTED_AGE_SECONDS = {
+    "minute": 60, "hour": 3600, "day": 86400,
+    "week": 7 * 86400, "month": 30 * 86400, "year": 365 * 86400
+}
 
 class SerpApiSearcher:
     """Search for real jobs using SerpAPI's Google Jobs search."""
     
+    def __init__(self, cache=None):
+        """
+        Initialize the searcher.
+        
+        Args:
+            cache (SearchCache, optional): Response cache; a persistent one is created by default
+        """
+        self.cache = cache if cache is not None else SearchCache()
+    
     def search_jobs(self, keywords, location, platform=None, count=5, days_ago=7):
         """
         Search for jobs using SerpAPI's Google Jobs API.
@@ -26,113 +48,331 @@ class SerpApiSearcher:
             
 
         try:
-            # Base URL for SerpAPI Google Jobs
-            url = "https://serpapi.com/search"
-            
-            # Prepare query parameters
-            query = f"{keywords} jobs in {location}"
-            if platform and platform.lower() != "all":
-                query += f" {platform}"
-                
-            params = {
-                "engine": "google_jobs",
-                "q": query,
-                "api_key": SERPAPI_API_KEY,
-                "hl": "en",
-                "chips": f"date_posted:{days_ago}d"  # Add date filter
-            }
-            
-            # Make API request
-            response = requests.get(url, params=params)
-            data = response.json()
-            
-            # Check for API errors
-            if "error" in data:
-                print(f"SerpAPI error: {data['error']}")
-                return []
+            data = next(self._pages(keywords, location, platform, days_ago))
                 
             # Process job results
             jobs = []
-            if "jobs_results" in data:
-                job_results = data["jobs_results"]
+            for i, job in enumerate(data["jobs_results"]):
+                if i >= count:
+                    break
                 
-                for i, job in enumerate(job_results):
-                    if i >= count:
-                        break
-                    
-                    # Extract job details
-                    title = job.get("title", "Unknown Title")
-                    company = job.get("company_name", "Unknown Company")
-                    location_name = job.get("location", "Unknown Location")
-                    
-                    # Get job description
-                    description = ""
-                    if "description" in job:
-                        description = job["description"]
-                    elif "snippet" in job:
-                        description = job["snippet"]
-                    else:
-                        description = "No description available"
-                    
-                    # Extract job type information
-                    job_type = "Not specified"
-                    if "detected_extensions" in job:
-                        extensions = job["detected_extensions"]
-                        if "schedule_type" in extensions:
-                            job_type = extensions["schedule_type"]
-                        elif "employment_type" in extensions:
-                            job_type = extensions["employment_type"]
-                    
-                    # Get apply link - SerpAPI provides direct application links
-                    apply_url = None
-                    
-                    # Try to get the apply link from various possible locations
-                    if "apply_link" in job and "link" in job["apply_link"]:
-                        apply_url = job["apply_link"]["link"]
-                    elif "apply_options" in job and job["apply_options"]:
-                        apply_url = job["apply_options"][0].get("link")
-                    elif "job_id" in job and "related_links" in data:
-                        # Try to find in related links
-                        for link in data.get("related_links", []):
-                            if "apply" in link.get("text", "").lower():
-                                apply_url = link.get("link")
-                                break
-                    
-                    # If still no apply URL, use job_id to create a Google Jobs link
-                    if not apply_url and "job_id" in job:
-                        apply_url = f"https://www.google.com/search?q={job['job_id']}"
-                    
-                    # Get job date
-                    date_posted = "Recent"
-                    if "detected_extensions" in job and "posted_at" in job["detected_extensions"]:
-                        date_posted = job["detected_extensions"]["posted_at"]
-                    
-                    # Determine platform from extensions or application options
-                    job_platform = job.get("via", "Unknown")
-                    
-                    # Filter by platform if specified
-                    if platform and platform.lower() != "all" and platform.lower() not in job_platform.lower():
-                        continue
-                    
-                    # Create job entry
-                    job_entry = {
-                        "title": title,
-                        "company": company,
-                        "location": location_name,
-                        "description": description,
-                        "url": apply_url,  # The direct application URL
-                        "apply_url": apply_url,  # Duplicate for consistency
-                        "date_posted": date_posted,
-                        "platform": job_platform,
-                        "job_type": job_type,  # Add job type information
-                        "is_real_job": True  # Flag to indicate this is a real job listing
-                    }
-                    
-                    # Add job to results
-                    jobs.append(job_entry)
+                # Filter by platform if specified
+                if platform and platform.lower() != "all" and platform.lower() not in job.get("via", "Unknown").lower():
+                    continue
+                
+                # Add job to results
+                jobs.append(self._build_job(job, data))
                 
             return jobs
             
         except Exception as e:
             print(f"SerpAPI search error: {e}")
-            return []
\ No newline at end of file
+            return []
+    
+    def search_all_platforms(self, keywords, location, platforms, count=5, days_ago=7, coalesce=SERPAPI_COALESCE_PLATFORMS):
+        """
+        Search several platforms at once, within SEARCH_DEADLINE_SECONDS.
+        
+        In coalesced mode one query without a platform name is paged until every
+        platform has count jobs, fetching at most the pages needed for count jobs
+        (capped by SERPAPI_MAX_PAGES and by the number of platforms, so it never
+        makes more calls than one query per platform would). Like the per-platform
+        mode, a platform may come back with fewer than count jobs.
+        
+        Args:
+            keywords (str): Job title or keywords to search for
+            location (str): Location for the job search
+            platforms (list): Platforms to return jobs for
+            count (int): Maximum number of jobs per platform
+            days_ago (int): Number of days ago to limit search results
+            coalesce (bool): Issue one paged query and split its results by platform
+                instead of one query per platform
+            
+        Returns:
+            dict: "jobs" in platform order, "errors" (source -> message) and the
+                platforms that "timed_out", as returned by search_platforms
+        """
+        if not coalesce:
+            return search_platforms(
+                lambda platform: self.search_jobs(keywords, location, platform=platform, count=count, days_ago=days_ago),
+                platforms
+            )
+        
+        if not SERPAPI_API_KEY:
+            print("SerpAPI key not configured. Returning empty results.")
+            return {"jobs": [], "errors": {}, "timed_out": []}
+        
+        deadline = time.monotonic() + SEARCH_DEADLINE_SECONDS
+        max_pages = min(SERPAPI_MAX_PAGES, len(platforms), math.ceil(count / SERPAPI_PAGE_SIZE))
+        by_platform = {platform: [] for platform in platforms}
+        errors = {}
+        try:
+            for data in self._pages(keywords, location, None, days_ago, max_pages=max_pages, deadline=deadline):
+                for job in data["jobs_results"]:
+                    via = job.get("via", "Unknown").lower()
+                    for platform in platforms:
+                        if platform.lower() in via and len(by_platform[platform]) < count:
+                            by_platform[platform].append(self._build_job(job, data))
+                            break
+                
+                # Stop paging once every platform is full
+                if all(len(jobs) >= count for jobs in by_platform.values()):
+                    break
+        except Exception as e:
+            print(f"SerpAPI search error: {e}")
+            errors["SerpAPI"] = str(e)
+        
+        # Platforms still short when the deadline stopped the paging may have had more jobs
+        timed_out = []
+        if time.monotonic() >= deadline:
+            timed_out = [platform for platform in platforms if len(by_platform[platform]) < count]
+        
+        return {"jobs": [job for jobs in by_platform.values() for job in jobs], "errors": errors, "timed_out": timed_out}
+    
+    def _pages(self, keywords, location, platform, days_ago, max_pages=SERPAPI_MAX_PAGES, deadline=None):
+        """
+        Yield pages of SerpAPI results for a search.
+        
+        When a fresh cached search over a wider recency window holds every result
+        of that search (its last page has no next page), those pages are filtered
+        down to the requested window instead of querying the API.
+        
+        Args:
+            keywords (str): Job title or keywords to search for
+            location (str): Location for the job search
+            platform (str): Platform added to the query, or None for all sources
+            days_ago (int): Number of days ago to limit search results
+            max_pages (int): Maximum number of pages fetched from the API
+            deadline (float, optional): time.monotonic() value after which no more pages are fetched
+            
+        Yields:
+            dict: jobs_results, related_links and next_page_token of each page
+        """
+        for window in sorted(w for w in SEARCH_RECENCY_WINDOWS if w > days_ago):
+            pages = self._complete_cached_pages(keywords, location, platform, window)
+            if pages is not None:
+                self.cache.record_window_hit()
+                cutoff = time.time() - days_ago * 86400
+                for data in pages:
+                    yield dict(data, jobs_results=[job for job in data["jobs_results"] if job["posted_timestamp"] >= cutoff])
+                return
+        
+        page_token = None
+        for page in range(max_pages):
+            timeout = None
+            if deadline is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    return
+            data = self._fetch_page(keywords, location, platform, days_ago, page=page, page_token=page_token, timeout=timeout)
+            yield data
+            page_token = data.get("next_page_token")
+            if not page_token:
+                return
+    
+    def _complete_cached_pages(self, keywords, location, platform, days_ago):
+        """
+        Return all pages of a search if they are cached, fresh and have posting times.
+        
+        A wider search only answers a narrower one when it is exhaustive: a partial
+        result (more pages available upstream) or results of unknown age could hide
+        jobs that a real query for the narrower window would return.
+        
+        Args:
+            keywords (str): Job title or keywords to search for
+            location (str): Location for the job search
+            platform (str): Platform added to the query, or None for all sources
+            days_ago (int): Recency window of the cached search
+            
+        Returns:
+            list: The cached pages in order, or None if the search cannot be reused
+        """
+        pages = []
+        for page in range(SERPAPI_MAX_PAGES):
+            data = self.cache.peek(self._search_key(keywords, location, platform, days_ago, page))
+            if data is None or any(job.get("posted_timestamp") is None for job in data["jobs_results"]):
+                return None
+            pages.append(data)
+            if not data.get("next_page_token"):
+                return pages
+        return None
+    
+    def _fetch_page(self, keywords, location, platform, days_ago, page=0, page_token=None, timeout=None):
+        """
+        Return one page of SerpAPI results, from the cache when possible.
+        
+        Args:
+            keywords (str): Job title or keywords to search for
+            location (str): Location for the job search
+            platform (str): Platform added to the query, or None for all sources
+            days_ago (int): Number of days ago to limit search results
+            page (int): Page number, part of the cache key
+            page_token (str, optional): Token of this page from the previous page's response
+            timeout (float, optional): Seconds to wait for the API (default HTTP timeouts if None)
+            
+        Returns:
+            dict: jobs_results, related_links and next_page_token of the page
+        """
+        # Base URL for SerpAPI Google Jobs
+        url = "https://serpapi.com/search"
+        
+        # Prepare query parameters
+        query = f"{keywords} jobs in {location}"
+        if platform and platform.lower() != "all":
+            query += f" {platform}"
+            
+        params = {
+            "engine": "google_jobs",
+            "q": query,
+            "api_key": SERPAPI_API_KEY,
+            "hl": "en",
+            "chips": f"date_posted:{days_ago}d"  # Add date filter
+        }
+        if page_token:
+            params["next_page_token"] = page_token
+        
+        # Make API request, reusing a cached response for the same search
+        search_key = self._search_key(keywords, location, platform, days_ago, page)
+        return self.cache.fetch(search_key, lambda: self._request(url, params, timeout))
+    
+    def _search_key(self, keywords, location, platform, days_ago, page=0):
+        """Return the cache parameters identifying one page of a search."""
+        search_key = {
+            "keywords": keywords,
+            "location": location,
+            "platform": platform if platform and platform.lower() != "all" else "",
+            "days_ago": days_ago
+        }
+        if page:
+            search_key["page"] = page
+        return search_key
+    
+    def _build_job(self, job, data):
+        """
+        Build a job entry from one SerpAPI result.
+        
+        Args:
+            job (dict): Entry of jobs_results
+            data (dict): The page it came from (for related links)
+            
+        Returns:
+            dict: Job entry with details and direct links
+        """
+        # Extract job details
+        title = job.get("title", "Unknown Title")
+        company = job.get("company_name", "Unknown Company")
+        location_name = job.get("location", "Unknown Location")
+        
+        # Get job description
+        description = ""
+        if "description" in job:
+            description = job["description"]
+        elif "snippet" in job:
+            description = job["snippet"]
+        else:
+            description = "No description available"
+        
+        # Extract job type information
+        job_type = "Not specified"
+        if "detected_extensions" in job:
+            extensions = job["detected_extensions"]
+            if "schedule_type" in extensions:
+                job_type = extensions["schedule_type"]
+            elif "employment_type" in extensions:
+                job_type = extensions["employment_type"]
+        
+        # Get apply link - SerpAPI provides direct application links
+        apply_url = None
+        
+        # Try to get the apply link from various possible locations
+        if "apply_link" in job and "link" in job["apply_link"]:
+            apply_url = job["apply_link"]["link"]
+        elif "apply_options" in job and job["apply_options"]:
+            apply_url = job["apply_options"][0].get("link")
+        elif "job_id" in job and "related_links" in data:
+            # Try to find in related links
+            for link in data.get("related_links", []):
+                if "apply" in link.get("text", "").lower():
+                    apply_url = link.get("link")
+                    break
+        
+        # If still no apply URL, use job_id to create a Google Jobs link
+        if not apply_url and "job_id" in job:
+            apply_url = f"https://www.google.com/search?q={job['job_id']}"
+        
+        # Get job date
+        date_posted = "Recent"
+        if "detected_extensions" in job and "posted_at" in job["detected_extensions"]:
+            date_posted = job["detected_extensions"]["posted_at"]
+        
+        # Determine platform from extensions or application options
+        job_platform = job.get("via", "Unknown")
+        
+        # Create job entry
+        return {
+            "title": title,
+            "company": company,
+            "location": location_name,
+            "description": description,
+            "url": apply_url,  # The direct application URL
+            "apply_url": apply_url,  # Duplicate for consistency
+            "date_posted": date_posted,
+            "platform": job_platform,
+            "job_type": job_type,  # Add job type information
+            "is_real_job": True  # Flag to indicate this is a real job listing
+        }
+    
+    def _request(self, url, params, timeout=None):
+        """
+        Call SerpAPI and keep the parts of the response used to build job entries.
+        
+        Args:
+            url (str): SerpAPI endpoint
+            params (dict): Query parameters
+            timeout (float, optional): Seconds to wait for the response
+            
+        Returns:
+            dict: The jobs_results, related_links and next_page_token of the response
+        """
+        fetched_at = time.time()
+        response = http_client.get(url, params=params, timeout=timeout)
+        data = response.json()
+        
+        # Check for API errors; an empty result set is reported as an error but is a valid answer
+        if "error" in data:
+            if "hasn't returned any results" in data["error"]:
+                return {"jobs_results": [], "related_links": [], "next_page_token": None}
+            raise ValueError(f"SerpAPI error: {data['error']}")
+        
+        # Record when each job was posted so narrower recency windows can be filtered locally
+        job_results = data.get("jobs_results", [])
+        for job in job_results:
+            job["posted_timestamp"] = _posted_timestamp(job.get("detected_extensions", {}).get("posted_at"), fetched_at)
+        
+        return {
+            "jobs_results": job_results,
+            "related_links": data.get("related_links", []),
+            "next_page_token": data.get("serpapi_pagination", {}).get("next_page_token")
+        }
+
+
+def _posted_timestamp(posted_at, fetched_at):
+    """
+    Convert a relative posting age to a Unix timestamp.
+    
+    Args:
+        posted_at (str): Age as reported by Google Jobs, e.g. "3 days ago"
+        fetched_at (float): When the age was reported
+        
+    Returns:
+        float: Estimated posting time, or None if the age is not recognized
+    """
+    if not posted_at:
+        return None
+    posted_at = posted_at.lower()
+    if "just" in posted_at or "today" in posted_at:
+        return fetched_at
+    match = POSTED_AGE_PATTERN.search(posted_at)
+    if not match:
+        return None
+    return fetched_at - int(match.group(1)) * POSTED_AGE_SECONDS[match.group(2)]
@@ -0,0 +1,121 @@
+import json
+from config import SKILL_TAXONOMY_PATH
+from utils.skill_matcher import SkillMatcher
+
+# Characters that separate the items of a skill list ("Python, Go | Rust", bullets, lines)
+LIST_DELIMITERS_BEFORE = set(",;|/•·*-([:\n\r")
+LIST_DELIMITERS_AFTER = set(",;|/•·*-)].:\n\r")
+
+
+class SkillTaxonomy:
+    """
+    Shared skill vocabulary with synonyms and categories.
+
+    Every skill name and synonym is compiled once into a single SkillMatcher,
+    so one scan of a text returns each skill found (under its canonical name)
+    together with its category.
+
+    Names that are also common English words ("go", "spring", "windows") are
+    ambiguous: in free text they only count when written as an item of a list
+    (e.g. "Languages: Python, Go") or in one of their accepted spellings
+    (e.g. "AI" but not "ai").
+    """
+
+    def __init__(self, taxonomy, ambiguous=None):
+        """
+        Compile the taxonomy.
+
+        Args:
+            taxonomy (dict): Category -> {canonical skill name: [synonyms]}
+            ambiguous (dict, optional): Lowercase ambiguous name or synonym -> spellings
+                accepted anywhere (others only match as list items)
+        """
+        self.ambiguous = {term.lower(): set(spellings) for term, spellings in (ambiguous or {}).items()}
+        # Canonical skill name -> category, in taxonomy order
+        self.categories = {}
+        surface_forms = {}
+        for category, skills in taxonomy.items():
+            for skill, synonyms in skills.items():
+                self.categories.setdefault(skill, category)
+                for term in [skill] + list(synonyms):
+                    surface_forms.setdefault(term.lower(), skill)
+        self.matcher = SkillMatcher(surface_forms)
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Load a taxonomy from a JSON file.
+
+        Args:
+            path (str): JSON file with "categories" (category -> {skill: [synonyms]})
+                and "ambiguous" (name -> [accepted spellings])
+
+        Returns:
+            SkillTaxonomy: The compiled taxonomy
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["categories"], data.get("ambiguous"))
+
+    def match(self, text):
+        """
+        Find the skills mentioned in a text with a single scan.
+
+        Ambiguous names are skipped unless they are a list item or an accepted spelling.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            dict: Canonical skill name -> category, in order of first appearance
+        """
+        found = {}
+        for start, end, term, skill in self.matcher.iter_spans(text):
+            if skill in found:
+                continue
+            if term in self.ambiguous and not (
+                text[start:end] in self.ambiguous[term] or _is_list_item(text, start, end)
+            ):
+                continue
+            found[skill] = self.categories[skill]
+        return found
+
+    def categorize(self, skill):
+        """
+        Return the category of a skill name, which may be a synonym or a longer
+        phrase mentioning a known skill (e.g. "AWS Lambda").
+
+        Args:
+            skill (str): Skill name
+
+        Returns:
+            str: The category, or None if no known skill is mentioned
+        """
+        category = self.categories.get(skill.strip().lower())
+        if category is None:
+            for matched in self.matcher.iter_matches(skill):
+                return self.categories[matched]
+        return category
+
+    def skills_in(self, *categories):
+        """Return the canonical skill names in the given categories."""
+        return [skill for skill, category in self.categories.items() if category in categories]
+
+
+def _is_list_item(text, start, end):
+    """Whether text[start:end] is a whole item of a list: only delimiters or line ends around it."""
+    # Step over spaces and tabs in place; slicing would copy the text for every match
+    before = start - 1
+    while before >= 0 and text[before] in " \t":
+        before -= 1
+    after = end
+    while after < len(text) and text[after] in " \t":
+        after += 1
+    return (
+        (before < 0 or text[before] in LIST_DELIMITERS_BEFORE)
+        and (after >= len(text) or text[after] in LIST_DELIMITERS_AFTER)
+    )
+
+
+# Taxonomy loaded and compiled once per process
+skill_taxonomy = SkillTaxonomy.from_file(SKILL_TAXONOMY_PATH)
@@ -0,0 +1,128 @@
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from config import TIMING_LOG_PATH
+
+# Trace collecting spans for the operation currently running in this context
+_current_trace = contextvars.ContextVar("current_trace", default=None)
+_log_lock = threading.Lock()
+
+
+class Trace:
+    """Durations of the stages of one operation, such as a resume upload."""
+
+    def __init__(self, name):
+        """
+        Start a trace.
+
+        Args:
+            name (str): Name of the operation being timed
+        """
+        self.name = name
+        self.started_at = datetime.now()
+        self.spans = []
+        self._start = time.perf_counter()
+        self._end = None
+
+    def record(self, stage, seconds, started=None):
+        """Add a finished stage to the trace."""
+        offset = (started - self._start) if started is not None else None
+        self.spans.append({
+            "stage": stage,
+            "seconds": round(seconds, 4),
+            "offset_seconds": round(offset, 4) if offset is not None else None
+        })
+
+    def finish(self):
+        """Stop the trace clock."""
+        if self._end is None:
+            self._end = time.perf_counter()
+
+    @property
+    def total_seconds(self):
+        """Wall time of the whole operation (so far, if still running)."""
+        end = self._end if self._end is not None else time.perf_counter()
+        return round(end - self._start, 4)
+
+    def to_dict(self):
+        """Return the trace as a JSON-serializable dictionary."""
+        return {
+            "trace": self.name,
+            "timestamp": self.started_at.strftime("%Y-%m-%d %H:%M:%S"),
+            "total_seconds": self.total_seconds,
+            "spans": list(self.spans)
+        }
+
+
+@contextmanager
+def trace(name, log_path=TIMING_LOG_PATH):
+    """
+    Time an operation, collecting the spans recorded inside it.
+
+    The finished trace is appended to log_path as one JSON line.
+
+    Args:
+        name (str): Name of the operation being timed
+        log_path (str, optional): JSONL file to append the trace to (None to skip logging)
+
+    Yields:
+        Trace: The trace being collected
+    """
+    current = Trace(name)
+    token = _current_trace.set(current)
+    try:
+        yield current
+    finally:
+        _current_trace.reset(token)
+        current.finish()
+        if log_path:
+            write_trace(current, log_path)
+
+@contextmanager
+def span(stage):
+    """
+    Time one stage of the current trace. Does nothing outside of a trace.
+
+    Args:
+        stage (str): Name of the stage, e.g. "spacy_ner"
+    """
+    current = _current_trace.get()
+    if current is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        current.record(stage, time.perf_counter() - start, started=start)
+
+def record_since(stage, start):
+    """
+    Record a stage that started at a time.perf_counter() value, for code that
+    does not fit in a with block. Does nothing outside of a trace.
+    """
+    current = _current_trace.get()
+    if current is not None:
+        current.record(stage, time.perf_counter() - start, started=start)
+
+def current_trace():
+    """Return the trace active in this context, if any."""
+    return _current_trace.get()
+
+def write_trace(finished_trace, log_path=TIMING_LOG_PATH):
+    """Append a trace to the timing log as a JSON line."""
+    try:
+        log_dir = os.path.dirname(log_path)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
+        line = json.dumps(finished_trace.to_dict())
+        with _log_lock:
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+    except OSError as e:
+        print(f"Error writing timing log: {e}")
@@ -0,0 +1,101 @@
+import os
+import shutil
+import threading
+from langchain.vectorstores import FAISS
+
+class VectorStoreCache:
+    """
+    Persist FAISS vector stores on disk so resume chunks are embedded only once.
+
+    Each store is saved with FAISS.save_local into a directory named after its
+    cache key (normally a hash of the resume text and the embedding settings).
+    When more than max_entries stores exist, the least recently used ones are
+    deleted.
+    """
+
+    def __init__(self, cache_dir, max_entries=200):
+        """
+        Open (or create) the cache directory.
+
+        Args:
+            cache_dir (str): Directory holding one sub-directory per vector store
+            max_entries (int): Maximum number of stores kept on disk
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def get_or_build(self, key, embeddings, build):
+        """
+        Load the vector store for a key, building and saving it on a miss.
+
+        Args:
+            key (str): Cache key for the store
+            embeddings: Embeddings object used to query the store
+            build (callable): Function returning a new FAISS store when not cached
+
+        Returns:
+            FAISS: The vector store
+        """
+        path = os.path.join(self.cache_dir, key)
+        if os.path.isdir(path):
+            try:
+                vectorstore = _load_local(path, embeddings)
+                os.utime(path)
+                with self._lock:
+                    self.hits += 1
+                return vectorstore
+            except Exception as e:
+                print(f"Error loading cached vector store {key}: {e}")
+                shutil.rmtree(path, ignore_errors=True)
+
+        with self._lock:
+            self.misses += 1
+        vectorstore = build()
+        self._save(path, vectorstore)
+        return vectorstore
+
+    def _save(self, path, vectorstore):
+        """Save a store atomically and evict old stores."""
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            vectorstore.save_local(tmp_path)
+            if os.path.isdir(path):
+                # Another worker saved the same store first; keep theirs
+                shutil.rmtree(tmp_path, ignore_errors=True)
+            else:
+                os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Error saving vector store: {e}")
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            return
+
+        self._evict()
+
+    def _evict(self):
+        """Delete the least recently used stores beyond max_entries."""
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                entry_path = os.path.join(self.cache_dir, name)
+                if os.path.isdir(entry_path) and not name.endswith(".tmp"):
+                    try:
+                        entries.append((os.path.getmtime(entry_path), entry_path))
+                    except OSError:
+                        continue
+            entries.sort()
+            for _, entry_path in entries[:max(0, len(entries) - self.max_entries)]:
+                shutil.rmtree(entry_path, ignore_errors=True)
+
+
+def _load_local(path, embeddings):
+    """Load a FAISS store saved by this cache."""
+    try:
+        # Newer langchain releases refuse to unpickle the docstore without this flag;
+        # the files were written by this process, so they are trusted
+        return FAISS.load_local(path, embeddings, allow_dangerous_deserialization=True)
+    except TypeError:
+        return FAISS.load_local(path, embeddings)